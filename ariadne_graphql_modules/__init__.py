@@ -1,38 +1,105 @@
 from ariadne import gql
 
 from .bases import BaseType, BindableType, DeferredType, DefinitionType
+from .blocking import BlockingExecutor, BlockingStats, blocking
+from .broadcast import Broadcaster, BroadcastStats
+from .broker import Broker, BrokerTransport, escape_channel_arg
 from .collection_type import CollectionType
 from .convert_case import convert_case
+from .cost_analysis import CostValidator, FieldCost, create_cost_validator
+from .delivery import (
+    BatchWindow,
+    DeliveryPolicy,
+    DeliveryStats,
+    DropNewest,
+    DropOldest,
+    LatestValue,
+    TimeWindow,
+)
 from .directive_type import DirectiveType
 from .enum_type import EnumType
-from .executable_schema import make_executable_schema
+from .executable_schema import (
+    get_schema_fingerprint,
+    make_executable_schema,
+    prepare_types,
+)
+from .execution_context import SerializeManyExecutionContext
+from .field_cache import CacheBackend, FieldCache, InMemoryCacheBackend
 from .input_type import InputType
+from .instrumentation import ResolverInstrumentation, ResolverStats
 from .interface_type import InterfaceType
 from .mutation_type import MutationType
 from .object_type import ObjectType
 from .scalar_type import ScalarType
+from .schema_cache import FileSystemSchemaCache, SchemaCache
+from .stats import PhaseStats, SchemaBuildStats
+from .subscription_metrics import (
+    SubscriptionMetrics,
+    SubscriptionMetricsSink,
+    SubscriptionStats,
+)
 from .subscription_type import SubscriptionType
 from .union_type import UnionType
-from .utils import create_alias_resolver, parse_definition
+from .utils import (
+    create_alias_resolver,
+    create_source_resolver,
+    parse_definition,
+    parse_definitions,
+)
 
 __all__ = [
     "BaseType",
+    "BatchWindow",
     "BindableType",
+    "BlockingExecutor",
+    "BlockingStats",
+    "BroadcastStats",
+    "Broadcaster",
+    "Broker",
+    "BrokerTransport",
+    "CacheBackend",
     "CollectionType",
+    "CostValidator",
     "DeferredType",
+    "DeliveryPolicy",
+    "DeliveryStats",
     "DefinitionType",
     "DirectiveType",
+    "DropNewest",
+    "DropOldest",
     "EnumType",
+    "FieldCache",
+    "FieldCost",
+    "FileSystemSchemaCache",
+    "InMemoryCacheBackend",
     "InputType",
     "InterfaceType",
+    "LatestValue",
     "MutationType",
     "ObjectType",
+    "PhaseStats",
+    "ResolverInstrumentation",
+    "ResolverStats",
     "ScalarType",
+    "SchemaBuildStats",
+    "SchemaCache",
+    "SerializeManyExecutionContext",
+    "SubscriptionMetrics",
+    "SubscriptionMetricsSink",
+    "SubscriptionStats",
     "SubscriptionType",
+    "TimeWindow",
     "UnionType",
+    "blocking",
     "convert_case",
+    "create_cost_validator",
     "create_alias_resolver",
+    "create_source_resolver",
+    "escape_channel_arg",
+    "get_schema_fingerprint",
     "gql",
     "make_executable_schema",
     "parse_definition",
+    "parse_definitions",
+    "prepare_types",
 ]
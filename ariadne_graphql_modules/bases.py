@@ -1,9 +1,11 @@
-from typing import List, Type, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 from graphql import DefinitionNode, GraphQLSchema, ObjectTypeDefinitionNode
 
+from .blocking import BlockingExecutor
 from .dependencies import Dependencies
 from .types import RequirementsDict
+from .utils import parse_definition
 
 __all__ = ["BaseType", "BindableType", "DeferredType", "DefinitionType"]
 
@@ -26,14 +28,46 @@ class DeferredType(BaseType):
 
 class DefinitionType(BaseType):
     __abstract__: bool = True
+    __lazy__: bool = False
+    __no_location__: bool = False
     __schema__: str
     __requires__: List[Union[Type["DefinitionType"], DeferredType]] = []
 
+    # Set to False by types that parse and validate __schema__ in __setup_type__
+    __prepared__: bool = True
+    # Definition parsed together with other types schemas by prepare_types
+    __pending_def__: Optional[DefinitionNode] = None
+
     graphql_name: str
     graphql_type: Type[DefinitionNode]
+    graphql_def: DefinitionNode
+
+    @classmethod
+    def __prepare_type__(
+        cls, type_def: Optional[DefinitionNode] = None, validate: bool = True
+    ):
+        if cls.__prepared__:
+            return
+
+        if type_def is None:
+            type_def = cls.__pending_def__ or parse_definition(
+                cls.__name__, cls.__schema__, cls.__no_location__
+            )
+
+        cls.__setup_type__(type_def, validate)
+        cls.__pending_def__ = None
+        cls.__prepared__ = True
+
+    @classmethod
+    def __setup_type__(cls, type_def: DefinitionNode, validate: bool = True):
+        pass
 
     @classmethod
     def __get_requirements__(cls) -> RequirementsDict:
+        for req in cls.__requires__:
+            if not isinstance(req, DeferredType):
+                req.__prepare_type__()
+
         return {req.graphql_name: req.graphql_type for req in cls.__requires__}
 
     @classmethod
@@ -49,18 +83,56 @@ class DefinitionType(BaseType):
 
     @classmethod
     def __get_types__(cls) -> List[Type["BaseType"]]:
-        types: List[Type["BaseType"]] = [cls]
-        for type_ in cls.__requires__:
-            child_types = type_.__get_types__()
-            for child_type in child_types:
-                if child_type not in types:
-                    types.append(child_type)
-        return types
+        return get_memoized_types(cls, [cls], "__requires__")
 
 
 class BindableType(DefinitionType):
     __abstract__: bool = True
 
+    # Used by types with resolvers to run them in threads pool
+    __blocking__: bool = False
+    __blocking_limit__: Optional[int] = None
+    __blocking_executor__: Optional[BlockingExecutor] = None
+
     @classmethod
     def __bind_to_schema__(cls, schema: GraphQLSchema):
         raise NotImplementedError()
+
+
+TypesSignatures = Dict[Any, Tuple[str, tuple]]
+
+
+def get_memoized_types(
+    cls: Type[BaseType], types: List[Type[BaseType]], dependencies_attr: str
+) -> List[Type[BaseType]]:
+    """Returns types list extended with types of dependencies, without repeats.
+
+    Result is memoized on the class together with dependencies of every class
+    it was collected from, and reused until any of those dependencies change.
+    """
+    cached = cls.__dict__.get("__types_cache__")
+    if cached and is_types_cache_valid(cached[0]):
+        return list(cached[1])
+
+    dependencies = tuple(getattr(cls, dependencies_attr))
+    # Dict is used as ordered set to keep order of types deterministic
+    all_types = dict.fromkeys(types)
+    signatures = {cls: (dependencies_attr, dependencies)}
+    for dependency in dependencies:
+        all_types.update(dict.fromkeys(dependency.__get_types__()))
+        # Dependency's memoized cache is valid after its types were got
+        dependency_cache = vars(dependency).get("__types_cache__")
+        if dependency_cache:
+            signatures.update(dependency_cache[0])
+
+    setattr(cls, "__types_cache__", (signatures, tuple(all_types)))
+    return list(all_types)
+
+
+def is_types_cache_valid(signatures: TypesSignatures) -> bool:
+    # Checks only own dependencies of memoized classes, without collecting
+    # their types again, so valid cache is returned in linear time
+    for type_, (dependencies_attr, dependencies) in signatures.items():
+        if tuple(getattr(type_, dependencies_attr)) != dependencies:
+            return False
+    return True
@@ -0,0 +1,197 @@
+from asyncio import AbstractEventLoop, Future, ensure_future, get_running_loop
+from inspect import isawaitable
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from graphql import GraphQLFieldResolver, GraphQLResolveInfo
+
+from .utils import freeze_args
+
+BatchResolver = Callable[..., Any]
+LoaderKey = Tuple[object, Hashable]
+
+# Name of key or attribute used to store request's loaders in context
+CONTEXT_KEY = "__batch_loaders__"
+
+
+class BatchLoader:
+    """Collects sources of single field in single request and resolves them
+    with one call to batch resolver"""
+
+    type_name: str
+    batch_resolver: BatchResolver
+    args: Dict[str, Any]
+
+    cache: Dict[int, Tuple[Any, Any]]
+    queue: List[Tuple[Any, Future]]
+
+    def __init__(self, type_name: str, batch_resolver: BatchResolver, args: dict):
+        self.type_name = type_name
+        self.batch_resolver = batch_resolver
+        self.args = args
+
+        # Sources are stored together with values to keep their ids unique
+        self.cache = {}
+        self.queue = []
+
+    def load(self, source: Any, info: GraphQLResolveInfo) -> Any:
+        cached = self.cache.get(id(source))
+        if cached:
+            return cached[1]
+
+        try:
+            loop = get_running_loop()
+        except RuntimeError:
+            # Sync execution can't wait for other sources to be collected
+            value = self.resolve_batch([source], info)[0]
+        else:
+            value = self.load_async(loop, source, info)
+
+        self.cache[id(source)] = (source, value)
+        return value
+
+    def load_async(
+        self, loop: AbstractEventLoop, source: Any, info: GraphQLResolveInfo
+    ) -> Future:
+        future = loop.create_future()
+        self.queue.append((source, future))
+        if len(self.queue) == 1:
+            # Other sources of this field are collected until next loop iteration
+            loop.call_soon(self.dispatch, info)
+        return future
+
+    def dispatch(self, info: GraphQLResolveInfo):
+        queue, self.queue = self.queue, []
+        futures = [future for _, future in queue]
+
+        try:
+            result = self.batch_resolver(
+                [source for source, _ in queue], info, **self.args
+            )
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            set_futures_exception(futures, error)
+            return
+
+        if isawaitable(result):
+            task = ensure_future(result)
+            task.add_done_callback(lambda task: self.set_futures_result(futures, task))
+        else:
+            self.set_futures_values(futures, result)
+
+    def set_futures_result(self, futures: List[Future], task: Future):
+        if task.cancelled():
+            for future in futures:
+                if not future.done():
+                    future.cancel()
+            return
+
+        error = task.exception()
+        if error:
+            set_futures_exception(futures, error)
+        else:
+            self.set_futures_values(futures, task.result())
+
+    def set_futures_values(self, futures: List[Future], values: Any):
+        try:
+            values = self.validate_values(values, len(futures))
+        except ValueError as error:
+            set_futures_exception(futures, error)
+            return
+
+        for future, value in zip(futures, values):
+            if not future.done():
+                future.set_result(value)
+
+    def resolve_batch(self, sources: List[Any], info: GraphQLResolveInfo) -> List[Any]:
+        values = self.batch_resolver(sources, info, **self.args)
+        return self.validate_values(values, len(sources))
+
+    def validate_values(self, values: Any, sources_count: int) -> List[Any]:
+        values = list(values)
+        if len(values) != sources_count:
+            raise ValueError(
+                f"{self.type_name} batch resolver returned {len(values)} values "
+                f"for {sources_count} sources"
+            )
+        return values
+
+
+class BatchLoaders:
+    """Registry of batch loaders used in single request"""
+
+    loaders: Dict[LoaderKey, BatchLoader]
+
+    def __init__(self):
+        self.loaders = {}
+
+    def get_loader(
+        self,
+        resolver_id: object,
+        type_name: str,
+        batch_resolver: BatchResolver,
+        args: Dict[str, Any],
+    ) -> BatchLoader:
+        key = (resolver_id, freeze_args(args))
+        loader = self.loaders.get(key)
+        if not loader:
+            loader = BatchLoader(type_name, batch_resolver, args)
+            self.loaders[key] = loader
+        return loader
+
+
+def get_batch_loaders(context: Any) -> Optional[BatchLoaders]:
+    if isinstance(context, dict):
+        loaders = context.get(CONTEXT_KEY)
+        if loaders is None:
+            loaders = context[CONTEXT_KEY] = BatchLoaders()
+        return loaders
+
+    loaders = getattr(context, CONTEXT_KEY, None)
+    if loaders is None:
+        loaders = BatchLoaders()
+        try:
+            setattr(context, CONTEXT_KEY, loaders)
+        except (AttributeError, TypeError):
+            return None  # Context can't store loaders
+
+    return loaders
+
+
+def create_batch_resolver(
+    type_name: str, batch_resolver: BatchResolver
+) -> GraphQLFieldResolver:
+    resolver_id = object()
+
+    def batch_field_resolver(source: Any, info: GraphQLResolveInfo, **args: Any) -> Any:
+        loaders = get_batch_loaders(info.context)
+        if loaders is None:
+            if is_running_loop():
+                # Without loaders stored in context sources can't be collected,
+                # so every source would be silently resolved with separate call
+                raise TypeError(
+                    f"{type_name} batch resolver requires context that is a dict "
+                    "or object supporting attributes, not "
+                    f"{type(info.context).__name__}"
+                )
+
+            # Sync execution resolves every source separately anyway
+            loader = BatchLoader(type_name, batch_resolver, args)
+        else:
+            loader = loaders.get_loader(resolver_id, type_name, batch_resolver, args)
+
+        return loader.load(source, info)
+
+    return batch_field_resolver
+
+
+def is_running_loop() -> bool:
+    try:
+        get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def set_futures_exception(futures: List[Future], error: BaseException):
+    for future in futures:
+        if not future.done():
+            future.set_exception(error)
@@ -0,0 +1,176 @@
+from asyncio import AbstractEventLoop, Semaphore, get_running_loop
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from functools import partial
+from inspect import iscoroutinefunction
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+from weakref import WeakKeyDictionary
+
+from graphql import GraphQLFieldResolver
+
+
+def blocking(resolver: Any) -> Any:
+    """Marks resolver as blocking, to be ran in threads pool in async execution"""
+    if isinstance(resolver, (staticmethod, classmethod)):
+        func = resolver.__func__
+    else:
+        func = resolver
+
+    if iscoroutinefunction(func):
+        # Qualified name of method starts with name of class defining it
+        name = func.__qualname__.split("<locals>.")[-1]
+        raise TypeError(
+            f"{name} is async resolver and can't be decorated with blocking"
+        )
+
+    setattr(func, "__blocking__", True)
+    return resolver
+
+
+def is_blocking(resolver: Any) -> bool:
+    return getattr(resolver, "__blocking__", False) is True
+
+
+def is_type_resolver_blocking(type_: Any, resolver: Any) -> bool:
+    # Async resolvers of blocking type already don't block event loop
+    if iscoroutinefunction(resolver):
+        return False
+    return type_.__blocking__ or is_blocking(resolver)
+
+
+class BlockingStats:
+    type_name: str
+    count: int
+    queue_time: float
+    max_queue_time: float
+    run_time: float
+
+    def __init__(self, type_name: str):
+        self.type_name = type_name
+        self.count = 0
+        self.queue_time = 0.0
+        self.max_queue_time = 0.0
+        self.run_time = 0.0
+
+    @property
+    def average_queue_time(self) -> float:
+        return self.queue_time / self.count if self.count else 0.0
+
+    def record(self, queue_time: float, run_time: float):
+        self.count += 1
+        self.queue_time += queue_time
+        self.max_queue_time = max(self.max_queue_time, queue_time)
+        self.run_time += run_time
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "type": self.type_name,
+            "count": self.count,
+            "queue_time": self.queue_time,
+            "max_queue_time": self.max_queue_time,
+            "run_time": self.run_time,
+        }
+
+
+class BlockingExecutor:
+    """Runs blocking resolvers in bounded threads pool"""
+
+    max_workers: Optional[int]
+    pool: Optional[ThreadPoolExecutor]
+    semaphores: "WeakKeyDictionary[AbstractEventLoop, Dict[type, Semaphore]]"
+    stats: Dict[type, BlockingStats]
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers
+        self.pool = None
+        self.semaphores = WeakKeyDictionary()
+        self.stats = {}
+
+    def get_pool(self) -> ThreadPoolExecutor:
+        if self.pool is None:
+            self.pool = ThreadPoolExecutor(
+                self.max_workers, thread_name_prefix="graphql-blocking"
+            )
+        return self.pool
+
+    def get_stats(self, type_: Type) -> BlockingStats:
+        stats = self.stats.get(type_)
+        if stats is None:
+            stats = self.stats[type_] = BlockingStats(type_.__name__)
+        return stats
+
+    def get_semaphore(self, type_: Type, limit: int) -> Semaphore:
+        # Semaphores are bound to event loop they were first used in on
+        # Python < 3.10, so every loop gets its own semaphores
+        loop = get_running_loop()
+        semaphores = self.semaphores.get(loop)
+        if semaphores is None:
+            semaphores = self.semaphores[loop] = {}
+
+        semaphore = semaphores.get(type_)
+        if semaphore is None:
+            semaphore = semaphores[type_] = Semaphore(limit)
+        return semaphore
+
+    async def run(
+        self,
+        type_: Type,
+        limit: Optional[int],
+        resolver: Callable,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        submitted = perf_counter()
+        if not limit:
+            return await self.run_in_pool(type_, submitted, resolver, args, kwargs)
+
+        async with self.get_semaphore(type_, limit):
+            return await self.run_in_pool(type_, submitted, resolver, args, kwargs)
+
+    async def run_in_pool(
+        self,
+        type_: Type,
+        submitted: float,
+        resolver: Callable,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        stats = self.get_stats(type_)
+
+        def run_resolver():
+            started = perf_counter()
+            try:
+                return resolver(*args, **kwargs)
+            finally:
+                stats.record(started - submitted, perf_counter() - started)
+
+        # Context variables are copied to thread, like asyncio.to_thread does
+        context = copy_context()
+        return await get_running_loop().run_in_executor(
+            self.get_pool(), partial(context.run, run_resolver)
+        )
+
+    def shutdown(self, wait: bool = True):
+        if self.pool is not None:
+            self.pool.shutdown(wait)
+            self.pool = None
+
+
+default_executor = BlockingExecutor()
+
+
+def create_blocking_resolver(
+    type_: Any, resolver: GraphQLFieldResolver
+) -> GraphQLFieldResolver:
+    def blocking_resolver(*args: Any, **kwargs: Any) -> Any:
+        try:
+            get_running_loop()
+        except RuntimeError:
+            # Sync execution is already ran outside of event loop
+            return resolver(*args, **kwargs)
+
+        executor = type_.__blocking_executor__ or default_executor
+        return executor.run(type_, type_.__blocking_limit__, resolver, args, kwargs)
+
+    return blocking_resolver
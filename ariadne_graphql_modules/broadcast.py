@@ -0,0 +1,215 @@
+from asyncio import Task, ensure_future
+from typing import Any, AsyncIterator, Callable, Dict, Hashable, List, Optional, Tuple
+
+from graphql import GraphQLResolveInfo
+
+from .delivery import (
+    COALESCED,
+    DROPPED,
+    END,
+    DeliveryBuffer,
+    DeliveryPolicy,
+    DeliveryStats,
+    DropOldest,
+    observe_buffer,
+    run_source,
+)
+from .utils import freeze_args
+
+
+class BroadcastStats:
+    type_name: str
+    field_name: str
+    topics: int
+    subscribers: int
+    events: int
+    dropped: int
+    coalesced: int
+
+    def __init__(self, type_name: str, field_name: str):
+        self.type_name = type_name
+        self.field_name = field_name
+        self.topics = 0
+        self.subscribers = 0
+        self.events = 0
+        self.dropped = 0
+        self.coalesced = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "type": self.type_name,
+            "field": self.field_name,
+            "topics": self.topics,
+            "subscribers": self.subscribers,
+            "events": self.events,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+        }
+
+
+class Topic:
+    """Source shared by subscribers of field with same arguments"""
+
+    key: Hashable
+    topics: Dict[Hashable, "Topic"]
+    stats: BroadcastStats
+    buffers: List[DeliveryBuffer]
+    task: Optional[Task]
+    closed: bool
+
+    def __init__(
+        self, key: Hashable, topics: Dict[Hashable, "Topic"], stats: BroadcastStats
+    ):
+        self.key = key
+        self.topics = topics
+        self.stats = stats
+        self.buffers = []
+        self.task = None
+        self.closed = False
+
+        topics[key] = self
+        stats.topics += 1
+
+    def join(self, buffer: DeliveryBuffer):
+        self.buffers.append(buffer)
+        self.stats.subscribers += 1
+
+    def leave(self, buffer: DeliveryBuffer):
+        self.buffers.remove(buffer)
+        self.stats.subscribers -= 1
+
+        if not self.buffers:
+            self.close()
+            if self.task is not None:
+                self.task.cancel()
+
+    def start(self, source_factory: Callable[[], Any]):
+        self.task = ensure_future(run_source(source_factory, self.put, self.end))
+
+    def put(self, event: Any):
+        self.stats.events += 1
+        for buffer in self.buffers:
+            # Slow subscriber loses event instead of blocking others
+            lost = buffer.put(event)
+            if lost == DROPPED:
+                self.stats.dropped += 1
+            elif lost == COALESCED:
+                self.stats.coalesced += 1
+
+    def end(self, error: Optional[Exception] = None):
+        self.close()
+        for buffer in self.buffers:
+            buffer.end(error)
+
+    def close(self):
+        if self.closed:
+            return
+
+        self.closed = True
+        self.stats.topics -= 1
+        if self.topics.get(self.key) is self:
+            del self.topics[self.key]
+
+
+class Broadcaster:
+    """Shares sources of subscriptions between subscribers with same arguments"""
+
+    topics: Dict[Hashable, Topic]
+    stats: Dict[Tuple[str, str], BroadcastStats]
+
+    def __init__(self):
+        self.topics = {}
+        self.stats = {}
+
+    @property
+    def active_topics(self) -> int:
+        return len(self.topics)
+
+    @property
+    def subscribers(self) -> int:
+        return sum(len(topic.buffers) for topic in self.topics.values())
+
+    def get_stats(self, type_name: str, field_name: str) -> BroadcastStats:
+        stats = self.stats.get((type_name, field_name))
+        if stats is None:
+            stats = self.stats[(type_name, field_name)] = BroadcastStats(
+                type_name, field_name
+            )
+        return stats
+
+    def get_topic_key(
+        self,
+        type_: type,
+        field_name: str,
+        args: Dict[str, Any],
+        scope: Hashable = None,
+    ) -> Hashable:
+        # Topics are keyed by class, because unrelated types with same name
+        # (eg. in different schemas) can't share their sources
+        try:
+            return (type_, field_name, freeze_args(args, strict=True), scope)
+        except TypeError:
+            # Subscriber gets own topic if arguments can't be used in key
+            return object()
+
+    async def subscribe(
+        self,
+        type_: type,
+        field_name: str,
+        args: Dict[str, Any],
+        create_buffer: Callable[[], DeliveryBuffer],
+        source_factory: Callable[[], Any],
+        *,
+        scope: Hashable = None,
+    ) -> AsyncIterator[Any]:
+        buffer = create_buffer()
+        key = self.get_topic_key(type_, field_name, args, scope)
+        topic = self.topics.get(key)
+        if topic is None:
+            stats = self.get_stats(type_.__name__, field_name)
+            topic = Topic(key, self.topics, stats)
+            topic.join(buffer)
+            topic.start(source_factory)
+        else:
+            topic.join(buffer)
+
+        try:
+            while True:
+                event = await buffer.get()
+                if event is END:
+                    return
+                yield event
+        finally:
+            topic.leave(buffer)
+
+
+default_broadcaster = Broadcaster()
+
+
+def create_broadcast_subscriber(
+    type_: Any,
+    field_name: str,
+    subscriber: Callable,
+    policy: Optional[DeliveryPolicy] = None,
+    stats: Optional[DeliveryStats] = None,
+) -> Callable:
+    def create_buffer() -> DeliveryBuffer:
+        if policy:
+            return policy.create_buffer(stats)
+        return DropOldest(type_.__broadcast_queue_size__).create_buffer()
+
+    def broadcast_subscriber(obj: Any, info: GraphQLResolveInfo, **kwargs: Any):
+        broadcaster = type_.__broadcaster__ or default_broadcaster
+        # Source is started with obj and info of topic's first subscriber, so
+        # parts of context it depends on (eg. tenant) have to be in topic key
+        get_scope = type_.__broadcast_key__
+        return broadcaster.subscribe(
+            type_,
+            field_name,
+            kwargs,
+            observe_buffer(create_buffer),
+            lambda: subscriber(obj, info, **kwargs),
+            scope=get_scope(obj, info, **kwargs) if get_scope else None,
+        )
+
+    return broadcast_subscriber
@@ -0,0 +1,213 @@
+import re
+from asyncio import Lock
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Match,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from graphql import GraphQLResolveInfo
+
+from .delivery import (
+    END,
+    DeliveryBuffer,
+    DeliveryPolicy,
+    DeliveryStats,
+    DropOldest,
+    observe_buffer,
+)
+
+ChannelName = Union[str, Callable[..., str]]
+
+
+class BrokerTransport:
+    """Delivers messages between brokers, eg. in different processes
+
+    Transport calls function passed to `connect` with channel name and message
+    for every message received from channels it was subscribed to.
+    """
+
+    def connect(self, receive: Callable[[str, Any], None]):
+        raise NotImplementedError(
+            "BrokerTransport subclasses must implement connect method"
+        )
+
+    async def publish(self, channel: str, message: Any):
+        raise NotImplementedError(
+            "BrokerTransport subclasses must implement publish method"
+        )
+
+    async def subscribe(self, channel: str):
+        raise NotImplementedError(
+            "BrokerTransport subclasses must implement subscribe method"
+        )
+
+    async def unsubscribe(self, channel: str):
+        raise NotImplementedError(
+            "BrokerTransport subclasses must implement unsubscribe method"
+        )
+
+
+class Broker:
+    """Publishes messages to subscribers of channels
+
+    Messages are fanned out to subscribers of channel in memory. If transport
+    is set, messages are published through it and broker is subscribed to
+    channels its subscribers listen to.
+    """
+
+    transport: Optional[BrokerTransport]
+    queue_size: int
+    channels: Dict[str, List[DeliveryBuffer]]
+    transport_channels: Set[str]
+    # Locks of channels with number of coroutines using them
+    locks: Dict[str, Tuple[Lock, int]]
+
+    def __init__(
+        self, transport: Optional[BrokerTransport] = None, queue_size: int = 100
+    ):
+        self.transport = transport
+        self.queue_size = queue_size
+        self.channels = {}
+        self.transport_channels = set()
+        self.locks = {}
+
+        if transport:
+            transport.connect(self.receive)
+
+    @property
+    def subscribers(self) -> int:
+        return sum(len(buffers) for buffers in self.channels.values())
+
+    def get_subscribers_count(self, channel: str) -> int:
+        return len(self.channels.get(channel) or ())
+
+    async def publish(self, channel: str, message: Any):
+        if self.transport:
+            await self.transport.publish(channel, message)
+        else:
+            self.receive(channel, message)
+
+    def receive(self, channel: str, message: Any):
+        buffers = self.channels.get(channel)
+        if buffers:
+            for buffer in buffers:
+                buffer.put(message)
+
+    async def subscribe(
+        self,
+        channel: str,
+        create_buffer: Optional[Callable[[], DeliveryBuffer]] = None,
+    ) -> AsyncIterator[Any]:
+        if create_buffer:
+            buffer = create_buffer()
+        else:
+            buffer = DropOldest(self.queue_size).create_buffer()
+
+        buffers = self.channels.get(channel)
+        if buffers is None:
+            buffers = self.channels[channel] = [buffer]
+        else:
+            buffers.append(buffer)
+
+        try:
+            if self.transport and channel not in self.transport_channels:
+                await self.update_transport(self.transport, channel)
+
+            while True:
+                message = await buffer.get()
+                if message is END:
+                    return
+                yield message
+        finally:
+            buffers.remove(buffer)
+            if not buffers and self.channels.get(channel) is buffers:
+                del self.channels[channel]
+                if self.transport:
+                    await self.update_transport(self.transport, channel)
+
+    async def update_transport(self, transport: BrokerTransport, channel: str):
+        # Subscribers can join or leave channel while transport is awaited, so
+        # its calls are serialized and made only if they are still needed
+        lock, users = self.locks.get(channel) or (Lock(), 0)
+        self.locks[channel] = (lock, users + 1)
+
+        try:
+            async with lock:
+                if channel in self.channels:
+                    if channel not in self.transport_channels:
+                        await transport.subscribe(channel)
+                        self.transport_channels.add(channel)
+                elif channel in self.transport_channels:
+                    self.transport_channels.discard(channel)
+                    await transport.unsubscribe(channel)
+        finally:
+            lock, users = self.locks[channel]
+            if users > 1:
+                self.locks[channel] = (lock, users - 1)
+            else:
+                del self.locks[channel]
+
+    def close(self):
+        for buffers in self.channels.values():
+            for buffer in buffers:
+                buffer.end()
+
+
+default_broker = Broker()
+
+
+class ChannelArgs(dict):
+    def __missing__(self, key: str) -> str:
+        return ""  # Optional argument that wasn't passed
+
+
+CHANNEL_ARG_UNSAFE = re.compile(r"[^A-Za-z0-9_-]+")
+
+
+def escape_channel_arg(value: Any) -> str:
+    """Percent-encodes characters of value that could be used as separators
+    in channel name, so client can't pass argument reaching other channels.
+    """
+    return CHANNEL_ARG_UNSAFE.sub(percent_encode, str(value))
+
+
+def percent_encode(match: Match) -> str:
+    return "".join(f"%{byte:02X}" for byte in match.group().encode())
+
+
+def get_channel_name(
+    channel: ChannelName, obj: Any, info: GraphQLResolveInfo, args: Dict[str, Any]
+) -> str:
+    if callable(channel):
+        return channel(obj, info, **args)
+
+    escaped_args = {name: escape_channel_arg(value) for name, value in args.items()}
+    return channel.format_map(ChannelArgs(escaped_args))
+
+
+def create_channel_subscriber(
+    type_: Any,
+    channel: ChannelName,
+    policy: Optional[DeliveryPolicy] = None,
+    stats: Optional[DeliveryStats] = None,
+) -> Callable:
+    def create_buffer() -> DeliveryBuffer:
+        if policy:
+            return policy.create_buffer(stats)
+        broker = type_.__broker__ or default_broker
+        return DropOldest(broker.queue_size).create_buffer()
+
+    def channel_subscriber(obj: Any, info: GraphQLResolveInfo, **kwargs: Any):
+        broker = type_.__broker__ or default_broker
+        channel_name = get_channel_name(channel, obj, info, kwargs)
+        return broker.subscribe(channel_name, observe_buffer(create_buffer))
+
+    return channel_subscriber
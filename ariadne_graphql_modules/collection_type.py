@@ -1,6 +1,6 @@
 from typing import List, Type
 
-from .bases import BaseType
+from .bases import BaseType, get_memoized_types
 
 
 class CollectionType(BaseType):
@@ -9,10 +9,4 @@ class CollectionType(BaseType):
 
     @classmethod
     def __get_types__(cls) -> List[Type["BaseType"]]:
-        types: List[Type["BaseType"]] = []
-        for type_ in cls.__types__:
-            child_types = type_.__get_types__()
-            for child_type in child_types:
-                if child_type not in types:
-                    types.append(child_type)
-        return types
+        return get_memoized_types(cls, [], "__types__")
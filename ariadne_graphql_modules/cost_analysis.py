@@ -0,0 +1,262 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union, cast
+
+from graphql import (
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLField,
+    GraphQLInterfaceType,
+    GraphQLSchema,
+    OperationDefinitionNode,
+    value_from_ast,
+)
+from graphql.pyutils import Undefined
+from graphql.validation import ValidationContext
+from graphql.validation.rules import ASTValidationRule, ValidationRule
+
+# Name of key used to store cost table in schema's extensions
+EXTENSIONS_KEY = "costs"
+
+
+class FieldCost:
+    """Cost of resolving field, multiplied by values of its arguments"""
+
+    complexity: int
+    multipliers: Tuple[str, ...]
+
+    def __init__(self, complexity: int = 1, multipliers: Sequence[str] = ()):
+        self.complexity = complexity
+        self.multipliers = tuple(multipliers)
+
+
+FieldCosts = Dict[str, Union[int, FieldCost]]
+CostTable = Dict[str, Dict[str, FieldCost]]
+
+
+def get_field_cost(cost: Union[int, FieldCost]) -> FieldCost:
+    if isinstance(cost, FieldCost):
+        return cost
+    return FieldCost(cost)
+
+
+def build_cost_table(schema: GraphQLSchema, types_costs: CostTable) -> CostTable:
+    cost_table = {type_name: costs.copy() for type_name, costs in types_costs.items()}
+
+    # Costs of interface fields are used by types implementing the interface
+    for type_name, costs in types_costs.items():
+        graphql_type = schema.type_map.get(type_name)
+        if not isinstance(graphql_type, GraphQLInterfaceType):
+            continue
+
+        implementations = schema.get_implementations(graphql_type)
+        for implementation in implementations.objects + implementations.interfaces:
+            implementation_costs = cost_table.setdefault(implementation.name, {})
+            for field_name, field_cost in costs.items():
+                implementation_costs.setdefault(field_name, field_cost)
+
+    return cost_table
+
+
+def set_cost_table(schema: GraphQLSchema, cost_table: CostTable):
+    schema.extensions[EXTENSIONS_KEY] = cost_table
+
+
+def get_cost_table(schema: GraphQLSchema) -> CostTable:
+    return (schema.extensions or {}).get(EXTENSIONS_KEY) or {}
+
+
+class SelectionCost:
+    """Cost of selection set, with fragments spread in it"""
+
+    complexity: int
+    multiplier: int
+    cost: int
+    spreads: Dict[str, int]
+
+    def __init__(self, complexity: int = 0, multiplier: int = 1):
+        self.complexity = complexity
+        self.multiplier = multiplier
+        self.cost = 0
+        self.spreads = {}
+
+    def add(self, other: "SelectionCost"):
+        multiplier = other.multiplier
+        self.cost += multiplier * (other.complexity + other.cost)
+        for fragment_name, count in other.spreads.items():
+            self.spreads[fragment_name] = (
+                self.spreads.get(fragment_name, 0) + multiplier * count
+            )
+
+
+class CostValidator(ValidationRule):
+    """Rejects operations which cost exceeds maximum cost
+
+    Cost of operation is computed in single pass over query's AST. Fragments
+    costs are computed once and added to operations when document is left.
+    """
+
+    maximum_cost: int
+    default_cost: int
+    variables: Optional[Dict[str, Any]]
+
+    cost_table: CostTable
+    stack: List[SelectionCost]
+    operations: List[Tuple[OperationDefinitionNode, SelectionCost]]
+    fragments: Dict[str, SelectionCost]
+
+    def __init__(
+        self,
+        context: ValidationContext,
+        maximum_cost: int,
+        *,
+        default_cost: int = 0,
+        variables: Optional[Dict[str, Any]] = None,
+    ):
+        super().__init__(context)
+
+        self.maximum_cost = maximum_cost
+        self.default_cost = default_cost
+        self.variables = variables
+
+        self.cost_table = get_cost_table(context.schema)
+        self.stack = []
+        self.operations = []
+        self.fragments = {}
+
+    def enter_operation_definition(self, node: OperationDefinitionNode, *_):
+        selection_cost = SelectionCost()
+        self.operations.append((node, selection_cost))
+        self.stack.append(selection_cost)
+
+    def leave_operation_definition(self, *_):
+        self.stack.pop()
+
+    def enter_fragment_definition(self, node: FragmentDefinitionNode, *_):
+        selection_cost = SelectionCost()
+        self.fragments[node.name.value] = selection_cost
+        self.stack.append(selection_cost)
+
+    def leave_fragment_definition(self, *_):
+        self.stack.pop()
+
+    def enter_fragment_spread(self, node: FragmentSpreadNode, *_):
+        spreads = self.stack[-1].spreads
+        fragment_name = node.name.value
+        spreads[fragment_name] = spreads.get(fragment_name, 0) + 1
+
+    def enter_field(self, node: FieldNode, *_):
+        field_cost = None
+        parent_type = self.context.get_parent_type()
+        if parent_type:
+            type_costs = self.cost_table.get(parent_type.name)
+            if type_costs:
+                field_cost = type_costs.get(node.name.value)
+
+        if field_cost is None:
+            self.stack.append(SelectionCost(self.default_cost))
+        elif field_cost.multipliers:
+            multiplier = self.get_multiplier(node, field_cost.multipliers)
+            self.stack.append(SelectionCost(field_cost.complexity, multiplier))
+        else:
+            self.stack.append(SelectionCost(field_cost.complexity))
+
+    def leave_field(self, *_):
+        selection_cost = self.stack.pop()
+        self.stack[-1].add(selection_cost)
+
+    def leave_document(self, *_):
+        fragments_costs: Dict[str, int] = {}
+        for node, selection_cost in self.operations:
+            cost = self.get_total_cost(selection_cost, fragments_costs, set())
+            if cost > self.maximum_cost:
+                self.report_error(
+                    GraphQLError(
+                        cost_analysis_message(self.maximum_cost, cost),
+                        node,
+                        extensions={
+                            "cost": {
+                                "requestedQueryCost": cost,
+                                "maximumAvailable": self.maximum_cost,
+                            }
+                        },
+                    )
+                )
+
+    def get_multiplier(self, node: FieldNode, multipliers: Tuple[str, ...]) -> int:
+        field_def = cast(Optional[GraphQLField], self.context.get_field_def())
+        if not field_def:
+            return 1
+
+        multiplier = 0
+        for arg_name in multipliers:
+            value = self.get_argument_value(node, field_def, arg_name)
+            if isinstance(value, (list, tuple)):
+                value = len(value)
+            if isinstance(value, int) and value > 0:
+                multiplier += value
+
+        return multiplier or 1
+
+    def get_argument_value(
+        self, node: FieldNode, field_def: GraphQLField, arg_name: str
+    ) -> Any:
+        arg_def = field_def.args.get(arg_name)
+        if not arg_def:
+            return None
+
+        for arg_node in node.arguments:
+            if arg_node.name.value == arg_name:
+                value = value_from_ast(arg_node.value, arg_def.type, self.variables)
+                return None if value is Undefined else value
+
+        if arg_def.default_value is Undefined:
+            return None
+        return arg_def.default_value
+
+    def get_total_cost(
+        self,
+        selection_cost: SelectionCost,
+        fragments_costs: Dict[str, int],
+        visited_fragments: set,
+    ) -> int:
+        cost = selection_cost.cost
+        for fragment_name, count in selection_cost.spreads.items():
+            if fragment_name not in fragments_costs:
+                fragment = self.fragments.get(fragment_name)
+                if not fragment or fragment_name in visited_fragments:
+                    continue  # Unknown fragments and cycles are reported by other rules
+
+                visited_fragments.add(fragment_name)
+                fragments_costs[fragment_name] = self.get_total_cost(
+                    fragment, fragments_costs, visited_fragments
+                )
+                visited_fragments.discard(fragment_name)
+
+            cost += count * fragments_costs[fragment_name]
+
+        return cost
+
+
+def cost_analysis_message(maximum_cost: int, cost: int) -> str:
+    return (
+        f"The query exceeds the maximum cost of {maximum_cost}. Actual cost is {cost}"
+    )
+
+
+def create_cost_validator(
+    maximum_cost: int,
+    *,
+    default_cost: int = 0,
+    variables: Optional[Dict[str, Any]] = None,
+) -> Type[ASTValidationRule]:
+    class _CostValidator(CostValidator):
+        def __init__(self, context: ValidationContext):
+            super().__init__(
+                context,
+                maximum_cost,
+                default_cost=default_cost,
+                variables=variables,
+            )
+
+    return cast(Type[ASTValidationRule], _CostValidator)
@@ -0,0 +1,425 @@
+from asyncio import (
+    CancelledError,
+    Event,
+    Future,
+    TimeoutError as AsyncTimeoutError,
+    ensure_future,
+    get_running_loop,
+    wait,
+    wait_for,
+)
+from collections import deque
+from contextvars import ContextVar, copy_context
+from inspect import isawaitable
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional
+
+from graphql import GraphQLResolveInfo
+
+# Returned by DeliveryBuffer.get when source ended and buffer is empty
+END = object()
+
+# Returned by DeliveryBuffer.put when buffered event was lost because of new one
+DROPPED = "dropped"
+COALESCED = "coalesced"
+
+# Set by subscription metrics when subscriber is called, to observe depth of
+# buffers created for subscription
+queue_observer: ContextVar[Optional[Callable[[int], None]]] = ContextVar(
+    "queue_observer", default=None
+)
+
+
+class DeliveryStats:
+    type_name: str
+    field_name: str
+    delivered: int
+    dropped: int
+    coalesced: int
+
+    def __init__(self, type_name: str, field_name: str):
+        self.type_name = type_name
+        self.field_name = field_name
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "type": self.type_name,
+            "field": self.field_name,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+        }
+
+
+class DeliveryBuffer:
+    """Events received from source and waiting for subscriber
+
+    `put` is called for every event from source and returns `DROPPED` or
+    `COALESCED` if event was lost because of it, or `None` otherwise.
+    """
+
+    stats: Optional[DeliveryStats]
+    observer: Optional[Callable[[int], None]] = None
+    events: Deque[Any]
+    ready: Event
+    finished: bool
+    error: Optional[Exception]
+
+    def __init__(self, stats: Optional[DeliveryStats] = None):
+        self.stats = stats
+        self.events = deque()
+        self.ready = Event()
+        self.finished = False
+        self.error = None
+
+    def put(self, event: Any) -> Optional[str]:
+        self.events.append(event)
+        self.ready.set()
+        return None
+
+    def end(self, error: Optional[Exception] = None):
+        self.finished = True
+        self.error = error
+        self.ready.set()
+
+    async def wait(self) -> bool:
+        while not self.events:
+            if self.finished:
+                if self.error is not None:
+                    raise self.error
+                return False
+
+            self.ready.clear()
+            await self.ready.wait()
+
+        return True
+
+    async def get(self) -> Any:
+        if not await self.wait():
+            return END
+
+        if self.stats:
+            self.stats.delivered += 1
+        if self.observer:
+            self.observer(len(self.events))
+        return self.events.popleft()
+
+
+class DropOldestBuffer(DeliveryBuffer):
+    size: int
+
+    def __init__(self, size: int, stats: Optional[DeliveryStats] = None):
+        super().__init__(stats)
+        self.size = size
+
+    def put(self, event: Any) -> Optional[str]:
+        if len(self.events) < self.size:
+            return super().put(event)
+
+        self.events.popleft()
+        self.events.append(event)
+        if self.stats:
+            self.stats.dropped += 1
+        return DROPPED
+
+
+class DropNewestBuffer(DeliveryBuffer):
+    size: int
+
+    def __init__(self, size: int, stats: Optional[DeliveryStats] = None):
+        super().__init__(stats)
+        self.size = size
+
+    def put(self, event: Any) -> Optional[str]:
+        if len(self.events) < self.size:
+            return super().put(event)
+
+        if self.stats:
+            self.stats.dropped += 1
+        return DROPPED
+
+
+class LatestValueBuffer(DeliveryBuffer):
+    def put(self, event: Any) -> Optional[str]:
+        if not self.events:
+            return super().put(event)
+
+        self.events[0] = event
+        if self.stats:
+            self.stats.coalesced += 1
+        return COALESCED
+
+
+class TimeWindowBuffer(DeliveryBuffer):
+    interval: float
+    max_size: int
+    filled: Event
+
+    def __init__(
+        self, interval: float, max_size: int, stats: Optional[DeliveryStats] = None
+    ):
+        super().__init__(stats)
+        self.interval = interval
+        self.max_size = max_size
+        self.filled = Event()
+
+    def put(self, event: Any) -> Optional[str]:
+        if len(self.events) < self.max_size:
+            super().put(event)
+            if len(self.events) == self.max_size:
+                self.filled.set()
+            return None
+
+        self.events.popleft()
+        self.events.append(event)
+        if self.stats:
+            self.stats.dropped += 1
+        return DROPPED
+
+    def end(self, error: Optional[Exception] = None):
+        super().end(error)
+        self.filled.set()
+
+    async def get(self) -> Any:
+        if not await self.wait():
+            return END
+
+        if len(self.events) < self.max_size and not self.finished:
+            self.filled.clear()
+            try:
+                await wait_for(self.filled.wait(), self.interval)
+            except AsyncTimeoutError:
+                pass
+
+        batch = list(self.events)
+        self.events.clear()
+        if self.stats:
+            # Events delivered in list aren't lost, so they aren't coalesced
+            self.stats.delivered += len(batch)
+        if self.observer:
+            self.observer(len(batch))
+        return batch
+
+
+class DeliveryPolicy:
+    """Decides what happens to events that subscriber can't receive yet"""
+
+    def create_buffer(self, stats: Optional[DeliveryStats] = None) -> DeliveryBuffer:
+        raise NotImplementedError(
+            "DeliveryPolicy subclasses must implement create_buffer method"
+        )
+
+
+class DropOldest(DeliveryPolicy):
+    """Keeps `size` newest events, dropping oldest ones"""
+
+    size: int
+
+    def __init__(self, size: int = 100):
+        if size < 1:
+            raise ValueError("DropOldest size must be greater than 0")
+        self.size = size
+
+    def create_buffer(self, stats: Optional[DeliveryStats] = None) -> DeliveryBuffer:
+        return DropOldestBuffer(self.size, stats)
+
+
+class DropNewest(DeliveryPolicy):
+    """Keeps `size` oldest events, dropping new ones until subscriber catches up"""
+
+    size: int
+
+    def __init__(self, size: int = 100):
+        if size < 1:
+            raise ValueError("DropNewest size must be greater than 0")
+        self.size = size
+
+    def create_buffer(self, stats: Optional[DeliveryStats] = None) -> DeliveryBuffer:
+        return DropNewestBuffer(self.size, stats)
+
+
+class LatestValue(DeliveryPolicy):
+    """Keeps only latest event, replacing event that wasn't received yet"""
+
+    def create_buffer(self, stats: Optional[DeliveryStats] = None) -> DeliveryBuffer:
+        return LatestValueBuffer(stats)
+
+
+class TimeWindow(DeliveryPolicy):
+    """Delivers lists of events received within `interval` seconds"""
+
+    interval: float
+    max_size: int
+
+    def __init__(self, interval: float, max_size: int = 100):
+        if interval <= 0:
+            raise ValueError("TimeWindow interval must be greater than 0")
+        if max_size < 1:
+            raise ValueError("TimeWindow max_size must be greater than 0")
+        self.interval = interval
+        self.max_size = max_size
+
+    def create_buffer(self, stats: Optional[DeliveryStats] = None) -> DeliveryBuffer:
+        return TimeWindowBuffer(self.interval, self.max_size, stats)
+
+
+class BatchWindow:
+    """Groups events received within `interval` seconds into lists"""
+
+    interval: float
+    max_size: int
+
+    def __init__(self, interval: float = 0.05, max_size: int = 100):
+        if interval <= 0:
+            raise ValueError("BatchWindow interval must be greater than 0")
+        if max_size < 1:
+            raise ValueError("BatchWindow max_size must be greater than 0")
+        self.interval = interval
+        self.max_size = max_size
+
+
+async def run_source(
+    source_factory: Callable[[], Any],
+    put: Callable[[Any], Any],
+    end: Callable[[Optional[Exception]], Any],
+):
+    source = None
+    try:
+        source = source_factory()
+        if isawaitable(source):
+            source = await source
+        async for event in source:
+            put(event)
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        end(error)
+    else:
+        end(None)
+    finally:
+        aclose = getattr(source, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def observe_buffer(
+    create_buffer: Callable[[], DeliveryBuffer]
+) -> Callable[[], DeliveryBuffer]:
+    observer = queue_observer.get()
+    if observer is None:
+        return create_buffer
+
+    def create_observed_buffer() -> DeliveryBuffer:
+        buffer = create_buffer()
+        buffer.observer = observer
+        return buffer
+
+    return create_observed_buffer
+
+
+async def deliver_events(
+    create_buffer: Callable[[], DeliveryBuffer], source_factory: Callable[[], Any]
+) -> AsyncIterator[Any]:
+    buffer = create_buffer()
+    task = ensure_future(run_source(source_factory, buffer.put, buffer.end))
+
+    try:
+        while True:
+            event = await buffer.get()
+            if event is END:
+                return
+            yield event
+    finally:
+        task.cancel()
+
+
+def create_delivery_subscriber(
+    subscriber: Callable, policy: DeliveryPolicy, stats: DeliveryStats
+) -> Callable:
+    def create_buffer() -> DeliveryBuffer:
+        return policy.create_buffer(stats)
+
+    def delivery_subscriber(obj: Any, info: GraphQLResolveInfo, **kwargs: Any):
+        return deliver_events(
+            observe_buffer(create_buffer), lambda: subscriber(obj, info, **kwargs)
+        )
+
+    return delivery_subscriber
+
+
+async def batch_events(
+    source_factory: Callable[[], Any], window: BatchWindow
+) -> AsyncIterator[List[Any]]:
+    # Source is read only when batch is requested, so unlike TimeWindow policy
+    # events are never dropped and slow subscriber holds source back
+    loop = get_running_loop()
+    source = source_factory()
+    if isawaitable(source):
+        source = await source
+
+    iterator = source.__aiter__()  # pylint: disable=unnecessary-dunder-call
+    pending: Optional[Future] = None
+
+    try:
+        while True:
+            batch: List[Any] = []
+            deadline: Optional[float] = None
+
+            while len(batch) < window.max_size:
+                if pending is None:
+                    pending = ensure_future(
+                        iterator.__anext__()  # pylint: disable=unnecessary-dunder-call
+                    )
+
+                if deadline is None:
+                    await wait([pending])
+                else:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    done, _ = await wait([pending], timeout=timeout)
+                    if not done:
+                        break
+
+                event, pending = pending, None
+                try:
+                    batch.append(event.result())
+                except StopAsyncIteration:
+                    if batch:
+                        yield batch
+                    return
+                except Exception:
+                    # Events received before error are delivered first
+                    if batch:
+                        yield batch
+                    raise
+
+                if deadline is None:
+                    deadline = loop.time() + window.interval
+
+            yield batch
+    finally:
+        if pending is not None:
+            pending.cancel()
+            try:
+                await pending
+            except CancelledError:
+                pass
+            except Exception:  # pylint: disable=broad-exception-caught
+                pass
+
+        aclose = getattr(source, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def create_batch_subscriber(subscriber: Callable, window: BatchWindow) -> Callable:
+    def batch_subscriber(obj: Any, info: GraphQLResolveInfo, **kwargs: Any):
+        # Subscriber is called when batch is requested, in context it was
+        # called in, eg. with queue observer set
+        context = copy_context()
+        return batch_events(
+            lambda: context.run(subscriber, obj, info, **kwargs), window
+        )
+
+    return batch_subscriber
@@ -7,7 +7,6 @@ from graphql import (
 )
 
 from .bases import DefinitionType
-from .utils import parse_definition
 
 
 class DirectiveType(DefinitionType):
@@ -21,13 +20,18 @@ class DirectiveType(DefinitionType):
             return
 
         cls.__abstract__ = False
+        cls.__prepared__ = False
 
-        graphql_def = cls.__validate_schema__(
-            parse_definition(cls.__name__, cls.__schema__)
-        )
+        if not cls.__lazy__:
+            cls.__prepare_type__()
+
+    @classmethod
+    def __setup_type__(cls, type_def: DefinitionNode, validate: bool = True):
+        graphql_def = cls.__validate_schema__(type_def)
 
         cls.graphql_name = graphql_def.name.value
         cls.graphql_type = type(graphql_def)
+        cls.graphql_def = graphql_def
 
         cls.__validate_visitor__()
 
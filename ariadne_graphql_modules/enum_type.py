@@ -1,17 +1,22 @@
 from enum import Enum
-from typing import List, Optional, Type, Union, cast
+from typing import Any, Dict, List, Optional, Tuple, Type, Union, cast
 
-import ariadne
 from graphql import (
     DefinitionNode,
-    GraphQLSchema,
     EnumTypeDefinitionNode,
     EnumTypeExtensionNode,
+    EnumValueNode,
+    GraphQLEnumType,
+    GraphQLInputObjectType,
+    GraphQLInterfaceType,
+    GraphQLObjectType,
+    GraphQLSchema,
+    ValueNode,
+    get_named_type,
 )
 
 from .bases import BindableType
 from .types import RequirementsDict
-from .utils import parse_definition
 
 EnumNodeType = Union[EnumTypeDefinitionNode, EnumTypeExtensionNode]
 
@@ -21,6 +26,8 @@ class EnumType(BindableType):
     __enum__: Optional[Union[Type[Enum], dict]] = None
 
     graphql_type: Union[Type[EnumTypeDefinitionNode], Type[EnumTypeExtensionNode]]
+    graphql_values: Optional[Dict[str, Any]] = None
+    graphql_names: Optional[Dict[Any, str]] = None
 
     def __init_subclass__(cls) -> None:
         super().__init_subclass__()
@@ -29,20 +36,31 @@ class EnumType(BindableType):
             return
 
         cls.__abstract__ = False
+        cls.__prepared__ = False
 
-        graphql_def = cls.__validate_schema__(
-            parse_definition(cls.__name__, cls.__schema__)
-        )
+        if not cls.__lazy__:
+            cls.__prepare_type__()
+
+    @classmethod
+    def __setup_type__(cls, type_def: DefinitionNode, validate: bool = True):
+        graphql_def = cls.__validate_schema__(type_def)
 
         cls.graphql_name = graphql_def.name.value
         cls.graphql_type = type(graphql_def)
+        cls.graphql_def = graphql_def
 
-        requirements = cls.__get_requirements__()
-        cls.__validate_requirements_contain_extended_type__(graphql_def, requirements)
+        if validate:
+            requirements = cls.__get_requirements__()
+            cls.__validate_requirements_contain_extended_type__(
+                graphql_def, requirements
+            )
 
         values = cls.__get_values__(graphql_def)
         cls.__validate_values__(values)
 
+        if cls.__enum__:
+            cls.graphql_values, cls.graphql_names = get_enum_maps(cls.__enum__)
+
     @classmethod
     def __validate_schema__(cls, type_def: DefinitionNode) -> EnumNodeType:
         if not isinstance(type_def, (EnumTypeDefinitionNode, EnumTypeExtensionNode)):
@@ -110,12 +128,103 @@ class EnumType(BindableType):
 
     @classmethod
     def __bind_to_schema__(cls, schema: GraphQLSchema):
-        if cls.__enum__:
-            bindable = ariadne.EnumType(cls.graphql_name, cls.__enum__)
-            bindable.bind_to_schema(schema)
+        if cls.graphql_values is None or cls.graphql_names is None:
+            return
+
+        graphql_type = cls.__get_graphql_type__(schema)
+        for name, value in cls.graphql_values.items():
+            if name not in graphql_type.values:
+                raise ValueError(
+                    f"Value {name} is not defined on enum {cls.graphql_name}"
+                )
+            graphql_type.values[name].value = value
+
+        # Drop values lookup if it was cached by GraphQL enum before values changed
+        graphql_type.__dict__.pop("_value_lookup", None)
+        set_enum_coercers(graphql_type, cls.graphql_values, cls.graphql_names)
 
     @classmethod
     def __bind_to_default_values__(cls, schema: GraphQLSchema):
-        if cls.__enum__:
-            bindable = ariadne.EnumType(cls.graphql_name, cls.__enum__)
-            bindable.bind_to_default_values(schema)
+        if not cls.graphql_values:
+            return
+
+        graphql_type = cls.__get_graphql_type__(schema)
+        for type_ in schema.type_map.values():
+            if isinstance(type_, (GraphQLObjectType, GraphQLInterfaceType)):
+                for field in type_.fields.values():
+                    for arg in field.args.values():
+                        if get_named_type(arg.type) is graphql_type:
+                            arg.default_value = repair_default_value(
+                                cls.graphql_values, arg.default_value
+                            )
+            elif isinstance(type_, GraphQLInputObjectType):
+                for input_field in type_.fields.values():
+                    if get_named_type(input_field.type) is graphql_type:
+                        input_field.default_value = repair_default_value(
+                            cls.graphql_values, input_field.default_value
+                        )
+
+    @classmethod
+    def __get_graphql_type__(cls, schema: GraphQLSchema) -> GraphQLEnumType:
+        graphql_type = schema.type_map.get(cls.graphql_name)
+        if not isinstance(graphql_type, GraphQLEnumType):
+            raise ValueError(
+                f"{cls.graphql_name} is defined in the schema, but it is instance of "
+                f"{type(graphql_type).__name__} (expected GraphQLEnumType)"
+            )
+        return graphql_type
+
+
+def get_enum_maps(
+    enum: Union[Type[Enum], dict]
+) -> Tuple[Dict[str, Any], Dict[Any, str]]:
+    # Names to values and values to names maps, first name is used for duplicates
+    values: Dict[str, Any] = dict(getattr(enum, "__members__", enum))
+    names: Dict[Any, str] = {}
+    for name, value in values.items():
+        try:
+            names.setdefault(value, name)
+        except TypeError:
+            pass  # Unhashable values are serialized by GraphQL enum
+
+    return values, names
+
+
+def set_enum_coercers(
+    graphql_type: GraphQLEnumType, values: Dict[str, Any], names: Dict[Any, str]
+):
+    # Enum's own methods are used for errors and values from other EnumTypes
+    serialize = graphql_type.serialize
+    parse_value = graphql_type.parse_value
+    parse_literal = graphql_type.parse_literal
+
+    def serialize_enum_value(output_value: Any) -> str:
+        try:
+            return names[output_value]
+        except (KeyError, TypeError):
+            return serialize(output_value)
+
+    def parse_enum_value(input_value: Any) -> Any:
+        try:
+            return values[input_value]
+        except (KeyError, TypeError):
+            return parse_value(input_value)
+
+    def parse_enum_literal(
+        value_node: ValueNode, variables: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        if isinstance(value_node, EnumValueNode) and value_node.value in values:
+            return values[value_node.value]
+        return parse_literal(value_node, variables)
+
+    graphql_type.serialize = serialize_enum_value  # type: ignore
+    graphql_type.parse_value = parse_enum_value  # type: ignore
+    graphql_type.parse_literal = parse_enum_literal  # type: ignore
+
+
+def repair_default_value(values: Dict[str, Any], default_value: Any) -> Any:
+    if isinstance(default_value, str):
+        return values.get(default_value, default_value)
+    if isinstance(default_value, list):
+        return [repair_default_value(values, value) for value in default_value]
+    return default_value
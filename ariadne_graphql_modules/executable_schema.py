@@ -1,3 +1,4 @@
+from time import perf_counter
 from typing import (
     Dict,
     List,
@@ -17,6 +18,7 @@ from ariadne import (
 )
 from graphql import (
     ConstDirectiveNode,
+    DefinitionNode,
     DocumentNode,
     FieldDefinitionNode,
     GraphQLSchema,
@@ -31,7 +33,17 @@ from graphql import (
 from graphql.language import ast
 
 from .bases import BaseType, BindableType, DeferredType, DefinitionType
+from .cost_analysis import CostTable, build_cost_table, set_cost_table
 from .enum_type import EnumType
+from .fingerprint import fingerprint_schema
+from .instrumentation import ResolverInstrumentation
+from .interface_type import InterfaceType
+from .mutation_type import MutationType
+from .object_type import ObjectType
+from .schema_cache import SchemaCache
+from .stats import SchemaBuildStats, measure_phase
+from .subscription_metrics import SubscriptionMetricsSink, instrument_subscriptions
+from .utils import copy_without_locations, parse_definitions
 
 ROOT_TYPES = ["Query", "Mutation", "Subscription"]
 
@@ -40,9 +52,17 @@ def make_executable_schema(
     *args: Union[Type[BaseType], SchemaBindable, str],
     merge_roots: bool = True,
     extra_directives: Optional[Dict[str, Type[SchemaDirectiveVisitor]]] = None,
+    cache: Optional[SchemaCache] = None,
+    stats: Optional[SchemaBuildStats] = None,
+    trusted_fingerprint: Optional[str] = None,
+    no_location: bool = False,
+    instrumentation: Optional[ResolverInstrumentation] = None,
+    subscription_metrics: Optional[SubscriptionMetricsSink] = None,
 ):
-    all_types = get_all_types(args)
-    extra_defs = parse_extra_sdl(args)
+    with measure_phase(stats, "get_all_types") as phase:
+        all_types = get_all_types(args)
+        phase.count = len(all_types)
+
     extra_bindables: List[SchemaBindable] = [
         arg for arg in args if isinstance(arg, SchemaBindable)
     ]
@@ -52,51 +72,179 @@ def make_executable_schema(
         if issubclass(type_, DefinitionType):
             type_defs.append(type_)
 
-    validate_no_missing_definitions(all_types, type_defs, extra_defs)
+    fingerprint: Optional[str] = None
+    if cache or trusted_fingerprint:
+        with measure_phase(stats, "fingerprint_schema"):
+            fingerprint = fingerprint_schema(
+                type_defs,
+                get_extra_sdl(args),
+                merge_roots,
+                extra_directives or {},
+            )
+
+    # Schema with trusted fingerprint was already validated, eg. on CI
+    trusted = bool(trusted_fingerprint) and fingerprint == trusted_fingerprint
+
+    with measure_phase(stats, "prepare_types") as phase:
+        prepare_type_defs(type_defs, validate=not trusted)
+        phase.count = len(type_defs)
+
+    cached_document: Optional[DocumentNode] = None
+    if cache and fingerprint:
+        with measure_phase(stats, "cache_load") as phase:
+            cached_document = cache.get(fingerprint)
+            phase.count = 1 if cached_document else 0
+
+    if cached_document:
+        # Cached document was validated by the build that stored it
+        ast_document = cached_document
+        with measure_phase(stats, "build_ast_schema") as phase:
+            schema = build_ast_schema(
+                ast_document, assume_valid=True, assume_valid_sdl=True
+            )
+            phase.count = len(ast_document.definitions)
+    else:
+        with measure_phase(stats, "parse_extra_sdl") as phase:
+            extra_defs = parse_extra_sdl(args, no_location)
+            phase.count = len(extra_defs)
+
+        if not trusted:
+            with measure_phase(stats, "validate_no_missing_definitions"):
+                validate_no_missing_definitions(all_types, type_defs, extra_defs)
+
+        ast_document = build_schema_document(type_defs, extra_defs, merge_roots, stats)
+
+        with measure_phase(stats, "build_ast_schema") as phase:
+            schema = build_ast_schema(
+                ast_document, assume_valid=trusted, assume_valid_sdl=trusted
+            )
+            phase.count = len(ast_document.definitions)
 
-    schema = build_schema(type_defs, extra_defs, merge_roots)
+    with measure_phase(stats, "bind_to_schema") as phase:
+        bind_types_to_schema(schema, type_defs, stats)
+        phase.count = len(type_defs)
+
+    types_costs = get_types_costs(type_defs)
+    if types_costs:
+        with measure_phase(stats, "build_cost_table") as phase:
+            set_cost_table(schema, build_cost_table(schema, types_costs))
+            phase.count = len(types_costs)
+
+    if instrumentation:
+        with measure_phase(stats, "instrument_resolvers"):
+            instrumentation.instrument_schema(schema, type_defs)
+
+    if subscription_metrics:
+        with measure_phase(stats, "instrument_subscriptions"):
+            instrument_subscriptions(schema, type_defs, subscription_metrics)
 
     if extra_bindables:
-        for bindable in extra_bindables:
-            bindable.bind_to_schema(schema)
+        with measure_phase(stats, "extra_bindables") as phase:
+            for bindable in extra_bindables:
+                bindable.bind_to_schema(schema)
+            phase.count = len(extra_bindables)
 
     if extra_directives:
-        SchemaDirectiveVisitor.visit_schema_directives(schema, extra_directives)
+        with measure_phase(stats, "extra_directives") as phase:
+            SchemaDirectiveVisitor.visit_schema_directives(schema, extra_directives)
+            phase.count = len(extra_directives)
+
+    if not cached_document and not trusted:
+        with measure_phase(stats, "assert_valid_schema"):
+            assert_valid_schema(schema)
 
-    assert_valid_schema(schema)
-    validate_schema_default_enum_values(schema)
-    repair_schema_default_enum_values(schema)
+    # Enum values are defined in Python, so their validation can't be skipped
+    # for schema with trusted fingerprint or cached document
+    with measure_phase(stats, "validate_default_enum_values"):
+        validate_schema_default_enum_values(schema)
 
-    add_directives_to_schema(schema, type_defs)
+    with measure_phase(stats, "repair_default_enum_values"):
+        repair_schema_default_enum_values(schema)
+
+    with measure_phase(stats, "add_directives_to_schema"):
+        add_directives_to_schema(schema, type_defs)
+
+    if cache and fingerprint and not cached_document:
+        with measure_phase(stats, "cache_save"):
+            cache.save(fingerprint, copy_without_locations(ast_document))
 
     return schema
 
 
+def prepare_types(*args: Union[Type[BaseType], SchemaBindable, str]):
+    type_defs: List[Type[DefinitionType]] = []
+    for type_ in get_all_types(args):
+        if issubclass(type_, DefinitionType):
+            type_defs.append(type_)
+
+    prepare_type_defs(type_defs)
+
+
+def prepare_type_defs(type_defs: List[Type[DefinitionType]], validate: bool = True):
+    # Parses and validates schemas of types defined with __lazy__ = True
+    pending_types = [type_ for type_ in type_defs if not type_.__prepared__]
+    for no_location in (False, True):
+        parsed_types = [
+            type_ for type_ in pending_types if type_.__no_location__ == no_location
+        ]
+        if len(parsed_types) > 1:
+            definitions = parse_definitions(
+                [(type_.__name__, type_.__schema__) for type_ in parsed_types],
+                no_location,
+            )
+            for type_, type_def in zip(parsed_types, definitions):
+                type_.__pending_def__ = type_def
+
+    for type_ in pending_types:
+        type_.__prepare_type__(validate=validate)
+
+
+def get_schema_fingerprint(
+    *args: Union[Type[BaseType], SchemaBindable, str],
+    merge_roots: bool = True,
+    extra_directives: Optional[Dict[str, Type[SchemaDirectiveVisitor]]] = None,
+) -> str:
+    type_defs: List[Type[DefinitionType]] = []
+    for type_ in get_all_types(args):
+        if issubclass(type_, DefinitionType):
+            type_defs.append(type_)
+
+    return fingerprint_schema(
+        type_defs, get_extra_sdl(args), merge_roots, extra_directives or {}
+    )
+
+
 def get_all_types(
     args: Sequence[Union[Type[BaseType], SchemaBindable, str]]
 ) -> List[Type[BaseType]]:
-    all_types: List[Type[BaseType]] = []
+    # Dict is used as ordered set to keep order of types deterministic
+    all_types: Dict[Type[BaseType], None] = {}
     for arg in args:
         if isinstance(arg, (str, SchemaBindable)):
             continue  # Skip args of unsupported types
 
-        for child_type in arg.__get_types__():
-            if child_type not in all_types:
-                all_types.append(child_type)
-    return all_types
+        all_types.update(dict.fromkeys(arg.__get_types__()))
+    return list(all_types)
 
 
-def parse_extra_sdl(
+def get_extra_sdl(
     args: Sequence[Union[Type[BaseType], SchemaBindable, str]]
+) -> List[str]:
+    return [cast(str, arg) for arg in args if isinstance(arg, str)]
+
+
+def parse_extra_sdl(
+    args: Sequence[Union[Type[BaseType], SchemaBindable, str]],
+    no_location: bool = False,
 ) -> List[TypeDefinitionNode]:
-    sdl_strings: List[str] = [cast(str, arg) for arg in args if isinstance(arg, str)]
+    sdl_strings = get_extra_sdl(args)
     if not sdl_strings:
         return []
 
     extra_sdl = "\n\n".join(sdl_strings)
     return cast(
         List[TypeDefinitionNode],
-        list(parse(extra_sdl).definitions),
+        list(parse(extra_sdl, no_location=no_location).definitions),
     )
 
 
@@ -126,24 +274,57 @@ def build_schema(
     extra_defs: List[TypeDefinitionNode],
     merge_roots: bool = True,
 ) -> GraphQLSchema:
-    schema_definitions: List[ast.DocumentNode] = []
-    if merge_roots:
-        schema_definitions.append(build_root_schema(type_defs, extra_defs))
-        for type_ in type_defs:
-            if type_.graphql_name not in ROOT_TYPES or not merge_roots:
-                schema_definitions.append(parse(type_.__schema__))
-        for extra_type_def in extra_defs:
-            if extra_type_def.name.value not in ROOT_TYPES or not merge_roots:
-                schema_definitions.append(DocumentNode(definitions=(extra_type_def,)))
-
-    ast_document = concat_ast(schema_definitions)
+    ast_document = build_schema_document(type_defs, extra_defs, merge_roots)
     schema = build_ast_schema(ast_document)
+    bind_types_to_schema(schema, type_defs)
+    return schema
+
 
+def build_schema_document(
+    type_defs: List[Type[DefinitionType]],
+    extra_defs: List[TypeDefinitionNode],
+    merge_roots: bool = True,
+    stats: Optional[SchemaBuildStats] = None,
+) -> DocumentNode:
+    schema_definitions: List[DefinitionNode] = []
+    if merge_roots:
+        with measure_phase(stats, "build_root_schema") as phase:
+            root_schema = build_root_schema(type_defs, extra_defs)
+            schema_definitions.extend(root_schema.definitions)
+            phase.count = len(root_schema.definitions)
     for type_ in type_defs:
-        if issubclass(type_, BindableType):
-            type_.__bind_to_schema__(schema)
+        if type_.graphql_name not in ROOT_TYPES or not merge_roots:
+            schema_definitions.append(type_.graphql_def)
+    for extra_type_def in extra_defs:
+        if extra_type_def.name.value not in ROOT_TYPES or not merge_roots:
+            schema_definitions.append(extra_type_def)
 
-    return schema
+    return DocumentNode(definitions=tuple(schema_definitions))
+
+
+def get_types_costs(type_defs: List[Type[DefinitionType]]) -> CostTable:
+    types_costs: CostTable = {}
+    for type_ in type_defs:
+        if issubclass(type_, (InterfaceType, MutationType, ObjectType)):
+            costs = type_.__get_costs__()
+            if costs:
+                types_costs.setdefault(type_.graphql_name, {}).update(costs)
+    return types_costs
+
+
+def bind_types_to_schema(
+    schema: GraphQLSchema,
+    type_defs: List[Type[DefinitionType]],
+    stats: Optional[SchemaBuildStats] = None,
+):
+    for type_ in type_defs:
+        if issubclass(type_, BindableType):
+            if stats is None:
+                type_.__bind_to_schema__(schema)
+            else:
+                start = perf_counter()
+                type_.__bind_to_schema__(schema)
+                stats.record_bind_time(type_.__name__, perf_counter() - start)
 
 
 RootTypeDef = Tuple[str, DocumentNode]
@@ -162,7 +343,7 @@ def build_root_schema(
     for type_def in type_defs:
         if type_def.graphql_name in root_types:
             root_types[type_def.graphql_name].append(
-                (type_def.__name__, parse(type_def.__schema__))
+                (type_def.__name__, DocumentNode(definitions=(type_def.graphql_def,)))
             )
 
     for extra_type_def in extra_defs:
@@ -0,0 +1,74 @@
+from typing import (
+    Any,
+    AsyncIterable,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Union,
+    cast,
+)
+
+from graphql import (
+    ExecutionContext,
+    FieldNode,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLOutputType,
+    GraphQLResolveInfo,
+    GraphQLScalarType,
+)
+from graphql.pyutils import AwaitableOrValue, Path, Undefined, is_iterable
+
+
+class SerializeManyExecutionContext(ExecutionContext):
+    """Serializes lists of scalars with `serialize_many` in single call"""
+
+    def complete_list_value(
+        self,
+        return_type: GraphQLList[GraphQLOutputType],
+        field_nodes: List[FieldNode],
+        info: GraphQLResolveInfo,
+        path: Path,
+        result: Union[AsyncIterable[Any], Iterable[Any]],
+    ) -> AwaitableOrValue[List[Any]]:
+        item_type = return_type.of_type
+        if isinstance(item_type, GraphQLNonNull):
+            item_type = item_type.of_type
+
+        serialize_many = getattr(item_type, "serialize_many", None)
+        if (
+            serialize_many
+            and isinstance(item_type, GraphQLScalarType)
+            and is_iterable(result)
+        ):
+            items = result if isinstance(result, list) else list(cast(Iterable, result))
+            serialized = self.serialize_list(serialize_many, items)
+            if serialized is not None:
+                return serialized
+            result = items
+
+        return super().complete_list_value(return_type, field_nodes, info, path, result)
+
+    def serialize_list(
+        self, serialize_many: Callable[[List[Any]], Any], items: List[Any]
+    ) -> Optional[List[Any]]:
+        # Returns None if list has to be completed item by item, eg. to report
+        # errors for items that can't be serialized or to await items
+        is_awaitable = self.is_awaitable
+        for item in items:
+            if item is None or is_awaitable(item):
+                return None
+
+        try:
+            serialized = list(serialize_many(items))
+        except Exception:  # pylint: disable=broad-exception-caught
+            return None
+
+        if len(serialized) != len(items):
+            return None
+        for value in serialized:
+            if value is None or value is Undefined:
+                return None
+
+        return serialized
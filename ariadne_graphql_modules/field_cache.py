@@ -0,0 +1,223 @@
+from collections import OrderedDict
+from inspect import isawaitable
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from graphql import GraphQLFieldResolver, GraphQLResolveInfo, default_field_resolver
+
+from .utils import freeze_args, is_default_resolver, mark_default_resolver
+
+CacheKeyFunc = Callable[..., Hashable]
+
+PROCESS = "process"
+REQUEST = "request"
+
+# Name of key or attribute used to store request scoped caches in context
+CONTEXT_KEY = "__field_caches__"
+
+
+class CacheBackend:
+    """Base class for fields cache backends"""
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Returns tuple with flag telling if key was found and its value"""
+        raise NotImplementedError()
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float]):
+        raise NotImplementedError()
+
+    def delete(self, key: Hashable):
+        raise NotImplementedError()
+
+    def clear(self):
+        raise NotImplementedError()
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Stores values in process memory, evicting least recently used ones"""
+
+    max_entries: Optional[int]
+    entries: "OrderedDict[Hashable, Tuple[Optional[float], Any]]"
+    lock: Lock
+
+    def __init__(self, max_entries: Optional[int] = 1000):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return False, None
+
+            expires, value = entry
+            if expires is not None and expires <= monotonic():
+                del self.entries[key]
+                return False, None
+
+            self.entries.move_to_end(key)
+            return True, value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float]):
+        expires = monotonic() + ttl if ttl is not None else None
+        with self.lock:
+            self.entries[key] = (expires, value)
+            self.entries.move_to_end(key)
+            if self.max_entries is not None:
+                while len(self.entries) > self.max_entries:
+                    self.entries.popitem(last=False)
+
+    def delete(self, key: Hashable):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class FieldCache:
+    """Caches values returned by field's resolver"""
+
+    ttl: Optional[float]
+    max_entries: Optional[int]
+    scope: str
+    key: Optional[CacheKeyFunc]
+    backend: CacheBackend
+
+    hits: int
+    misses: int
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = 1000,
+        scope: str = PROCESS,
+        key: Optional[CacheKeyFunc] = None,
+        backend: Optional[CacheBackend] = None,
+    ):
+        if scope not in (PROCESS, REQUEST):
+            raise ValueError(
+                f"FieldCache scope should be '{PROCESS}' or '{REQUEST}', "
+                f"not '{scope}'"
+            )
+        if scope == REQUEST and backend is not None:
+            raise ValueError("FieldCache with 'request' scope can't use backend")
+
+        if backend is None:
+            backend = InMemoryCacheBackend(max_entries)
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.scope = scope
+        self.key = key
+        self.backend = backend
+
+        self.hits = 0
+        self.misses = 0
+
+    def get_backend(self, info: GraphQLResolveInfo) -> Optional[CacheBackend]:
+        if self.scope == PROCESS:
+            return self.backend
+        return get_request_backend(self, info.context)
+
+    def get_key(
+        self,
+        field_name: str,
+        source: Any,
+        info: GraphQLResolveInfo,
+        args: Dict[str, Any],
+    ) -> Optional[Hashable]:
+        # Resolvers of interface fields are bound to all types implementing it,
+        # so key uses name of type that field is resolved for
+        type_name = info.parent_type.name
+        if self.key:
+            return (type_name, field_name, self.key(source, info, **args))
+
+        source_id = get_source_id(source)
+        if source_id is None and info.path.prev is not None:
+            return None  # Objects without id can't be told apart in cache key
+
+        try:
+            frozen_args = freeze_args(args, strict=True)
+        except TypeError:
+            return None  # Arguments can't be used in cache key
+
+        return (type_name, field_name, source_id, frozen_args)
+
+    def wrap_resolver(
+        self,
+        field_name: str,
+        resolver: Optional[GraphQLFieldResolver] = None,
+    ) -> GraphQLFieldResolver:
+        resolve_field = resolver or default_field_resolver
+
+        def cached_field_resolver(
+            source: Any, info: GraphQLResolveInfo, **args: Any
+        ) -> Any:
+            backend = self.get_backend(info)
+            key = self.get_key(field_name, source, info, args)
+            if backend is None or key is None:
+                return resolve_field(source, info, **args)
+
+            found, value = backend.get(key)
+            if found:
+                self.hits += 1
+                return value
+
+            self.misses += 1
+            value = resolve_field(source, info, **args)
+            if isawaitable(value):
+                return self.set_awaitable(backend, key, value)
+
+            backend.set(key, value, self.ttl)
+            return value
+
+        # Types binding resolvers to schema wrap resolver that replaces default
+        # one (eg. of interface) with cache of field
+        setattr(cached_field_resolver, "__field_cache__", self)
+        if resolver is None or is_default_resolver(resolver):
+            return mark_default_resolver(cached_field_resolver)
+        return cached_field_resolver
+
+    async def set_awaitable(self, backend: CacheBackend, key: Hashable, value: Any):
+        result = await value
+        backend.set(key, result, self.ttl)
+        return result
+
+
+def get_field_cache(resolver: Optional[GraphQLFieldResolver]) -> Optional[FieldCache]:
+    return getattr(resolver, "__field_cache__", None)
+
+
+def get_source_id(source: Any) -> Any:
+    if isinstance(source, dict):
+        return source.get("id")
+    return getattr(source, "id", None)
+
+
+def get_request_backend(
+    field_cache: FieldCache, context: Any
+) -> Optional[CacheBackend]:
+    if isinstance(context, dict):
+        caches = context.get(CONTEXT_KEY)
+        if caches is None:
+            caches = context[CONTEXT_KEY] = {}
+    else:
+        caches = getattr(context, CONTEXT_KEY, None)
+        if caches is None:
+            caches = {}
+            try:
+                setattr(context, CONTEXT_KEY, caches)
+            except (AttributeError, TypeError):
+                return None  # Context can't store caches, skip caching
+
+    backend = caches.get(field_cache)
+    if backend is None:
+        backend = caches[field_cache] = InMemoryCacheBackend(field_cache.max_entries)
+    return backend
@@ -0,0 +1,47 @@
+import hashlib
+import sys
+from typing import Iterable, List, Type
+
+from graphql import version as graphql_version
+
+from .bases import DefinitionType
+
+FINGERPRINT_VERSION = "1"
+
+
+def fingerprint_schema(
+    type_defs: List[Type[DefinitionType]],
+    sdl_strings: List[str],
+    merge_roots: bool,
+    directives_names: Iterable[str],
+) -> str:
+    fingerprint = hashlib.sha256()
+
+    def update(*values: str):
+        for value in values:
+            data = value.encode("utf-8")
+            # Length prefix prevents "ab" + "c" and "a" + "bc" from colliding
+            fingerprint.update(b"%d:" % len(data))
+            fingerprint.update(data)
+
+    update(
+        FINGERPRINT_VERSION,
+        graphql_version,
+        "%d.%d" % sys.version_info[:2],
+        "merge_roots" if merge_roots else "no_merge_roots",
+    )
+
+    for type_def in type_defs:
+        if not isinstance(type_def.__schema__, str):
+            # Lazy types are fingerprinted before their schema is validated
+            raise TypeError(
+                f"{type_def.__name__} class was defined with __schema__ of "
+                f"invalid type: {type(type_def.__schema__).__name__}"
+            )
+        update("type", type_def.__schema__)
+    for sdl in sdl_strings:
+        update("sdl", sdl)
+    for directive_name in sorted(directives_names):
+        update("directive", directive_name)
+
+    return fingerprint.hexdigest()
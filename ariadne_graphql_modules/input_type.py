@@ -1,4 +1,5 @@
-from typing import Callable, Dict, Optional, Union, cast
+from inspect import Parameter, signature
+from typing import Any, Callable, Dict, List, Optional, Union, cast
 
 from graphql import (
     DefinitionNode,
@@ -9,17 +10,19 @@ from graphql import (
 from .bases import BindableType
 from .dependencies import Dependencies, get_dependencies_from_input_type
 from .types import InputFieldsDict, RequirementsDict
-from .utils import parse_definition
 
 Args = Dict[str, str]
+ModelConverter = Callable[[Dict[str, Any]], Any]
 InputNodeType = Union[InputObjectTypeDefinitionNode, InputObjectTypeExtensionNode]
 
 
 class InputType(BindableType):
     __abstract__ = True
     __args__: Optional[Union[Args, Callable[..., Args]]] = None
+    __model__: Optional[Callable[..., Any]] = None
 
     graphql_fields: InputFieldsDict
+    model_converter: Optional[ModelConverter] = None
 
     def __init_subclass__(cls) -> None:
         super().__init_subclass__()
@@ -28,13 +31,18 @@ class InputType(BindableType):
             return
 
         cls.__abstract__ = False
+        cls.__prepared__ = False
 
-        graphql_def = cls.__validate_schema__(
-            parse_definition(cls.__name__, cls.__schema__)
-        )
+        if not cls.__lazy__:
+            cls.__prepare_type__()
+
+    @classmethod
+    def __setup_type__(cls, type_def: DefinitionNode, validate: bool = True):
+        graphql_def = cls.__validate_schema__(type_def)
 
         cls.graphql_name = graphql_def.name.value
         cls.graphql_type = type(graphql_def)
+        cls.graphql_def = graphql_def
         cls.graphql_fields = cls.__get_fields__(graphql_def)
 
         if callable(cls.__args__):
@@ -42,12 +50,19 @@ class InputType(BindableType):
             cls.__args__ = cls.__args__(object_fields=cls.graphql_fields)
 
         cls.__validate_args__()
+        cls.__validate_model__()
 
-        requirements = cls.__get_requirements__()
-        cls.__validate_requirements_contain_extended_type__(graphql_def, requirements)
+        if cls.__model__:
+            cls.model_converter = cls.__get_model_converter__()
+
+        if validate:
+            requirements = cls.__get_requirements__()
+            cls.__validate_requirements_contain_extended_type__(
+                graphql_def, requirements
+            )
 
-        dependencies = cls.__get_dependencies__(graphql_def)
-        cls.__validate_requirements__(requirements, dependencies)
+            dependencies = cls.__get_dependencies__(graphql_def)
+            cls.__validate_requirements__(requirements, dependencies)
 
     @classmethod
     def __validate_schema__(cls, type_def: DefinitionNode) -> InputNodeType:
@@ -104,15 +119,88 @@ class InputType(BindableType):
                 f"GraphQL input: {', '.join(invalid_args)}"
             )
 
+    @classmethod
+    def __validate_model__(cls):
+        if cls.__model__ is None:
+            return
+
+        if not callable(cls.__model__):
+            raise TypeError(
+                f"{cls.__name__} class was defined with __model__ that is not "
+                f"callable: {type(cls.__model__).__name__}"
+            )
+
+        parameters = get_model_parameters(cls.__model__)
+        if parameters is None or any(
+            parameter.kind == Parameter.VAR_KEYWORD for parameter in parameters
+        ):
+            return
+
+        invalid_names = set(cls.__get_out_names__()) - {
+            parameter.name
+            for parameter in parameters
+            if parameter.kind
+            in (Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY)
+        }
+        if invalid_names:
+            raise ValueError(
+                f"{cls.__name__} class was defined with __model__ that doesn't "
+                f"accept following fields: {', '.join(invalid_names)}"
+            )
+
+    @classmethod
+    def __get_out_names__(cls) -> Dict[str, str]:
+        args = cast(Optional[Args], cls.__args__) or {}
+        return {
+            args.get(field_name, field_name): field_name
+            for field_name in cls.graphql_fields
+        }
+
+    @classmethod
+    def __get_model_converter__(cls) -> ModelConverter:
+        model = cast(Callable[..., Any], cls.__model__)
+
+        # Model's arguments without defaults are set to None for omitted fields
+        out_names = cls.__get_out_names__()
+        missing_values: Dict[str, Any] = {}
+        for parameter in get_model_parameters(model) or []:
+            if (
+                parameter.name in out_names
+                and parameter.default is Parameter.empty
+                and parameter.kind != Parameter.VAR_KEYWORD
+            ):
+                missing_values[parameter.name] = None
+
+        if not missing_values:
+
+            def convert_to_model(value: Dict[str, Any]) -> Any:
+                return model(**value)  # pylint: disable=not-callable
+
+            return convert_to_model
+
+        def convert_to_model_with_missing_values(value: Dict[str, Any]) -> Any:
+            return model(**{**missing_values, **value})  # pylint: disable=not-callable
+
+        return convert_to_model_with_missing_values
+
     @classmethod
     def __get_dependencies__(cls, type_def: InputNodeType) -> Dependencies:
         return get_dependencies_from_input_type(type_def)
 
     @classmethod
     def __bind_to_schema__(cls, schema):
-        if not cls.__args__:
-            return
-
         graphql_type = schema.type_map.get(cls.graphql_name)
-        for field_name, field_target in cls.__args__.items():
-            graphql_type.fields[field_name].out_name = field_target
+
+        if cls.__args__:
+            for field_name, field_target in cls.__args__.items():
+                graphql_type.fields[field_name].out_name = field_target
+
+        if cls.model_converter:
+            graphql_type.out_type = cls.model_converter
+
+
+def get_model_parameters(model: Callable[..., Any]) -> Optional[List[Parameter]]:
+    try:
+        return list(signature(model).parameters.values())
+    except (TypeError, ValueError):
+        return None  # Signature of some builtins and C types can't be read
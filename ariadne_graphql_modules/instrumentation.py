@@ -0,0 +1,217 @@
+from bisect import bisect_left
+from functools import wraps
+from inspect import isawaitable
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+from graphql import GraphQLInterfaceType, GraphQLObjectType, GraphQLSchema
+
+from .bases import DefinitionType
+from .mutation_type import MutationType
+from .resolvers_mixin import ResolversMixin
+from .subscription_type import SubscriptionType
+
+# Upper bounds of histogram buckets in seconds, last bucket is unbounded
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+RESOLVE = "resolve"
+SUBSCRIBE = "subscribe"
+
+ResolverKey = Tuple[str, str, str]
+
+
+class ResolverStats:
+    type_name: str
+    field_name: str
+    class_name: str
+    kind: str
+    buckets: Sequence[float]
+
+    count: int
+    errors: int
+    total_time: float
+    histogram: List[int]
+
+    def __init__(
+        self,
+        type_name: str,
+        field_name: str,
+        class_name: str,
+        kind: str,
+        buckets: Sequence[float],
+    ):
+        self.type_name = type_name
+        self.field_name = field_name
+        self.class_name = class_name
+        self.kind = kind
+        self.buckets = buckets
+
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.histogram = [0] * (len(self.buckets) + 1)
+
+    @property
+    def average_time(self) -> float:
+        return self.total_time / self.count if self.count else 0.0
+
+    def record(self, time: float, error: bool = False):
+        self.count += 1
+        self.total_time += time
+        self.histogram[bisect_left(self.buckets, time)] += 1
+        if error:
+            self.errors += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "type": self.type_name,
+            "field": self.field_name,
+            "class": self.class_name,
+            "kind": self.kind,
+            "count": self.count,
+            "errors": self.errors,
+            "total_time": self.total_time,
+            "buckets": list(self.buckets),
+            "histogram": list(self.histogram),
+        }
+
+
+class ResolverInstrumentation:
+    """Records calls and latency of resolvers defined on types"""
+
+    buckets: Sequence[float]
+    resolvers: Dict[ResolverKey, ResolverStats]
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.resolvers = {}
+
+    def get_stats(
+        self, type_name: str, field_name: str, kind: str = RESOLVE
+    ) -> Optional[ResolverStats]:
+        return self.resolvers.get((type_name, field_name, kind))
+
+    def get_hot_resolvers(self, limit: int = 10) -> List[ResolverStats]:
+        return sorted(
+            self.resolvers.values(), key=lambda stats: stats.total_time, reverse=True
+        )[:limit]
+
+    def reset(self):
+        for stats in self.resolvers.values():
+            stats.reset()
+
+    def instrument_resolver(
+        self,
+        type_name: str,
+        field_name: str,
+        class_name: str,
+        resolver: Callable,
+        kind: str = RESOLVE,
+    ) -> Callable:
+        stats = ResolverStats(type_name, field_name, class_name, kind, self.buckets)
+        self.resolvers[(type_name, field_name, kind)] = stats
+
+        @wraps(resolver)
+        def instrumented_resolver(*args: Any, **kwargs: Any) -> Any:
+            start = perf_counter()
+            try:
+                result = resolver(*args, **kwargs)
+            except Exception:
+                stats.record(perf_counter() - start, error=True)
+                raise
+
+            if isawaitable(result):
+                return record_awaitable(result, start, stats)
+
+            stats.record(perf_counter() - start)
+            return result
+
+        return instrumented_resolver
+
+    def instrument_schema(
+        self, schema: GraphQLSchema, type_defs: Sequence[Type[DefinitionType]]
+    ):
+        # Wraps resolvers after they were bound to schema, so resolvers bound by
+        # interfaces to implementing types are recorded for those types
+        resolvers_classes = get_resolvers_classes(type_defs)
+        subscribers_classes = get_subscribers_classes(type_defs)
+
+        for graphql_type in schema.type_map.values():
+            if not isinstance(graphql_type, (GraphQLObjectType, GraphQLInterfaceType)):
+                continue
+
+            for field_name, field in graphql_type.fields.items():
+                if field.resolve in resolvers_classes:
+                    field.resolve = self.instrument_resolver(
+                        graphql_type.name,
+                        field_name,
+                        resolvers_classes[field.resolve],
+                        field.resolve,
+                    )
+
+                if field.subscribe in subscribers_classes:
+                    field.subscribe = self.instrument_resolver(
+                        graphql_type.name,
+                        field_name,
+                        subscribers_classes[field.subscribe],
+                        field.subscribe,
+                        SUBSCRIBE,
+                    )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "resolvers": [stats.as_dict() for stats in self.resolvers.values()],
+        }
+
+
+async def record_awaitable(result: Any, start: float, stats: ResolverStats) -> Any:
+    try:
+        value = await result
+    except Exception:
+        stats.record(perf_counter() - start, error=True)
+        raise
+
+    stats.record(perf_counter() - start)
+    return value
+
+
+def get_resolvers_classes(
+    type_defs: Sequence[Type[DefinitionType]],
+) -> Dict[Callable, str]:
+    resolvers_classes: Dict[Callable, str] = {}
+    for type_ in type_defs:
+        if issubclass(type_, ResolversMixin):
+            for resolver in type_.resolvers.values():
+                resolvers_classes.setdefault(resolver, type_.__name__)
+        if issubclass(type_, MutationType):
+            resolvers_classes.setdefault(type_.mutation_resolver, type_.__name__)
+    return resolvers_classes
+
+
+def get_subscribers_classes(
+    type_defs: Sequence[Type[DefinitionType]],
+) -> Dict[Callable, str]:
+    subscribers_classes: Dict[Callable, str] = {}
+    for type_ in type_defs:
+        if issubclass(type_, SubscriptionType):
+            for subscriber in type_.subscribers.values():
+                subscribers_classes.setdefault(subscriber, type_.__name__)
+    return subscribers_classes
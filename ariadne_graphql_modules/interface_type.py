@@ -1,4 +1,5 @@
-from typing import Dict, Callable, Type, Union, cast
+from itertools import chain
+from typing import Dict, Callable, Iterable, Type, Union, cast
 
 from graphql import (
     DefinitionNode,
@@ -11,13 +12,12 @@ from graphql import (
     InterfaceTypeExtensionNode,
 )
 
-from ariadne import type_implements_interface
-
 from .bases import BindableType
 from .dependencies import Dependencies, get_dependencies_from_object_type
+from .field_cache import get_field_cache
 from .resolvers_mixin import ResolversMixin
 from .types import FieldsDict, RequirementsDict
-from .utils import parse_definition
+from .utils import is_default_resolver
 
 InterfaceNodeType = Union[InterfaceTypeDefinitionNode, InterfaceTypeExtensionNode]
 
@@ -40,20 +40,28 @@ class InterfaceType(BindableType, ResolversMixin):
             return
 
         cls.__abstract__ = False
+        cls.__prepared__ = False
+
+        if not cls.__lazy__:
+            cls.__prepare_type__()
 
-        graphql_def = cls.__validate_schema__(
-            parse_definition(cls.__name__, cls.__schema__)
-        )
+    @classmethod
+    def __setup_type__(cls, type_def: DefinitionNode, validate: bool = True):
+        graphql_def = cls.__validate_schema__(type_def)
 
         cls.graphql_name = graphql_def.name.value
         cls.graphql_type = type(graphql_def)
+        cls.graphql_def = graphql_def
         cls.graphql_fields = cls.__get_fields__(graphql_def)
 
-        requirements = cls.__get_requirements__()
-        cls.__validate_requirements_contain_extended_type__(graphql_def, requirements)
+        if validate:
+            requirements = cls.__get_requirements__()
+            cls.__validate_requirements_contain_extended_type__(
+                graphql_def, requirements
+            )
 
-        dependencies = cls.__get_dependencies__(graphql_def)
-        cls.__validate_requirements__(requirements, dependencies)
+            dependencies = cls.__get_dependencies__(graphql_def)
+            cls.__validate_requirements__(requirements, dependencies)
 
         if callable(cls.__fields_args__):
             cls.__fields_args__ = cls.__fields_args__(fields_args=cls.graphql_fields)
@@ -64,6 +72,10 @@ class InterfaceType(BindableType, ResolversMixin):
             cls.__aliases__ = cls.__aliases__(object_fields=cls.graphql_fields)
 
         cls.__validate_aliases__()
+        cls.__validate_source__()
+        cls.__validate_cache__()
+        cls.__validate_costs__()
+
         cls.resolvers = cls.__get_resolvers__()
 
     @classmethod
@@ -126,11 +138,23 @@ class InterfaceType(BindableType, ResolversMixin):
         graphql_type = cast(GraphQLInterfaceType, schema.type_map.get(cls.graphql_name))
         graphql_type.resolve_type = cls.resolve_type
 
-        for type_ in schema.type_map.values():
-            if not type_implements_interface(cls.graphql_name, type_):
-                continue
-
-            type_ = cast(GraphQLObjectType, type_)
+        # Schema computes map of interfaces implementations once on creation,
+        # avoiding scan of all schema types for every interface
+        implementations = schema.get_implementations(graphql_type)
+        implementing_types: Iterable[Union[GraphQLObjectType, GraphQLInterfaceType]]
+        implementing_types = chain(implementations.objects, implementations.interfaces)
+        for type_ in implementing_types:
             for field_name, field_resolver in cls.resolvers.items():
-                if not type_.fields[field_name].resolve:
-                    type_.fields[field_name].resolve = field_resolver
+                field_resolve = type_.fields[field_name].resolve
+                if not field_resolve or (
+                    is_default_resolver(field_resolve)
+                    and not is_default_resolver(field_resolver)
+                ):
+                    # Default resolver replaced by interface keeps its cache
+                    field_cache = get_field_cache(field_resolve)
+                    if field_cache and not get_field_cache(field_resolver):
+                        type_.fields[field_name].resolve = field_cache.wrap_resolver(
+                            field_name, field_resolver
+                        )
+                    else:
+                        type_.fields[field_name].resolve = field_resolver
@@ -9,9 +9,10 @@ from graphql import (
 )
 
 from .bases import BindableType
+from .blocking import create_blocking_resolver, is_type_resolver_blocking
+from .cost_analysis import FieldCost, get_field_cost
 from .dependencies import Dependencies, get_dependencies_from_object_type
 from .types import RequirementsDict
-from .utils import parse_definition
 
 MutationArgs = Dict[str, str]
 ObjectNodeType = Union[ObjectTypeDefinitionNode, ObjectTypeExtensionNode]
@@ -20,11 +21,13 @@ ObjectNodeType = Union[ObjectTypeDefinitionNode, ObjectTypeExtensionNode]
 class MutationType(BindableType):
     __abstract__ = True
     __args__: Optional[Union[MutationArgs, Callable[..., MutationArgs]]] = None
+    __cost__: Optional[Union[int, FieldCost]] = None
 
     graphql_name = "Mutation"
     graphql_type: Union[Type[ObjectTypeDefinitionNode], Type[ObjectTypeExtensionNode]]
 
     mutation_name: str
+    mutation_resolver: GraphQLFieldResolver
     resolve_mutation: GraphQLFieldResolver
 
     def __init_subclass__(cls) -> None:
@@ -34,31 +37,41 @@ class MutationType(BindableType):
             return
 
         cls.__abstract__ = False
+        cls.__prepared__ = False
 
-        graphql_def = cls.__validate_schema__(
-            parse_definition(cls.__name__, cls.__schema__)
-        )
+        if not cls.__lazy__:
+            cls.__prepare_type__()
+
+    @classmethod
+    def __setup_type__(cls, type_def: DefinitionNode, validate: bool = True):
+        graphql_def = cls.__validate_schema__(type_def)
 
         cls.graphql_name = graphql_def.name.value
         cls.graphql_type = type(graphql_def)
+        cls.graphql_def = graphql_def
 
         field = cls.__get_field__(graphql_def)
         cls.mutation_name = field.name.value
 
-        requirements = cls.__get_requirements__()
-        cls.__validate_requirements_contain_extended_type__(graphql_def, requirements)
+        if validate:
+            requirements = cls.__get_requirements__()
+            cls.__validate_requirements_contain_extended_type__(
+                graphql_def, requirements
+            )
 
-        dependencies = cls.__get_dependencies__(graphql_def)
-        cls.__validate_requirements__(requirements, dependencies)
+            dependencies = cls.__get_dependencies__(graphql_def)
+            cls.__validate_requirements__(requirements, dependencies)
 
         if callable(cls.__args__):
             # pylint: disable=not-callable
             cls.__args__ = cls.__args__(field_args=field)
 
         cls.__validate_args__(field)
-
+        cls.__validate_cost__(field)
         cls.__validate_resolve_mutation__()
 
+        cls.mutation_resolver = cls.__get_mutation_resolver__()
+
     @classmethod
     def __validate_schema__(cls, type_def: DefinitionNode) -> ObjectNodeType:
         if not isinstance(
@@ -130,6 +143,35 @@ class MutationType(BindableType):
                 f"'{field.name.value}' GraphQL field: {', '.join(invalid_args)}"
             )
 
+    @classmethod
+    def __validate_cost__(cls, field: FieldDefinitionNode):
+        if cls.__cost__ is None:
+            return
+
+        if isinstance(cls.__cost__, bool) or not isinstance(
+            cls.__cost__, (int, FieldCost)
+        ):
+            raise TypeError(
+                f"{cls.__name__} class was defined with __cost__ that is not "
+                f"an int or FieldCost instance: {type(cls.__cost__).__name__}"
+            )
+
+        if isinstance(cls.__cost__, FieldCost):
+            field_args = [arg.name.value for arg in field.arguments]
+            invalid_args = set(cls.__cost__.multipliers) - set(field_args)
+            if invalid_args:
+                raise ValueError(
+                    f"{cls.__name__} class was defined with cost multipliers not on "
+                    f"'{field.name.value}' GraphQL field: {', '.join(invalid_args)}"
+                )
+
+    @classmethod
+    def __get_costs__(cls) -> Dict[str, FieldCost]:
+        if cls.__cost__ is None:
+            return {}
+
+        return {cls.mutation_name: get_field_cost(cls.__cost__)}
+
     @classmethod
     def __validate_resolve_mutation__(cls):
         resolver = getattr(cls, "resolve_mutation", None)
@@ -145,10 +187,17 @@ class MutationType(BindableType):
                 "'resolve_mutation' but it's not callable"
             )
 
+    @classmethod
+    def __get_mutation_resolver__(cls) -> GraphQLFieldResolver:
+        resolver = cls.resolve_mutation
+        if is_type_resolver_blocking(cls, resolver):
+            return create_blocking_resolver(cls, resolver)
+        return resolver
+
     @classmethod
     def __bind_to_schema__(cls, schema):
         graphql_type = schema.type_map.get(cls.graphql_name)
-        graphql_type.fields[cls.mutation_name].resolve = cls.resolve_mutation
+        graphql_type.fields[cls.mutation_name].resolve = cls.mutation_resolver
 
         if cls.__args__:
             field_args = graphql_type.fields[cls.mutation_name].args
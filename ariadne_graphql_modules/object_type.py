@@ -9,9 +9,10 @@ from graphql import (
 
 from .bases import BindableType
 from .dependencies import Dependencies, get_dependencies_from_object_type
+from .field_cache import get_field_cache
 from .resolvers_mixin import ResolversMixin
 from .types import FieldsDict, RequirementsDict
-from .utils import parse_definition
+from .utils import create_source_resolver, is_default_resolver, mark_default_resolver
 
 ObjectNodeType = Union[ObjectTypeDefinitionNode, ObjectTypeExtensionNode]
 
@@ -31,20 +32,28 @@ class ObjectType(BindableType, ResolversMixin):
             return
 
         cls.__abstract__ = False
+        cls.__prepared__ = False
 
-        graphql_def = cls.__validate_schema__(
-            parse_definition(cls.__name__, cls.__schema__)
-        )
+        if not cls.__lazy__:
+            cls.__prepare_type__()
+
+    @classmethod
+    def __setup_type__(cls, type_def: DefinitionNode, validate: bool = True):
+        graphql_def = cls.__validate_schema__(type_def)
 
         cls.graphql_name = graphql_def.name.value
         cls.graphql_type = type(graphql_def)
+        cls.graphql_def = graphql_def
         cls.graphql_fields = cls.__get_fields__(graphql_def)
 
-        requirements = cls.__get_requirements__()
-        cls.__validate_requirements_contain_extended_type__(graphql_def, requirements)
+        if validate:
+            requirements = cls.__get_requirements__()
+            cls.__validate_requirements_contain_extended_type__(
+                graphql_def, requirements
+            )
 
-        dependencies = cls.__get_dependencies__(graphql_def)
-        cls.__validate_requirements__(requirements, dependencies)
+            dependencies = cls.__get_dependencies__(graphql_def)
+            cls.__validate_requirements__(requirements, dependencies)
 
         if callable(cls.__fields_args__):
             cls.__fields_args__ = cls.__fields_args__(fields_args=cls.graphql_fields)
@@ -55,6 +64,10 @@ class ObjectType(BindableType, ResolversMixin):
             cls.__aliases__ = cls.__aliases__(object_fields=cls.graphql_fields)
 
         cls.__validate_aliases__()
+        cls.__validate_source__()
+        cls.__validate_cache__()
+        cls.__validate_costs__()
+
         cls.resolvers = cls.__get_resolvers__()
 
     @classmethod
@@ -117,7 +130,27 @@ class ObjectType(BindableType, ResolversMixin):
         graphql_type = schema.type_map.get(cls.graphql_name)
 
         for field_name, field_resolver in cls.resolvers.items():
-            graphql_type.fields[field_name].resolve = field_resolver
+            graphql_field = graphql_type.fields[field_name]
+            if not graphql_field.resolve or not is_default_resolver(field_resolver):
+                graphql_field.resolve = field_resolver
+                continue
+
+            # Resolver bound by interface is used with cache of field
+            field_cache = get_field_cache(field_resolver)
+            if field_cache and not get_field_cache(graphql_field.resolve):
+                graphql_field.resolve = field_cache.wrap_resolver(
+                    field_name, graphql_field.resolve
+                )
+
+        if cls.__source__:
+            # Fields from other types (eg. extensions) resolve from same source
+            for field_name, graphql_field in graphql_type.fields.items():
+                if not graphql_field.resolve:
+                    graphql_field.resolve = mark_default_resolver(
+                        create_source_resolver(
+                            cls.__source__, field_name, cls.__source_callables__
+                        )
+                    )
 
         if cls.__fields_args__:
             for field_name, field_args_mappings in cls.__fields_args__.items():
@@ -2,8 +2,16 @@ from typing import Callable, Dict, Optional, Union
 
 from graphql import GraphQLFieldResolver
 
+from .batch_loaders import create_batch_resolver
+from .blocking import create_blocking_resolver, is_type_resolver_blocking
+from .cost_analysis import FieldCost, FieldCosts, get_field_cost
+from .field_cache import FieldCache
 from .types import FieldsDict
-from .utils import create_alias_resolver
+from .utils import (
+    create_alias_resolver,
+    create_source_resolver,
+    mark_default_resolver,
+)
 
 Aliases = Dict[str, str]
 FieldsArgs = Dict[str, Dict[str, str]]
@@ -14,6 +22,12 @@ class ResolversMixin:
 
     __aliases__: Optional[Union[Aliases, Callable[..., Aliases]]] = None
     __fields_args__: Optional[Union[FieldsArgs, Callable[..., FieldsArgs]]] = None
+    __source__: Optional[type] = None
+    __source_callables__: bool = False
+    __cache__: Optional[Dict[str, FieldCache]] = None
+    __costs__: Optional[FieldCosts] = None
+
+    __blocking__: bool
 
     graphql_name: str
     graphql_fields: FieldsDict
@@ -32,6 +46,77 @@ class ResolversMixin:
                 f"GraphQL type: {', '.join(invalid_aliases)}"
             )
 
+    @classmethod
+    def __validate_source__(cls):
+        if cls.__source__ is not None and not isinstance(cls.__source__, type):
+            raise TypeError(
+                f"{cls.__name__} class was defined with __source__ that is not "
+                f"a type: {type(cls.__source__).__name__}"
+            )
+
+    @classmethod
+    def __validate_cache__(cls):
+        if not cls.__cache__:
+            return
+
+        invalid_fields = set(cls.__cache__) - set(cls.graphql_fields)
+        if invalid_fields:
+            raise ValueError(
+                f"{cls.__name__} class was defined with cache for fields not in "
+                f"GraphQL type: {', '.join(invalid_fields)}"
+            )
+
+        for field_name, field_cache in cls.__cache__.items():
+            if not isinstance(field_cache, FieldCache):
+                raise TypeError(
+                    f"{cls.__name__} class was defined with cache for "
+                    f"'{field_name}' field that is not a FieldCache instance: "
+                    f"{type(field_cache).__name__}"
+                )
+
+    @classmethod
+    def __validate_costs__(cls):
+        if not cls.__costs__:
+            return
+
+        invalid_fields = set(cls.__costs__) - set(cls.graphql_fields)
+        if invalid_fields:
+            raise ValueError(
+                f"{cls.__name__} class was defined with costs for fields not in "
+                f"GraphQL type: {', '.join(invalid_fields)}"
+            )
+
+        for field_name, field_cost in cls.__costs__.items():
+            if isinstance(field_cost, bool) or not isinstance(
+                field_cost, (int, FieldCost)
+            ):
+                raise TypeError(
+                    f"{cls.__name__} class was defined with cost for "
+                    f"'{field_name}' field that is not an int or FieldCost "
+                    f"instance: {type(field_cost).__name__}"
+                )
+
+            if isinstance(field_cost, FieldCost):
+                defined_args = [
+                    arg.name.value for arg in cls.graphql_fields[field_name].arguments
+                ]
+                invalid_args = set(field_cost.multipliers) - set(defined_args)
+                if invalid_args:
+                    raise ValueError(
+                        f"{cls.__name__} class was defined with cost multipliers "
+                        f"not in '{field_name}' field: {', '.join(invalid_args)}"
+                    )
+
+    @classmethod
+    def __get_costs__(cls) -> Dict[str, FieldCost]:
+        if not cls.__costs__:
+            return {}
+
+        return {
+            field_name: get_field_cost(field_cost)
+            for field_name, field_cost in cls.__costs__.items()
+        }
+
     @classmethod
     def __validate_fields_args__(cls):
         if not cls.__fields_args__:
@@ -59,8 +144,11 @@ class ResolversMixin:
     def __get_resolvers__(cls):
         aliases = cls.__aliases__ or {}
         defined_resolvers = cls.__get_defined_resolvers__()
+        defined_batch_resolvers = cls.__get_defined_batch_resolvers__()
 
         used_resolvers = []
+        used_batch_resolvers = []
+        defined_fields = []
         resolvers = {}
 
         for field_name in cls.graphql_fields:
@@ -68,24 +156,64 @@ class ResolversMixin:
                 resolver_name = aliases[field_name]
                 if resolver_name in defined_resolvers:
                     used_resolvers.append(resolver_name)
+                    defined_fields.append(field_name)
                     resolvers[field_name] = defined_resolvers[resolver_name]
+                elif resolver_name in defined_batch_resolvers:
+                    used_batch_resolvers.append(resolver_name)
+                    resolvers[field_name] = create_batch_resolver(
+                        cls.__name__, defined_batch_resolvers[resolver_name]
+                    )
+                elif cls.__source__:
+                    resolvers[field_name] = create_source_resolver(
+                        cls.__source__, resolver_name, cls.__source_callables__
+                    )
                 else:
                     resolvers[field_name] = create_alias_resolver(resolver_name)
 
             elif field_name in defined_resolvers:
                 used_resolvers.append(field_name)
+                defined_fields.append(field_name)
                 resolvers[field_name] = defined_resolvers[field_name]
 
+            elif field_name in defined_batch_resolvers:
+                used_batch_resolvers.append(field_name)
+                resolvers[field_name] = create_batch_resolver(
+                    cls.__name__, defined_batch_resolvers[field_name]
+                )
+
+            elif cls.__source__:
+                resolvers[field_name] = mark_default_resolver(
+                    create_source_resolver(
+                        cls.__source__, field_name, cls.__source_callables__
+                    )
+                )
+
         unused_resolvers = [
             f"resolve_{field_name}"
             for field_name in set(defined_resolvers) - set(used_resolvers)
         ]
+        unused_resolvers += [
+            f"batch_resolve_{field_name}"
+            for field_name in set(defined_batch_resolvers) - set(used_batch_resolvers)
+        ]
         if unused_resolvers:
             raise ValueError(
                 f"{cls.__name__} class was defined with resolvers for fields not in "
                 f"GraphQL type: {', '.join(unused_resolvers)}"
             )
 
+        for field_name in defined_fields:
+            if is_type_resolver_blocking(cls, resolvers[field_name]):
+                resolvers[field_name] = create_blocking_resolver(
+                    cls, resolvers[field_name]
+                )
+
+        if cls.__cache__:
+            for field_name, field_cache in cls.__cache__.items():
+                resolvers[field_name] = field_cache.wrap_resolver(
+                    field_name, resolvers.get(field_name)
+                )
+
         return resolvers
 
     @classmethod
@@ -100,3 +228,16 @@ class ResolversMixin:
                 resolvers[name[8:]] = value
 
         return resolvers
+
+    @classmethod
+    def __get_defined_batch_resolvers__(cls) -> Dict[str, Callable]:
+        resolvers = {}
+        for name in dir(cls):
+            if not name.startswith("batch_resolve_"):
+                continue
+
+            value = getattr(cls, name)
+            if callable(value):
+                resolvers[name[14:]] = value
+
+        return resolvers
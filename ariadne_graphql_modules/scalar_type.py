@@ -1,4 +1,4 @@
-from typing import Optional, Type, Union, cast
+from typing import Any, Callable, List, Optional, Type, Union, cast
 
 from graphql import (
     DefinitionNode,
@@ -13,7 +13,6 @@ from graphql import (
 
 from .bases import BindableType
 from .types import RequirementsDict
-from .utils import parse_definition
 
 ScalarNodeType = Union[ScalarTypeDefinitionNode, ScalarTypeExtensionNode]
 
@@ -26,6 +25,7 @@ class ScalarType(BindableType):
     serialize: Optional[GraphQLScalarSerializer] = None
     parse_value: Optional[GraphQLScalarValueParser] = None
     parse_literal: Optional[GraphQLScalarLiteralParser] = None
+    serialize_many: Optional[Callable[[List[Any]], List[Any]]] = None
 
     def __init_subclass__(cls) -> None:
         super().__init_subclass__()
@@ -34,16 +34,24 @@ class ScalarType(BindableType):
             return
 
         cls.__abstract__ = False
+        cls.__prepared__ = False
 
-        graphql_def = cls.__validate_schema__(
-            parse_definition(cls.__name__, cls.__schema__)
-        )
+        if not cls.__lazy__:
+            cls.__prepare_type__()
+
+    @classmethod
+    def __setup_type__(cls, type_def: DefinitionNode, validate: bool = True):
+        graphql_def = cls.__validate_schema__(type_def)
 
         cls.graphql_name = graphql_def.name.value
         cls.graphql_type = type(graphql_def)
+        cls.graphql_def = graphql_def
 
-        requirements = cls.__get_requirements__()
-        cls.__validate_requirements_contain_extended_type__(graphql_def, requirements)
+        if validate:
+            requirements = cls.__get_requirements__()
+            cls.__validate_requirements_contain_extended_type__(
+                graphql_def, requirements
+            )
 
     @classmethod
     def __validate_schema__(cls, type_def: DefinitionNode) -> ScalarNodeType:
@@ -84,7 +92,22 @@ class ScalarType(BindableType):
         # See mypy bug https://github.com/python/mypy/issues/2427
         if cls.serialize:
             graphql_type.serialize = cls.serialize  # type: ignore
+        elif cls.serialize_many:
+            graphql_type.serialize = create_serializer(cls.serialize_many)  # type: ignore
         if cls.parse_value:
             graphql_type.parse_value = cls.parse_value  # type: ignore
         if cls.parse_literal:
             graphql_type.parse_literal = cls.parse_literal  # type: ignore
+
+        if cls.serialize_many:
+            # Used by SerializeManyExecutionContext to serialize lists of values
+            graphql_type.serialize_many = cls.serialize_many  # type: ignore
+
+
+def create_serializer(
+    serialize_many: Callable[[List[Any]], List[Any]]
+) -> GraphQLScalarSerializer:
+    def serialize(value: Any) -> Any:
+        return serialize_many([value])[0]
+
+    return serialize
@@ -0,0 +1,68 @@
+import os
+import pickle
+import tempfile
+from typing import Optional, Union
+
+from graphql import DocumentNode
+
+
+class SchemaCache:
+    """Storage for validated GraphQL documents keyed by schema fingerprint"""
+
+    hits: int
+    misses: int
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[DocumentNode]:
+        document = self.load(key)
+        if document is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return document
+
+    def load(self, key: str) -> Optional[DocumentNode]:
+        raise NotImplementedError()
+
+    def save(self, key: str, document: DocumentNode):
+        raise NotImplementedError()
+
+
+class FileSystemSchemaCache(SchemaCache):
+    """Stores validated GraphQL documents as pickle files in cache directory"""
+
+    path: str
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]):
+        super().__init__()
+        self.path = os.fspath(path)
+
+    def get_file_path(self, key: str) -> str:
+        return os.path.join(self.path, f"{key}.pickle")
+
+    def load(self, key: str) -> Optional[DocumentNode]:
+        try:
+            with open(self.get_file_path(key), "rb") as fp:
+                document = pickle.load(fp)
+        except Exception:  # Missing, corrupted or incompatible cache file
+            return None
+
+        if not isinstance(document, DocumentNode):
+            return None
+
+        return document
+
+    def save(self, key: str, document: DocumentNode):
+        os.makedirs(self.path, exist_ok=True)
+
+        # Write to temporary file first so concurrent processes never read
+        # partially written cache file
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=self.path, suffix=".tmp", delete=False
+        ) as fp:
+            pickle.dump(document, fp, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(fp.name, self.get_file_path(key))
@@ -0,0 +1,98 @@
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+
+class PhaseStats:
+    name: str
+    time: float
+    count: Optional[int]
+
+    def __init__(self, name: str):
+        self.name = name
+        self.time = 0.0
+        self.count = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "time": self.time, "count": self.count}
+
+
+class SchemaBuildStats:
+    """Collects wall time and counts of make_executable_schema phases"""
+
+    phases: List[PhaseStats]
+    bind_times: Dict[str, float]
+    on_phase: Optional[Callable[[PhaseStats], None]]
+
+    def __init__(self, on_phase: Optional[Callable[[PhaseStats], None]] = None):
+        self.phases = []
+        self.bind_times = {}
+        self.on_phase = on_phase
+
+    @property
+    def total_time(self) -> float:
+        return sum(phase.time for phase in self.phases)
+
+    def get_phase(self, name: str) -> Optional[PhaseStats]:
+        for phase in self.phases:
+            if phase.name == name:
+                return phase
+        return None
+
+    def measure(self, name: str) -> "PhaseTimer":
+        return PhaseTimer(self, name)
+
+    def record_phase(self, phase: PhaseStats):
+        self.phases.append(phase)
+        if self.on_phase:
+            self.on_phase(phase)
+
+    def record_bind_time(self, type_name: str, time: float):
+        self.bind_times[type_name] = self.bind_times.get(type_name, 0.0) + time
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "total_time": self.total_time,
+            "phases": [phase.as_dict() for phase in self.phases],
+            "bind_times": dict(self.bind_times),
+        }
+
+
+class PhaseTimer:
+    stats: SchemaBuildStats
+    phase: PhaseStats
+    start: float
+
+    def __init__(self, stats: SchemaBuildStats, name: str):
+        self.stats = stats
+        self.phase = PhaseStats(name)
+        self.start = 0.0
+
+    def __enter__(self) -> PhaseStats:
+        self.start = perf_counter()
+        return self.phase
+
+    def __exit__(self, *_):
+        self.phase.time = perf_counter() - self.start
+        self.stats.record_phase(self.phase)
+
+
+class NullPhaseTimer:
+    phase: PhaseStats
+
+    def __init__(self):
+        self.phase = PhaseStats("null")
+
+    def __enter__(self) -> PhaseStats:
+        return self.phase
+
+    def __exit__(self, *_):
+        pass
+
+
+NULL_PHASE_TIMER = NullPhaseTimer()
+
+
+def measure_phase(stats: Optional[SchemaBuildStats], name: str):
+    if stats is None:
+        return NULL_PHASE_TIMER
+    return stats.measure(name)
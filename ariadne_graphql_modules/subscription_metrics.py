@@ -0,0 +1,292 @@
+from inspect import isawaitable
+from time import perf_counter
+from typing import Any, AsyncIterator, Callable, Dict, Sequence, Tuple, Type
+
+from graphql import GraphQLObjectType, GraphQLResolveInfo, GraphQLSchema
+
+from .bases import DefinitionType
+from .delivery import queue_observer
+from .subscription_type import SubscriptionType
+
+
+class SubscriptionMetricsSink:
+    """Receives metrics of subscriptions, eg. to pass them to monitoring system
+
+    Methods are called for every subscription field of `SubscriptionType`
+    when sink is passed to `make_executable_schema`. Times are in seconds.
+    """
+
+    def subscription_started(
+        self, type_name: str, field_name: str, subscribe_time: float
+    ):
+        pass
+
+    def subscription_ended(
+        self, type_name: str, field_name: str, duration: float, events: int
+    ):
+        pass
+
+    def first_event(self, type_name: str, field_name: str, time_to_event: float):
+        pass
+
+    def event_emitted(self, type_name: str, field_name: str):
+        pass
+
+    def event_resolved(
+        self, type_name: str, field_name: str, resolve_time: float, error: bool
+    ):
+        pass
+
+    def queue_depth(self, type_name: str, field_name: str, depth: int):
+        pass
+
+
+class SubscriptionStats:
+    type_name: str
+    field_name: str
+
+    active: int
+    subscriptions: int
+    subscribe_time: float
+    first_events: int
+    first_event_time: float
+    events: int
+    resolved: int
+    resolve_errors: int
+    resolve_time: float
+    queue_depth: int
+    max_queue_depth: int
+    started: float
+
+    def __init__(self, type_name: str, field_name: str):
+        self.type_name = type_name
+        self.field_name = field_name
+        self.active = 0
+
+        self.reset()
+
+    def reset(self):
+        # Active subscriptions are kept, as they are still running
+        self.subscriptions = 0
+        self.subscribe_time = 0.0
+        self.first_events = 0
+        self.first_event_time = 0.0
+        self.events = 0
+        self.resolved = 0
+        self.resolve_errors = 0
+        self.resolve_time = 0.0
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.started = perf_counter()
+
+    @property
+    def average_subscribe_time(self) -> float:
+        return self.subscribe_time / self.subscriptions if self.subscriptions else 0.0
+
+    @property
+    def average_time_to_first_event(self) -> float:
+        return self.first_event_time / self.first_events if self.first_events else 0.0
+
+    @property
+    def average_resolve_time(self) -> float:
+        return self.resolve_time / self.resolved if self.resolved else 0.0
+
+    @property
+    def events_per_second(self) -> float:
+        elapsed = perf_counter() - self.started
+        return self.events / elapsed if elapsed else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "type": self.type_name,
+            "field": self.field_name,
+            "active": self.active,
+            "subscriptions": self.subscriptions,
+            "subscribe_time": self.subscribe_time,
+            "first_events": self.first_events,
+            "first_event_time": self.first_event_time,
+            "events": self.events,
+            "events_per_second": self.events_per_second,
+            "resolved": self.resolved,
+            "resolve_errors": self.resolve_errors,
+            "resolve_time": self.resolve_time,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+        }
+
+
+class SubscriptionMetrics(SubscriptionMetricsSink):
+    """Keeps metrics of subscriptions in memory"""
+
+    fields: Dict[Tuple[str, str], SubscriptionStats]
+
+    def __init__(self):
+        self.fields = {}
+
+    def get_stats(self, type_name: str, field_name: str) -> SubscriptionStats:
+        stats = self.fields.get((type_name, field_name))
+        if stats is None:
+            stats = self.fields[(type_name, field_name)] = SubscriptionStats(
+                type_name, field_name
+            )
+        return stats
+
+    def reset(self):
+        for stats in self.fields.values():
+            stats.reset()
+
+    def subscription_started(
+        self, type_name: str, field_name: str, subscribe_time: float
+    ):
+        stats = self.get_stats(type_name, field_name)
+        stats.active += 1
+        stats.subscriptions += 1
+        stats.subscribe_time += subscribe_time
+
+    def subscription_ended(
+        self, type_name: str, field_name: str, duration: float, events: int
+    ):
+        self.get_stats(type_name, field_name).active -= 1
+
+    def first_event(self, type_name: str, field_name: str, time_to_event: float):
+        stats = self.get_stats(type_name, field_name)
+        stats.first_events += 1
+        stats.first_event_time += time_to_event
+
+    def event_emitted(self, type_name: str, field_name: str):
+        self.get_stats(type_name, field_name).events += 1
+
+    def event_resolved(
+        self, type_name: str, field_name: str, resolve_time: float, error: bool
+    ):
+        stats = self.get_stats(type_name, field_name)
+        stats.resolved += 1
+        stats.resolve_time += resolve_time
+        if error:
+            stats.resolve_errors += 1
+
+    def queue_depth(self, type_name: str, field_name: str, depth: int):
+        stats = self.get_stats(type_name, field_name)
+        stats.queue_depth = depth
+        stats.max_queue_depth = max(stats.max_queue_depth, depth)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "subscriptions": [stats.as_dict() for stats in self.fields.values()],
+        }
+
+
+def instrument_subscriptions(
+    schema: GraphQLSchema,
+    type_defs: Sequence[Type[DefinitionType]],
+    sink: SubscriptionMetricsSink,
+):
+    for type_ in type_defs:
+        if not issubclass(type_, SubscriptionType):
+            continue
+
+        graphql_type = schema.type_map.get(type_.graphql_name)
+        if not isinstance(graphql_type, GraphQLObjectType):
+            continue
+
+        for field_name in type_.subscribers:
+            field = graphql_type.fields[field_name]
+            if field.subscribe:
+                field.subscribe = instrument_subscriber(
+                    sink, graphql_type.name, field_name, field.subscribe
+                )
+            if field.resolve:
+                field.resolve = instrument_event_resolver(
+                    sink, graphql_type.name, field_name, field.resolve
+                )
+
+
+def instrument_subscriber(
+    sink: SubscriptionMetricsSink,
+    type_name: str,
+    field_name: str,
+    subscriber: Callable,
+) -> Callable:
+    def observe_queue(depth: int):
+        sink.queue_depth(type_name, field_name, depth)
+
+    async def record_events(
+        source: Any, start: float, subscribe_time: float
+    ) -> AsyncIterator[Any]:
+        # Subscription is recorded as started when its events are first
+        # requested, so it's always recorded as ended when iterator is closed
+        sink.subscription_started(type_name, field_name, subscribe_time)
+
+        events = 0
+        try:
+            async for event in source:
+                if not events:
+                    sink.first_event(type_name, field_name, perf_counter() - start)
+                events += 1
+                sink.event_emitted(type_name, field_name)
+                yield event
+        finally:
+            aclose = getattr(source, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+            sink.subscription_ended(
+                type_name, field_name, perf_counter() - start, events
+            )
+
+    async def instrumented_subscriber(
+        obj: Any, info: GraphQLResolveInfo, **kwargs: Any
+    ) -> Any:
+        start = perf_counter()
+        token = queue_observer.set(observe_queue)
+        try:
+            source = subscriber(obj, info, **kwargs)
+        finally:
+            queue_observer.reset(token)
+
+        if isawaitable(source):
+            source = await source
+
+        return record_events(source, start, perf_counter() - start)
+
+    return instrumented_subscriber
+
+
+def instrument_event_resolver(
+    sink: SubscriptionMetricsSink,
+    type_name: str,
+    field_name: str,
+    resolver: Callable,
+) -> Callable:
+    def instrumented_resolver(*args: Any, **kwargs: Any) -> Any:
+        start = perf_counter()
+        try:
+            result = resolver(*args, **kwargs)
+        except Exception:
+            sink.event_resolved(type_name, field_name, perf_counter() - start, True)
+            raise
+
+        if isawaitable(result):
+            return record_resolved_awaitable(sink, type_name, field_name, result, start)
+
+        sink.event_resolved(type_name, field_name, perf_counter() - start, False)
+        return result
+
+    return instrumented_resolver
+
+
+async def record_resolved_awaitable(
+    sink: SubscriptionMetricsSink,
+    type_name: str,
+    field_name: str,
+    result: Any,
+    start: float,
+) -> Any:
+    try:
+        value = await result
+    except Exception:
+        sink.event_resolved(type_name, field_name, perf_counter() - start, True)
+        raise
+
+    sink.event_resolved(type_name, field_name, perf_counter() - start, False)
+    return value
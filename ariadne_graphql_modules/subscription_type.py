@@ -1,14 +1,27 @@
-from typing import Callable, Dict, Union, cast
+from string import Formatter
+from typing import Callable, Dict, Hashable, List, Optional, Union, cast
 
 from graphql import (
     DefinitionNode,
     GraphQLFieldResolver,
     GraphQLObjectType,
     GraphQLSchema,
+    ListTypeNode,
+    NonNullTypeNode,
     ObjectTypeDefinitionNode,
     ObjectTypeExtensionNode,
 )
 
+from .broadcast import Broadcaster, create_broadcast_subscriber
+from .broker import Broker, ChannelName, create_channel_subscriber
+from .delivery import (
+    BatchWindow,
+    DeliveryPolicy,
+    DeliveryStats,
+    TimeWindow,
+    create_batch_subscriber,
+    create_delivery_subscriber,
+)
 from .object_type import ObjectType
 
 ObjectNodeType = Union[ObjectTypeDefinitionNode, ObjectTypeExtensionNode]
@@ -16,16 +29,36 @@ ObjectNodeType = Union[ObjectTypeDefinitionNode, ObjectTypeExtensionNode]
 
 class SubscriptionType(ObjectType):
     __abstract__ = True
+    __broadcast__: Union[bool, List[str]] = False
+    __broadcast_queue_size__: int = 100
+    __broadcaster__: Optional[Broadcaster] = None
+    __broadcast_key__: Optional[Callable[..., Hashable]] = None
+    __delivery__: Optional[Dict[str, DeliveryPolicy]] = None
+    __channels__: Optional[Dict[str, ChannelName]] = None
+    __broker__: Optional[Broker] = None
+    __batches__: Optional[Dict[str, BatchWindow]] = None
 
     subscribers: Dict[str, GraphQLFieldResolver]
+    delivery_stats: Dict[str, DeliveryStats]
 
-    def __init_subclass__(cls) -> None:
-        super().__init_subclass__()
+    @classmethod
+    def __setup_type__(cls, type_def: DefinitionNode, validate: bool = True):
+        super().__setup_type__(type_def, validate)
+        cls.subscribers = cls.__get_subscribers__()
 
-        if cls.__dict__.get("__abstract__"):
-            return
+        cls.__validate_channels__()
+        cls.__validate_broadcast__()
+        cls.__validate_broadcast_key__()
+        cls.__validate_delivery__()
+        cls.__validate_batches__()
 
-        cls.subscribers = cls.__get_subscribers__()
+        cls.delivery_stats = {
+            field_name: DeliveryStats(cls.__name__, field_name)
+            for field_name in cls.__delivery__ or {}
+        }
+
+        if cls.__broadcast__ or cls.__delivery__ or cls.__channels__ or cls.__batches__:
+            cls.subscribers = cls.__get_wrapped_subscribers__()
 
     @classmethod
     def __validate_schema__(cls, type_def: DefinitionNode) -> ObjectNodeType:
@@ -76,6 +109,176 @@ class SubscriptionType(ObjectType):
 
         return subscribers
 
+    @classmethod
+    def __validate_channels__(cls):
+        if not cls.__channels__:
+            return
+
+        invalid_fields = set(cls.__channels__) - set(cls.graphql_fields)
+        if invalid_fields:
+            raise ValueError(
+                f"{cls.__name__} class was defined with channels for fields not in "
+                f"GraphQL type: {', '.join(invalid_fields)}"
+            )
+
+        subscribed_fields = set(cls.__channels__) & set(cls.subscribers)
+        if subscribed_fields:
+            raise ValueError(
+                f"{cls.__name__} class was defined with channels for fields "
+                f"with subscribers: {', '.join(subscribed_fields)}"
+            )
+
+        for field_name, channel in cls.__channels__.items():
+            if callable(channel):
+                continue
+
+            if not isinstance(channel, str):
+                raise TypeError(
+                    f"{cls.__name__} class was defined with channel for "
+                    f"'{field_name}' field that is not a str or callable: "
+                    f"{type(channel).__name__}"
+                )
+
+            field_args = [
+                arg.name.value for arg in cls.graphql_fields[field_name].arguments
+            ]
+            channel_args = [
+                name.split(".")[0].split("[")[0]
+                for _, name, _, _ in Formatter().parse(channel)
+                if name is not None
+            ]
+            invalid_args = set(channel_args) - set(field_args)
+            if invalid_args:
+                raise ValueError(
+                    f"{cls.__name__} class was defined with channel for "
+                    f"'{field_name}' field using arguments not in the field: "
+                    f"{', '.join(invalid_args)}"
+                )
+
+    @classmethod
+    def __validate_broadcast__(cls):
+        if not cls.__broadcast__ or cls.__broadcast__ is True:
+            return
+
+        invalid_fields = set(cls.__broadcast__) - set(cls.subscribers)
+        if invalid_fields:
+            raise ValueError(
+                f"{cls.__name__} class was defined with broadcast for fields "
+                f"without subscribers: {', '.join(invalid_fields)}"
+            )
+
+    @classmethod
+    def __validate_broadcast_key__(cls):
+        if cls.__broadcast_key__ is not None and not callable(cls.__broadcast_key__):
+            raise TypeError(
+                f"{cls.__name__} class was defined with __broadcast_key__ that is "
+                f"not callable: {type(cls.__broadcast_key__).__name__}"
+            )
+
+    @classmethod
+    def __validate_delivery__(cls):
+        if not cls.__delivery__:
+            return
+
+        invalid_fields = (
+            set(cls.__delivery__) - set(cls.subscribers) - set(cls.__channels__ or {})
+        )
+        if invalid_fields:
+            raise ValueError(
+                f"{cls.__name__} class was defined with delivery policies for "
+                f"fields without subscribers or channels: {', '.join(invalid_fields)}"
+            )
+
+        for field_name, policy in cls.__delivery__.items():
+            if not isinstance(policy, DeliveryPolicy):
+                raise TypeError(
+                    f"{cls.__name__} class was defined with delivery policy for "
+                    f"'{field_name}' field that is not a DeliveryPolicy instance: "
+                    f"{type(policy).__name__}"
+                )
+
+            if isinstance(policy, TimeWindow) and not cls.__returns_list__(field_name):
+                raise ValueError(
+                    f"{cls.__name__} class was defined with TimeWindow delivery "
+                    f"policy for '{field_name}' field that doesn't return a list"
+                )
+
+    @classmethod
+    def __validate_batches__(cls):
+        if not cls.__batches__:
+            return
+
+        invalid_fields = (
+            set(cls.__batches__) - set(cls.subscribers) - set(cls.__channels__ or {})
+        )
+        if invalid_fields:
+            raise ValueError(
+                f"{cls.__name__} class was defined with batches for fields "
+                f"without subscribers or channels: {', '.join(invalid_fields)}"
+            )
+
+        for field_name, window in cls.__batches__.items():
+            if not isinstance(window, BatchWindow):
+                raise TypeError(
+                    f"{cls.__name__} class was defined with batch window for "
+                    f"'{field_name}' field that is not a BatchWindow instance: "
+                    f"{type(window).__name__}"
+                )
+
+            if not cls.__returns_list__(field_name):
+                raise ValueError(
+                    f"{cls.__name__} class was defined with batch window for "
+                    f"'{field_name}' field that doesn't return a list"
+                )
+
+    @classmethod
+    def __returns_list__(cls, field_name: str) -> bool:
+        field_type = cls.graphql_fields[field_name].type
+        if isinstance(field_type, NonNullTypeNode):
+            field_type = field_type.type
+        return isinstance(field_type, ListTypeNode)
+
+    @classmethod
+    def __get_wrapped_subscribers__(cls) -> Dict[str, GraphQLFieldResolver]:
+        if cls.__broadcast__ is True:
+            broadcast_fields = list(cls.subscribers)
+        else:
+            broadcast_fields = cast(List[str], cls.__broadcast__ or [])
+
+        delivery = cls.__delivery__ or {}
+        subscribers = cls.subscribers.copy()
+
+        # Broker already shares channel between its subscribers
+        for field_name, channel in (cls.__channels__ or {}).items():
+            subscribers[field_name] = create_channel_subscriber(
+                cls,
+                channel,
+                delivery.get(field_name),
+                cls.delivery_stats.get(field_name),
+            )
+
+        for field_name, subscriber in cls.subscribers.items():
+            policy = delivery.get(field_name)
+            stats = cls.delivery_stats.get(field_name)
+
+            if field_name in broadcast_fields:
+                # Delivery policy replaces queues of broadcast subscribers
+                subscribers[field_name] = create_broadcast_subscriber(
+                    cls, field_name, subscriber, policy, stats
+                )
+            elif policy and stats:
+                subscribers[field_name] = create_delivery_subscriber(
+                    subscriber, policy, stats
+                )
+
+        # Batches are made from events after they went through delivery policy
+        for field_name, window in (cls.__batches__ or {}).items():
+            subscribers[field_name] = create_batch_subscriber(
+                subscribers[field_name], window
+            )
+
+        return subscribers
+
     @classmethod
     def __get_defined_subscribers__(cls) -> Dict[str, Callable]:
         resolvers = {}
@@ -12,7 +12,6 @@ from graphql import (
 from .bases import BindableType
 from .dependencies import Dependencies, get_dependencies_from_union_type
 from .types import RequirementsDict
-from .utils import parse_definition
 
 UnionNodeType = Union[UnionTypeDefinitionNode, UnionTypeExtensionNode]
 
@@ -30,19 +29,27 @@ class UnionType(BindableType):
             return
 
         cls.__abstract__ = False
+        cls.__prepared__ = False
 
-        graphql_def = cls.__validate_schema__(
-            parse_definition(cls.__name__, cls.__schema__)
-        )
+        if not cls.__lazy__:
+            cls.__prepare_type__()
+
+    @classmethod
+    def __setup_type__(cls, type_def: DefinitionNode, validate: bool = True):
+        graphql_def = cls.__validate_schema__(type_def)
 
         cls.graphql_name = graphql_def.name.value
         cls.graphql_type = type(graphql_def)
+        cls.graphql_def = graphql_def
 
-        requirements = cls.__get_requirements__()
-        cls.__validate_requirements_contain_extended_type__(graphql_def, requirements)
+        if validate:
+            requirements = cls.__get_requirements__()
+            cls.__validate_requirements_contain_extended_type__(
+                graphql_def, requirements
+            )
 
-        dependencies = cls.__get_dependencies__(graphql_def)
-        cls.__validate_requirements__(requirements, dependencies)
+            dependencies = cls.__get_dependencies__(graphql_def)
+            cls.__validate_requirements__(requirements, dependencies)
 
     @classmethod
     def __validate_schema__(cls, type_def: DefinitionNode) -> UnionNodeType:
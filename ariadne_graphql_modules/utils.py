@@ -1,23 +1,30 @@
-from typing import Any, Mapping
+from bisect import bisect_right
+from dataclasses import fields, is_dataclass
+from typing import Any, Hashable, List, Mapping, Optional, Sequence, Tuple, cast
 
 from graphql import (
     DefinitionNode,
+    GraphQLError,
+    GraphQLFieldResolver,
     GraphQLResolveInfo,
     ListTypeNode,
+    Node,
     NonNullTypeNode,
     TypeNode,
     parse,
 )
 
 
-def parse_definition(type_name: str, schema: Any) -> DefinitionNode:
+def parse_definition(
+    type_name: str, schema: Any, no_location: bool = False
+) -> DefinitionNode:
     if not isinstance(schema, str):
         raise TypeError(
             f"{type_name} class was defined with __schema__ of invalid type: "
             f"{type(schema).__name__}"
         )
 
-    definitions = parse(schema).definitions
+    definitions = parse(schema, no_location=no_location).definitions
 
     if len(definitions) > 1:
         definitions_types = [type(definition).__name__ for definition in definitions]
@@ -29,6 +36,64 @@ def parse_definition(type_name: str, schema: Any) -> DefinitionNode:
     return definitions[0]
 
 
+def parse_definitions(
+    schemas: Sequence[Tuple[str, Any]], no_location: bool = False
+) -> List[DefinitionNode]:
+    # Parses (type_name, schema) pairs as single document. If it's not possible
+    # to map parsed definitions back to schemas, falls back to parse_definition
+    # for every schema to raise same errors as types would raise on their own
+    definitions = parse_definitions_document(schemas)
+    if definitions is None:
+        return [
+            parse_definition(type_name, schema, no_location)
+            for type_name, schema in schemas
+        ]
+
+    if no_location:
+        # Locations are needed to map definitions to schemas, remove them after
+        for definition in definitions:
+            remove_locations(definition)
+
+    return definitions
+
+
+def parse_definitions_document(
+    schemas: Sequence[Tuple[str, Any]]
+) -> Optional[List[DefinitionNode]]:
+    starts: List[int] = []
+    ends: List[int] = []
+    offset = 0
+    for _, schema in schemas:
+        if not isinstance(schema, str):
+            return None
+
+        starts.append(offset)
+        offset += len(schema)
+        ends.append(offset)
+        offset += 1  # Newline separating schemas in document
+
+    try:
+        document = parse("\n".join(schema for _, schema in schemas))
+    except GraphQLError:
+        return None
+
+    definitions: List[Optional[DefinitionNode]] = [None] * len(schemas)
+    for definition in document.definitions:
+        if not definition.loc:
+            return None
+
+        index = bisect_right(starts, definition.loc.start) - 1
+        if definitions[index] or definition.loc.end > ends[index]:
+            return None
+
+        definitions[index] = definition
+
+    if not all(definitions):
+        return None
+
+    return cast(List[DefinitionNode], definitions)
+
+
 def unwrap_type_node(field_type: TypeNode):
     if isinstance(field_type, (NonNullTypeNode, ListTypeNode)):
         return unwrap_type_node(field_type.type)
@@ -50,3 +115,111 @@ def create_alias_resolver(field_name: str):
         return value
 
     return default_aliased_field_resolver
+
+
+def remove_locations(node: Any):
+    if isinstance(node, Node):
+        node.loc = None
+        for key in node.keys:
+            if key != "loc":
+                remove_locations(getattr(node, key, None))
+    elif isinstance(node, (list, tuple)):
+        for item in node:
+            remove_locations(item)
+
+
+def create_source_resolver(
+    source_type: type, attr_name: str, call_callables: bool = False
+) -> GraphQLFieldResolver:
+    # Creates resolver specialized for source of given type, skipping type checks
+    # and callable probing done by default and alias resolvers for every value
+    resolve_value = create_source_value_resolver(source_type, attr_name)
+
+    if call_callables:
+
+        def callable_source_field_resolver(
+            source: Any, info: GraphQLResolveInfo, **args: Any
+        ) -> Any:
+            value = resolve_value(source, info)
+            if callable(value):
+                return value(info, **args)
+            return value
+
+        return callable_source_field_resolver
+
+    return resolve_value
+
+
+def create_source_value_resolver(
+    source_type: type, attr_name: str
+) -> GraphQLFieldResolver:
+    if issubclass(source_type, Mapping):
+
+        def mapping_field_resolver(source: Any, _: Any, **__: Any) -> Any:
+            return source.get(attr_name)
+
+        return mapping_field_resolver
+
+    namedtuple_fields = getattr(source_type, "_fields", None)
+    if issubclass(source_type, tuple) and namedtuple_fields:
+        if attr_name in namedtuple_fields:
+            index = namedtuple_fields.index(attr_name)
+
+            def namedtuple_field_resolver(source: Any, _: Any, **__: Any) -> Any:
+                return source[index]
+
+            return namedtuple_field_resolver
+
+    elif is_dataclass(source_type):
+        if attr_name in [field.name for field in fields(source_type)]:
+
+            def dataclass_field_resolver(source: Any, _: Any, **__: Any) -> Any:
+                return getattr(source, attr_name)
+
+            return dataclass_field_resolver
+
+    def attr_field_resolver(source: Any, _: Any, **__: Any) -> Any:
+        return getattr(source, attr_name, None)
+
+    return attr_field_resolver
+
+
+def mark_default_resolver(resolver: GraphQLFieldResolver) -> GraphQLFieldResolver:
+    # Default resolvers are replaced by interface resolvers for same field
+    setattr(resolver, "__default_resolver__", True)
+    return resolver
+
+
+def is_default_resolver(resolver: Optional[GraphQLFieldResolver]) -> bool:
+    return getattr(resolver, "__default_resolver__", False)
+
+
+def copy_without_locations(node: Any) -> Any:
+    if isinstance(node, Node):
+        return node.__class__(
+            **{
+                key: copy_without_locations(getattr(node, key))
+                for key in node.keys
+                if key != "loc"
+            }
+        )
+    if isinstance(node, (list, tuple)):
+        return tuple(copy_without_locations(item) for item in node)
+    return node
+
+
+def freeze_args(value: Any, strict: bool = False) -> Hashable:
+    # Converts field arguments to value that can be used as dict key
+    if isinstance(value, Mapping):
+        return tuple((key, freeze_args(value[key], strict)) for key in sorted(value))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_args(item, strict) for item in value)
+
+    try:
+        hash(value)
+    except TypeError:
+        if strict:
+            raise
+        # Caller should keep value alive for its id to stay unique
+        return (freeze_args, id(value))
+    return value
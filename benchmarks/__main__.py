@@ -0,0 +1,319 @@
+"""Benchmarks of module types creation and schema building at scale.
+
+Run from repository root:
+
+    python -m benchmarks --sizes 100 1000 --json results.json
+    python -m benchmarks --sizes 100 1000 --compare results.json
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import statistics
+import tracemalloc
+from time import perf_counter
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, cast
+
+from graphql import ExecutionResult, graphql_sync, parse, subscribe
+from graphql import version as graphql_version
+
+from ariadne_graphql_modules import (
+    DefinitionType,
+    SerializeManyExecutionContext,
+    make_executable_schema,
+)
+
+from .graphs import generate_module_graph
+from .resolvers import (
+    Row,
+    generate_dates,
+    generate_prices,
+    generate_rows,
+    generate_scalar_list_schema,
+    generate_subscription_schema,
+    generate_wide_list_schema,
+)
+
+FORMAT_VERSION = 1
+DEFAULT_SIZES = [100, 1000, 10000]
+
+Result = Dict[str, Any]
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=DEFAULT_SIZES,
+        help="numbers of object types in generated schemas",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="number of timed runs for each size"
+    )
+    parser.add_argument("--json", help="write results to this JSON file")
+    parser.add_argument("--compare", help="compare results with this JSON file")
+    args = parser.parse_args(argv)
+
+    results: List[Result] = []
+    for size in args.sizes:
+        results.extend(run_benchmarks(size, args.repeat))
+
+    report = {
+        "format": FORMAT_VERSION,
+        "python": platform.python_version(),
+        "graphql_core": graphql_version,
+        "results": results,
+    }
+
+    print_results(results)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fp:
+            print_comparison(json.load(fp)["results"], results)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fp:
+            json.dump(report, fp, indent=2, sort_keys=True)
+
+
+def run_benchmarks(size: int, repeat: int) -> List[Result]:
+    create_times: List[float] = []
+    build_times: List[float] = []
+    for _ in range(repeat):
+        create_time, types = measure(generate_module_graph, size)
+        build_time, _ = measure(make_executable_schema, *types)
+        create_times.append(create_time)
+        build_times.append(build_time)
+
+    create_peak, build_peak = measure_peak_memory(size)
+    retained = measure_retained_memory(size, no_location=False)
+    retained_no_location = measure_retained_memory(size, no_location=True)
+
+    dict_rows = generate_rows(size)
+    object_rows = [Row(row) for row in dict_rows]
+    dates = generate_dates(size)
+    prices = generate_prices(size)
+
+    return [
+        timing_result("create_types", size, create_times),
+        timing_result("make_executable_schema", size, build_times),
+        memory_result("create_types_peak_memory", size, create_peak),
+        memory_result("make_executable_schema_peak_memory", size, build_peak),
+        memory_result("types_retained_memory", size, retained),
+        memory_result("types_retained_memory_no_location", size, retained_no_location),
+        timing_result(
+            "resolve_wide_list_dict_default",
+            size,
+            measure_execution(None, dict_rows, repeat),
+        ),
+        timing_result(
+            "resolve_wide_list_dict_source",
+            size,
+            measure_execution(dict, dict_rows, repeat),
+        ),
+        timing_result(
+            "resolve_wide_list_object_default",
+            size,
+            measure_execution(None, object_rows, repeat),
+        ),
+        timing_result(
+            "resolve_wide_list_object_source",
+            size,
+            measure_execution(object, object_rows, repeat),
+        ),
+        timing_result(
+            "serialize_scalar_list_per_item",
+            size,
+            measure_serialization(False, dates, repeat),
+        ),
+        timing_result(
+            "serialize_scalar_list_serialize_many",
+            size,
+            measure_serialization(True, dates, repeat),
+        ),
+        timing_result(
+            "subscription_events_per_event",
+            size,
+            measure_subscription(None, prices, repeat),
+        ),
+        timing_result(
+            "subscription_events_batched",
+            size,
+            measure_subscription(100, prices, repeat),
+        ),
+    ]
+
+
+def measure(func: Callable[..., Any], *args: Any) -> Tuple[float, Any]:
+    gc.collect()
+    start = perf_counter()
+    result = func(*args)
+    return perf_counter() - start, result
+
+
+def measure_execution(
+    source: Optional[type], rows: List[Any], repeat: int
+) -> List[float]:
+    # Time of resolving every field of `size` rows, WIDE_TYPE_FIELDS per row
+    schema, query = generate_wide_list_schema(source)
+    root_value = {"rows": rows}
+
+    times: List[float] = []
+    for _ in range(repeat):
+        execution_time, result = measure(
+            lambda: graphql_sync(schema, query, root_value=root_value)
+        )
+        assert not result.errors, result.errors
+        times.append(execution_time)
+    return times
+
+
+def measure_serialization(
+    serialize_many: bool, dates: List[Any], repeat: int
+) -> List[float]:
+    # Time of serializing list of `size` custom scalars returned by single field
+    schema, query = generate_scalar_list_schema(serialize_many)
+    root_value = {"dates": dates}
+
+    times: List[float] = []
+    for _ in range(repeat):
+        execution_time, result = measure(
+            lambda: graphql_sync(
+                schema,
+                query,
+                root_value=root_value,
+                execution_context_class=SerializeManyExecutionContext,
+            )
+        )
+        assert not result.errors, result.errors
+        times.append(execution_time)
+    return times
+
+
+def measure_subscription(
+    batch_size: Optional[int], events: List[Any], repeat: int
+) -> List[float]:
+    # Time of executing subscription for `size` events yielded by its source
+    schema, query = generate_subscription_schema(events, batch_size)
+    document = parse(query)
+
+    async def consume_events() -> int:
+        received = 0
+        results = await subscribe(schema, document)
+        async for result in cast(AsyncIterator[ExecutionResult], results):
+            assert result.data and not result.errors, result.errors
+            prices = result.data["prices"]
+            received += len(prices) if batch_size else 1
+        return received
+
+    times: List[float] = []
+    for _ in range(repeat):
+        execution_time, received = measure(lambda: asyncio.run(consume_events()))
+        assert received == len(events), received
+        times.append(execution_time)
+    return times
+
+
+def measure_peak_memory(size: int) -> Tuple[int, int]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        types = generate_module_graph(size)
+        _, create_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        make_executable_schema(*types)
+        _, build_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return create_peak, build_peak
+
+
+def measure_retained_memory(size: int, no_location: bool) -> int:
+    # Memory kept alive by created types and their parsed definitions
+    gc.collect()
+    tracemalloc.start()
+    DefinitionType.__no_location__ = no_location
+    try:
+        types = generate_module_graph(size)
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        DefinitionType.__no_location__ = False
+        tracemalloc.stop()
+
+    del types
+    return retained
+
+
+def timing_result(name: str, size: int, times: List[float]) -> Result:
+    return {
+        "benchmark": name,
+        "size": size,
+        "unit": "s",
+        "min": min(times),
+        "median": statistics.median(times),
+        "max": max(times),
+        "runs": len(times),
+    }
+
+
+def memory_result(name: str, size: int, peak: int) -> Result:
+    return {
+        "benchmark": name,
+        "size": size,
+        "unit": "B",
+        "min": peak,
+        "median": peak,
+        "max": peak,
+        "runs": 1,
+    }
+
+
+def print_results(results: List[Result]):
+    print(f"{'benchmark':<40} {'size':>7} {'min':>12} {'median':>12} {'max':>12}")
+    for result in results:
+        print(
+            f"{result['benchmark']:<40} {result['size']:>7} "
+            f"{format_value(result['min'], result['unit']):>12} "
+            f"{format_value(result['median'], result['unit']):>12} "
+            f"{format_value(result['max'], result['unit']):>12}"
+        )
+
+
+def print_comparison(baseline: List[Result], results: List[Result]):
+    baseline_medians = {
+        (result["benchmark"], result["size"]): result["median"] for result in baseline
+    }
+
+    print()
+    print(
+        f"{'benchmark':<40} {'size':>7} {'baseline':>12} {'current':>12} {'ratio':>7}"
+    )
+    for result in results:
+        key = (result["benchmark"], result["size"])
+        if key not in baseline_medians:
+            continue
+
+        baseline_median = baseline_medians[key]
+        ratio = result["median"] / baseline_median if baseline_median else 0
+        print(
+            f"{result['benchmark']:<40} {result['size']:>7} "
+            f"{format_value(baseline_median, result['unit']):>12} "
+            f"{format_value(result['median'], result['unit']):>12} "
+            f"{ratio:>6.2f}x"
+        )
+
+
+def format_value(value: float, unit: str) -> str:
+    if unit == "B":
+        return f"{value / 1024 / 1024:.2f} MiB"
+    return f"{value * 1000:.1f} ms"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""Generators of synthetic module graphs used by benchmarks."""
+
+from typing import Any, Dict, List, Type
+
+from ariadne_graphql_modules import (
+    BaseType,
+    CollectionType,
+    EnumType,
+    InputType,
+    InterfaceType,
+    MutationType,
+    ObjectType,
+    UnionType,
+)
+
+# Number of types in single __requires__ chain
+CHAIN_DEPTH = 25
+# Number of types grouped in single CollectionType
+COLLECTION_SIZE = 100
+
+
+def generate_module_graph(size: int, prefix: str = "") -> List[Type[BaseType]]:
+    """Creates module classes for schema with `size` object types.
+
+    Graph contains interfaces, unions, enums and inputs in fixed proportion to
+    object types, one MutationType for every 10 object types, object types
+    requiring each other in chains of CHAIN_DEPTH types and nested collections.
+
+    Returns list of types to pass to make_executable_schema.
+    """
+    interfaces = [
+        create_interface(f"{prefix}Node{i}") for i in range(max(size // 20, 1))
+    ]
+    enums = [create_enum(f"{prefix}Status{i}") for i in range(max(size // 20, 1))]
+    inputs = [
+        create_input(f"{prefix}Filter{i}", enums[i % len(enums)])
+        for i in range(max(size // 20, 1))
+    ]
+
+    objects: List[Type[ObjectType]] = []
+    for i in range(size):
+        previous = objects[-1] if i % CHAIN_DEPTH else None
+        objects.append(
+            create_object(
+                f"{prefix}Object{i}",
+                interfaces[i % len(interfaces)],
+                enums[i % len(enums)],
+                inputs[i % len(inputs)],
+                previous,
+            )
+        )
+
+    unions = [
+        create_union(f"{prefix}Result{i}", objects[i * 5 : i * 5 + 5])
+        for i in range(max(size // 50, 1))
+    ]
+
+    chain_heads = objects[CHAIN_DEPTH - 1 :: CHAIN_DEPTH] or objects[-1:]
+    query = create_query(f"{prefix}Query", chain_heads, unions)
+    mutations = [
+        create_mutation(f"{prefix}Mutation{i}", objects[i % len(objects)])
+        for i in range(max(size // 10, 1))
+    ]
+
+    collections = [
+        create_collection(f"{prefix}Objects{i}", objects[i : i + COLLECTION_SIZE])
+        for i in range(0, len(objects), COLLECTION_SIZE)
+    ]
+    all_objects = create_collection(f"{prefix}AllObjects", collections)
+
+    return [query, all_objects, *mutations]
+
+
+def create_interface(name: str) -> Type[InterfaceType]:
+    def resolve_type(*_):
+        return None
+
+    return type(
+        name,
+        (InterfaceType,),
+        {
+            "__schema__": f"interface {name} {{ id: ID! label: String! }}",
+            "resolve_type": staticmethod(resolve_type),
+            "resolve_label": staticmethod(resolve_label),
+        },
+    )
+
+
+def create_enum(name: str) -> Type[EnumType]:
+    values = ["DRAFT", "ACTIVE", "ARCHIVED", "DELETED", "UNKNOWN"]
+    return type(
+        name,
+        (EnumType,),
+        {
+            "__schema__": f"enum {name} {{ {' '.join(values)} }}",
+            "__enum__": {value: index for index, value in enumerate(values)},
+        },
+    )
+
+
+def create_input(name: str, status: Type[EnumType]) -> Type[InputType]:
+    return type(
+        name,
+        (InputType,),
+        {
+            "__schema__": (
+                f"input {name} {{ search: String status: {status.__name__} "
+                "first: Int = 10 }"
+            ),
+            "__requires__": [status],
+        },
+    )
+
+
+def create_object(
+    name: str,
+    interface: Type[InterfaceType],
+    status: Type[EnumType],
+    filter_input: Type[InputType],
+    previous: Any,
+) -> Type[ObjectType]:
+    requires: List[Any] = [interface, status, filter_input]
+    fields = [
+        "id: ID!",
+        "label: String!",
+        "createdAt: String",
+        f"status: {status.__name__}!",
+        f"children(filter: {filter_input.__name__}): [{name}!]!",
+    ]
+    if previous:
+        requires.append(previous)
+        fields.append(f"previous: {previous.__name__}")
+
+    attrs: Dict[str, Any] = {
+        "__schema__": (
+            f"type {name} implements {interface.__name__} " f"{{ {' '.join(fields)} }}"
+        ),
+        "__requires__": requires,
+        "__aliases__": {"createdAt": "created_at"},
+        "resolve_children": staticmethod(resolve_children),
+    }
+    return type(name, (ObjectType,), attrs)
+
+
+def create_union(name: str, members: List[Type[ObjectType]]) -> Type[UnionType]:
+    def resolve_type(*_):
+        return None
+
+    return type(
+        name,
+        (UnionType,),
+        {
+            "__schema__": (
+                f"union {name} = "
+                f"{' | '.join(member.__name__ for member in members)}"
+            ),
+            "__requires__": members,
+            "resolve_type": staticmethod(resolve_type),
+        },
+    )
+
+
+def create_query(
+    name: str, objects: List[Type[ObjectType]], unions: List[Type[UnionType]]
+) -> Type[ObjectType]:
+    fields = [f"object{i}: {type_.__name__}" for i, type_ in enumerate(objects)]
+    fields += [f"result{i}: [{type_.__name__}!]!" for i, type_ in enumerate(unions)]
+    return type(
+        name,
+        (ObjectType,),
+        {
+            "__schema__": f"type Query {{ {' '.join(fields)} }}",
+            "__requires__": [*objects, *unions],
+        },
+    )
+
+
+def create_mutation(name: str, result: Type[ObjectType]) -> Type[MutationType]:
+    field_name = name[0].lower() + name[1:]
+    return type(
+        name,
+        (MutationType,),
+        {
+            "__schema__": (
+                f"type Mutation {{ {field_name}(id: ID!, label: String!): "
+                f"{result.__name__}! }}"
+            ),
+            "__requires__": [result],
+            "resolve_mutation": staticmethod(resolve_mutation),
+        },
+    )
+
+
+def create_collection(name: str, types: List[Type[BaseType]]) -> Type[CollectionType]:
+    return type(name, (CollectionType,), {"__types__": types})
+
+
+def resolve_label(obj, *_):
+    return obj["label"]
+
+
+def resolve_children(*_, **__):
+    return []
+
+
+def resolve_mutation(*_, **__):
+    return None
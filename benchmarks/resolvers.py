@@ -0,0 +1,154 @@
+"""Schemas and data used by benchmarks of fields resolution."""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from graphql import GraphQLSchema
+
+from ariadne_graphql_modules import (
+    BatchWindow,
+    ObjectType,
+    ScalarType,
+    SubscriptionType,
+    make_executable_schema,
+)
+
+# Number of fields in type resolved for every row of wide list
+WIDE_TYPE_FIELDS = 20
+
+
+class Row:
+    def __init__(self, values: Dict[str, Any]):
+        self.__dict__.update(values)
+
+
+def generate_wide_list_schema(
+    source: Optional[type], fields: int = WIDE_TYPE_FIELDS
+) -> Tuple[GraphQLSchema, str]:
+    """Creates schema with `Query.rows` field returning list of wide type.
+
+    Half of fields are aliased to Python names. When `source` is set, it's
+    used as `__source__` of the type.
+
+    Returns schema and query selecting all fields of rows.
+    """
+    fields_names = [f"field{i}" for i in range(fields)]
+    fields_sdl = "\n".join(f"{name}: Int" for name in fields_names)
+
+    row_attrs: Dict[str, Any] = {
+        "__schema__": f"type Row {{ {fields_sdl} }}",
+        "__aliases__": {name: f"attr_{name}" for name in fields_names[::2]},
+    }
+    if source:
+        row_attrs["__source__"] = source
+
+    row_type = type("RowType", (ObjectType,), row_attrs)
+    query_type = type(
+        "QueryType",
+        (ObjectType,),
+        {
+            "__schema__": "type Query { rows: [Row!]! }",
+            "__requires__": [row_type],
+        },
+    )
+
+    schema = make_executable_schema(query_type)
+    query = f"{{ rows {{ {' '.join(fields_names)} }} }}"
+    return schema, query
+
+
+def generate_rows(size: int, fields: int = WIDE_TYPE_FIELDS) -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    for i in range(size):
+        row: Dict[str, Any] = {}
+        for field in range(fields):
+            name = f"field{field}"
+            row[f"attr_{name}" if field % 2 == 0 else name] = i + field
+        rows.append(row)
+    return rows
+
+
+def generate_scalar_list_schema(serialize_many: bool) -> Tuple[GraphQLSchema, str]:
+    """Creates schema with `Query.dates` field returning list of custom scalars.
+
+    Scalar defines `serialize_many` if `serialize_many` is set, and `serialize`
+    otherwise.
+
+    Returns schema and query selecting the list.
+    """
+    scalar_attrs: Dict[str, Any] = {"__schema__": "scalar DateTime"}
+    if serialize_many:
+        scalar_attrs["serialize_many"] = staticmethod(
+            lambda values: [value.isoformat() for value in values]
+        )
+    else:
+        scalar_attrs["serialize"] = staticmethod(lambda value: value.isoformat())
+
+    scalar_type = type("DateTimeScalar", (ScalarType,), scalar_attrs)
+    query_type = type(
+        "QueryType",
+        (ObjectType,),
+        {
+            "__schema__": "type Query { dates: [DateTime!]! }",
+            "__requires__": [scalar_type],
+        },
+    )
+
+    return make_executable_schema(query_type), "{ dates }"
+
+
+def generate_dates(size: int) -> List[datetime]:
+    start = datetime(2024, 1, 1)
+    return [start + timedelta(minutes=i) for i in range(size)]
+
+
+def generate_subscription_schema(
+    events: List[Dict[str, Any]], batch_size: Optional[int]
+) -> Tuple[GraphQLSchema, str]:
+    """Creates schema with subscription field yielding `events`.
+
+    When `batch_size` is set, events are resolved in batches of this size by
+    field returning list, otherwise every event is resolved separately.
+
+    Returns schema and subscription query.
+    """
+
+    async def subscribe_prices(*_):
+        for event in events:
+            yield event
+
+    def resolve_prices(event, *_):
+        return event
+
+    price_type = type(
+        "PriceType",
+        (ObjectType,),
+        {"__schema__": "type Price { symbol: String! value: Float! }"},
+    )
+
+    subscription_attrs: Dict[str, Any] = {
+        "__requires__": [price_type],
+        "subscribe_prices": staticmethod(subscribe_prices),
+        "resolve_prices": staticmethod(resolve_prices),
+    }
+    if batch_size:
+        subscription_attrs["__schema__"] = "type Subscription { prices: [Price!]! }"
+        subscription_attrs["__batches__"] = {
+            "prices": BatchWindow(1, max_size=batch_size)
+        }
+    else:
+        subscription_attrs["__schema__"] = "type Subscription { prices: Price! }"
+
+    subscription_type = type(
+        "SubscriptionType", (SubscriptionType,), subscription_attrs
+    )
+    query_type = type(
+        "QueryType", (ObjectType,), {"__schema__": "type Query { version: String }"}
+    )
+
+    schema = make_executable_schema(query_type, subscription_type)
+    return schema, "subscription { prices { symbol value } }"
+
+
+def generate_prices(size: int) -> List[Dict[str, Any]]:
+    return [{"symbol": f"SYM{i % 10}", "value": float(i)} for i in range(size)]
@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+from graphql import parse, subscribe
+
+
+class Channel:
+    """Events source for subscriptions, with queue for every listener"""
+
+    def __init__(self):
+        self.queues = []
+        self.opened = 0
+        self.closed = 0
+
+    async def listen(self):
+        queue = asyncio.Queue()
+        self.queues.append(queue)
+        self.opened += 1
+        try:
+            while True:
+                event = await queue.get()
+                if isinstance(event, Exception):
+                    raise event
+                yield event
+        finally:
+            self.queues.remove(queue)
+            self.closed += 1
+
+    def put(self, *events):
+        for event in events:
+            for queue in self.queues:
+                queue.put_nowait(event)
+
+    async def publish(self, *events):
+        # Waits until listeners have read published events
+        self.put(*events)
+        while any(queue.qsize() for queue in self.queues):
+            await asyncio.sleep(0)
+
+    async def wait_for_listeners(self, count=1):
+        while len(self.queues) < count:
+            await asyncio.sleep(0)
+
+
+@pytest.fixture
+def channel():
+    return Channel()
+
+
+@pytest.fixture
+def next_result():
+    async def get_next_result(subscription):
+        # pylint: disable=unnecessary-dunder-call
+        return await asyncio.wait_for(subscription.__anext__(), 1)
+
+    return get_next_result
+
+
+@pytest.fixture
+def next_value(next_result):  # pylint: disable=redefined-outer-name
+    async def get_next_value(subscription, field_name):
+        result = await next_result(subscription)
+        assert result.errors is None
+        return result.data[field_name]
+
+    return get_next_value
+
+
+@pytest.fixture
+def start_subscription(channel, next_value):  # pylint: disable=redefined-outer-name
+    async def start(schema, field_name):
+        subscription = await subscribe(
+            schema, parse(f"subscription {{ {field_name} }}")
+        )
+
+        # Subscription's source is started when its first result is requested
+        first_value = asyncio.ensure_future(next_value(subscription, field_name))
+        await channel.wait_for_listeners()
+        return subscription, first_value
+
+    return start
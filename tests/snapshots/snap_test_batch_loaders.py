@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+# snapshottest: v1 - https://goo.gl/zC4yUc
+from __future__ import unicode_literals
+
+from snapshottest import GenericRepr, Snapshot
+
+
+snapshots = Snapshot()
+
+snapshots['test_object_type_raises_error_when_defined_with_batch_resolver_for_nonexisting_field 1'] = GenericRepr("<ExceptionInfo ValueError('UserType class was defined with resolvers for fields not in GraphQL type: batch_resolve_group') tblen=5>")
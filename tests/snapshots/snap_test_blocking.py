@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+# snapshottest: v1 - https://goo.gl/zC4yUc
+from __future__ import unicode_literals
+
+from snapshottest import GenericRepr, Snapshot
+
+
+snapshots = Snapshot()
+
+snapshots['test_blocking_decorator_raises_error_when_applied_to_async_resolver 1'] = GenericRepr('<ExceptionInfo TypeError("QueryType.resolve_other is async resolver and can\'t be decorated with blocking") tblen=3>')
@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+# snapshottest: v1 - https://goo.gl/zC4yUc
+from __future__ import unicode_literals
+
+from snapshottest import GenericRepr, Snapshot
+
+
+snapshots = Snapshot()
+
+snapshots['test_subscription_type_raises_error_when_defined_with_broadcast_for_invalid_field 1'] = GenericRepr("<ExceptionInfo ValueError('ChatSubscription class was defined with broadcast for fields without subscribers: chat') tblen=5>")
+
+snapshots['test_subscription_type_raises_error_when_defined_with_invalid_broadcast_key 1'] = GenericRepr("<ExceptionInfo TypeError('ChatSubscription class was defined with __broadcast_key__ that is not callable: str') tblen=5>")
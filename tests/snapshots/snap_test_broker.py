@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+# snapshottest: v1 - https://goo.gl/zC4yUc
+from __future__ import unicode_literals
+
+from snapshottest import GenericRepr, Snapshot
+
+
+snapshots = Snapshot()
+
+snapshots['test_subscription_type_raises_error_when_defined_with_channel_for_invalid_field 1'] = GenericRepr("<ExceptionInfo ValueError('ChatSubscription class was defined with channels for fields not in GraphQL type: chat') tblen=5>")
+
+snapshots['test_subscription_type_raises_error_when_defined_with_channel_for_subscribed_field 1'] = GenericRepr("<ExceptionInfo ValueError('ChatSubscription class was defined with channels for fields with subscribers: message') tblen=5>")
+
+snapshots['test_subscription_type_raises_error_when_defined_with_channel_using_invalid_arg 1'] = GenericRepr('<ExceptionInfo ValueError("ChatSubscription class was defined with channel for \'message\' field using arguments not in the field: chatId") tblen=5>')
+
+snapshots['test_subscription_type_raises_error_when_defined_with_invalid_channel 1'] = GenericRepr('<ExceptionInfo TypeError("ChatSubscription class was defined with channel for \'message\' field that is not a str or callable: int") tblen=5>')
@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+# snapshottest: v1 - https://goo.gl/zC4yUc
+from __future__ import unicode_literals
+
+from snapshottest import GenericRepr, Snapshot
+
+
+snapshots = Snapshot()
+
+snapshots['test_mutation_type_raises_error_when_defined_with_invalid_cost_multiplier 1'] = GenericRepr('<ExceptionInfo ValueError("InvalidMutation class was defined with cost multipliers not on \'createUser\' GraphQL field: names") tblen=5>')
+
+snapshots['test_object_type_raises_error_when_defined_with_cost_for_nonexisting_field 1'] = GenericRepr("<ExceptionInfo ValueError('InvalidType class was defined with costs for fields not in GraphQL type: name') tblen=5>")
+
+snapshots['test_object_type_raises_error_when_defined_with_invalid_cost 1'] = GenericRepr('<ExceptionInfo TypeError("InvalidType class was defined with cost for \'id\' field that is not an int or FieldCost instance: str") tblen=5>')
+
+snapshots['test_object_type_raises_error_when_defined_with_invalid_cost_multiplier 1'] = GenericRepr('<ExceptionInfo ValueError("InvalidType class was defined with cost multipliers not in \'friends\' field: limit") tblen=5>')
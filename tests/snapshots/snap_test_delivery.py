@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+# snapshottest: v1 - https://goo.gl/zC4yUc
+from __future__ import unicode_literals
+
+from snapshottest import GenericRepr, Snapshot
+
+
+snapshots = Snapshot()
+
+snapshots['test_subscription_type_raises_error_when_defined_with_batch_window_for_non_list 1'] = GenericRepr('<ExceptionInfo ValueError("EventsSubscription class was defined with batch window for \'event\' field that doesn\'t return a list") tblen=5>')
+
+snapshots['test_subscription_type_raises_error_when_defined_with_delivery_for_invalid_field 1'] = GenericRepr("<ExceptionInfo ValueError('EventsSubscription class was defined with delivery policies for fields without subscribers or channels: other') tblen=5>")
+
+snapshots['test_subscription_type_raises_error_when_defined_with_invalid_batch_window 1'] = GenericRepr('<ExceptionInfo TypeError("EventsSubscription class was defined with batch window for \'events\' field that is not a BatchWindow instance: int") tblen=5>')
+
+snapshots['test_subscription_type_raises_error_when_defined_with_invalid_delivery_policy 1'] = GenericRepr('<ExceptionInfo TypeError("EventsSubscription class was defined with delivery policy for \'event\' field that is not a DeliveryPolicy instance: str") tblen=5>')
+
+snapshots['test_subscription_type_raises_error_when_defined_with_time_window_for_non_list 1'] = GenericRepr('<ExceptionInfo ValueError("EventsSubscription class was defined with TimeWindow delivery policy for \'event\' field that doesn\'t return a list") tblen=5>')
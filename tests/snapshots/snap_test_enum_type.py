@@ -7,20 +7,20 @@ from snapshottest import GenericRepr, Snapshot
 
 snapshots = Snapshot()
 
-snapshots['test_enum_type_raises_attribute_error_when_defined_without_schema 1'] = GenericRepr('<ExceptionInfo AttributeError("type object \'UserRoleEnum\' has no attribute \'__schema__\'") tblen=2>')
+snapshots['test_enum_type_raises_attribute_error_when_defined_without_schema 1'] = GenericRepr('<ExceptionInfo AttributeError("type object \'UserRoleEnum\' has no attribute \'__schema__\'") tblen=3>')
 
-snapshots['test_enum_type_raises_error_when_defined_with_invalid_graphql_type_schema 1'] = GenericRepr("<ExceptionInfo ValueError('UserRoleEnum class was defined with __schema__ without GraphQL enum') tblen=3>")
+snapshots['test_enum_type_raises_error_when_defined_with_invalid_graphql_type_schema 1'] = GenericRepr("<ExceptionInfo ValueError('UserRoleEnum class was defined with __schema__ without GraphQL enum') tblen=5>")
 
-snapshots['test_enum_type_raises_error_when_defined_with_invalid_schema_str 1'] = GenericRepr('<ExceptionInfo GraphQLSyntaxError("Syntax Error: Unexpected Name \'enom\'.", locations=[SourceLocation(line=1, column=1)]) tblen=7>')
+snapshots['test_enum_type_raises_error_when_defined_with_invalid_schema_str 1'] = GenericRepr('<ExceptionInfo GraphQLSyntaxError("Syntax Error: Unexpected Name \'enom\'.", locations=[SourceLocation(line=1, column=1)]) tblen=8>')
 
-snapshots['test_enum_type_raises_error_when_defined_with_invalid_schema_type 1'] = GenericRepr("<ExceptionInfo TypeError('UserRoleEnum class was defined with __schema__ of invalid type: bool') tblen=3>")
+snapshots['test_enum_type_raises_error_when_defined_with_invalid_schema_type 1'] = GenericRepr("<ExceptionInfo TypeError('UserRoleEnum class was defined with __schema__ of invalid type: bool') tblen=4>")
 
-snapshots['test_enum_type_raises_error_when_defined_with_multiple_types_schema 1'] = GenericRepr("<ExceptionInfo ValueError('UserRoleEnum class was defined with __schema__ containing more than one GraphQL definition (found: EnumTypeDefinitionNode, EnumTypeDefinitionNode)') tblen=3>")
+snapshots['test_enum_type_raises_error_when_defined_with_multiple_types_schema 1'] = GenericRepr("<ExceptionInfo ValueError('UserRoleEnum class was defined with __schema__ containing more than one GraphQL definition (found: EnumTypeDefinitionNode, EnumTypeDefinitionNode)') tblen=4>")
 
-snapshots['test_enum_type_raises_error_when_dict_mapping_has_extra_items_not_in_definition 1'] = GenericRepr("<ExceptionInfo ValueError('UserRoleEnum class was defined with __enum__ containing extra items missing in GraphQL definition: REVIEW') tblen=3>")
+snapshots['test_enum_type_raises_error_when_dict_mapping_has_extra_items_not_in_definition 1'] = GenericRepr("<ExceptionInfo ValueError('UserRoleEnum class was defined with __enum__ containing extra items missing in GraphQL definition: REVIEW') tblen=5>")
 
-snapshots['test_enum_type_raises_error_when_dict_mapping_misses_items_from_definition 1'] = GenericRepr("<ExceptionInfo ValueError('UserRoleEnum class was defined with __enum__ missing following items required by GraphQL definition: MOD') tblen=3>")
+snapshots['test_enum_type_raises_error_when_dict_mapping_misses_items_from_definition 1'] = GenericRepr("<ExceptionInfo ValueError('UserRoleEnum class was defined with __enum__ missing following items required by GraphQL definition: MOD') tblen=5>")
 
-snapshots['test_enum_type_raises_error_when_enum_mapping_has_extra_items_not_in_definition 1'] = GenericRepr("<ExceptionInfo ValueError('UserRoleEnum class was defined with __enum__ containing extra items missing in GraphQL definition: REVIEW') tblen=3>")
+snapshots['test_enum_type_raises_error_when_enum_mapping_has_extra_items_not_in_definition 1'] = GenericRepr("<ExceptionInfo ValueError('UserRoleEnum class was defined with __enum__ containing extra items missing in GraphQL definition: REVIEW') tblen=5>")
 
-snapshots['test_enum_type_raises_error_when_enum_mapping_misses_items_from_definition 1'] = GenericRepr("<ExceptionInfo ValueError('UserRoleEnum class was defined with __enum__ missing following items required by GraphQL definition: MOD') tblen=3>")
+snapshots['test_enum_type_raises_error_when_enum_mapping_misses_items_from_definition 1'] = GenericRepr("<ExceptionInfo ValueError('UserRoleEnum class was defined with __enum__ missing following items required by GraphQL definition: MOD') tblen=5>")
@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+# snapshottest: v1 - https://goo.gl/zC4yUc
+from __future__ import unicode_literals
+
+from snapshottest import GenericRepr, Snapshot
+
+
+snapshots = Snapshot()
+
+snapshots['test_object_type_raises_error_when_defined_with_cache_for_nonexisting_field 1'] = GenericRepr("<ExceptionInfo ValueError('UserType class was defined with cache for fields not in GraphQL type: name') tblen=5>")
+
+snapshots['test_object_type_raises_error_when_defined_with_invalid_cache 1'] = GenericRepr('<ExceptionInfo TypeError("UserType class was defined with cache for \'id\' field that is not a FieldCache instance: int") tblen=5>')
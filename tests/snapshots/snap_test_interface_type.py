@@ -7,26 +7,26 @@ from snapshottest import GenericRepr, Snapshot
 
 snapshots = Snapshot()
 
-snapshots['test_interface_type_raises_attribute_error_when_defined_without_schema 1'] = GenericRepr('<ExceptionInfo AttributeError("type object \'ExampleInterface\' has no attribute \'__schema__\'") tblen=2>')
+snapshots['test_interface_type_raises_attribute_error_when_defined_without_schema 1'] = GenericRepr('<ExceptionInfo AttributeError("type object \'ExampleInterface\' has no attribute \'__schema__\'") tblen=3>')
 
-snapshots['test_interface_type_raises_error_when_defined_with_alias_for_nonexisting_field 1'] = GenericRepr("<ExceptionInfo ValueError('ExampleInterface class was defined with aliases for fields not in GraphQL type: joinedDate') tblen=3>")
+snapshots['test_interface_type_raises_error_when_defined_with_alias_for_nonexisting_field 1'] = GenericRepr("<ExceptionInfo ValueError('ExampleInterface class was defined with aliases for fields not in GraphQL type: joinedDate') tblen=5>")
 
-snapshots['test_interface_type_raises_error_when_defined_with_invalid_graphql_type_schema 1'] = GenericRepr("<ExceptionInfo ValueError('ExampleInterface class was defined with __schema__ without GraphQL interface') tblen=3>")
+snapshots['test_interface_type_raises_error_when_defined_with_invalid_graphql_type_schema 1'] = GenericRepr("<ExceptionInfo ValueError('ExampleInterface class was defined with __schema__ without GraphQL interface') tblen=5>")
 
-snapshots['test_interface_type_raises_error_when_defined_with_invalid_schema_str 1'] = GenericRepr('<ExceptionInfo GraphQLSyntaxError("Syntax Error: Unexpected Name \'interfaco\'.", locations=[SourceLocation(line=1, column=1)]) tblen=7>')
+snapshots['test_interface_type_raises_error_when_defined_with_invalid_schema_str 1'] = GenericRepr('<ExceptionInfo GraphQLSyntaxError("Syntax Error: Unexpected Name \'interfaco\'.", locations=[SourceLocation(line=1, column=1)]) tblen=8>')
 
-snapshots['test_interface_type_raises_error_when_defined_with_invalid_schema_type 1'] = GenericRepr("<ExceptionInfo TypeError('ExampleInterface class was defined with __schema__ of invalid type: bool') tblen=3>")
+snapshots['test_interface_type_raises_error_when_defined_with_invalid_schema_type 1'] = GenericRepr("<ExceptionInfo TypeError('ExampleInterface class was defined with __schema__ of invalid type: bool') tblen=4>")
 
-snapshots['test_interface_type_raises_error_when_defined_with_multiple_types_schema 1'] = GenericRepr("<ExceptionInfo ValueError('ExampleInterface class was defined with __schema__ containing more than one GraphQL definition (found: InterfaceTypeDefinitionNode, InterfaceTypeDefinitionNode)') tblen=3>")
+snapshots['test_interface_type_raises_error_when_defined_with_multiple_types_schema 1'] = GenericRepr("<ExceptionInfo ValueError('ExampleInterface class was defined with __schema__ containing more than one GraphQL definition (found: InterfaceTypeDefinitionNode, InterfaceTypeDefinitionNode)') tblen=4>")
 
-snapshots['test_interface_type_raises_error_when_defined_with_resolver_for_nonexisting_field 1'] = GenericRepr("<ExceptionInfo ValueError('ExampleInterface class was defined with resolvers for fields not in GraphQL type: resolve_group') tblen=3>")
+snapshots['test_interface_type_raises_error_when_defined_with_resolver_for_nonexisting_field 1'] = GenericRepr("<ExceptionInfo ValueError('ExampleInterface class was defined with resolvers for fields not in GraphQL type: resolve_group') tblen=5>")
 
-snapshots['test_interface_type_raises_error_when_defined_without_argument_type_dependency 1'] = GenericRepr('<ExceptionInfo ValueError("ExampleInterface class was defined without required GraphQL definition for \'UserInput\' in __requires__") tblen=3>')
+snapshots['test_interface_type_raises_error_when_defined_without_argument_type_dependency 1'] = GenericRepr('<ExceptionInfo ValueError("ExampleInterface class was defined without required GraphQL definition for \'UserInput\' in __requires__") tblen=5>')
 
-snapshots['test_interface_type_raises_error_when_defined_without_extended_dependency 1'] = GenericRepr("<ExceptionInfo ValueError('ExtendExampleInterface class was defined with __schema__ without GraphQL type') tblen=3>")
+snapshots['test_interface_type_raises_error_when_defined_without_extended_dependency 1'] = GenericRepr("<ExceptionInfo ValueError('ExtendExampleInterface class was defined with __schema__ without GraphQL type') tblen=5>")
 
-snapshots['test_interface_type_raises_error_when_defined_without_fields 1'] = GenericRepr("<ExceptionInfo ValueError('ExampleInterface class was defined with __schema__ containing empty GraphQL interface definition') tblen=3>")
+snapshots['test_interface_type_raises_error_when_defined_without_fields 1'] = GenericRepr("<ExceptionInfo ValueError('ExampleInterface class was defined with __schema__ containing empty GraphQL interface definition') tblen=5>")
 
-snapshots['test_interface_type_raises_error_when_defined_without_return_type_dependency 1'] = GenericRepr('<ExceptionInfo ValueError("ExampleInterface class was defined without required GraphQL definition for \'Group\' in __requires__") tblen=3>')
+snapshots['test_interface_type_raises_error_when_defined_without_return_type_dependency 1'] = GenericRepr('<ExceptionInfo ValueError("ExampleInterface class was defined without required GraphQL definition for \'Group\' in __requires__") tblen=5>')
 
-snapshots['test_interface_type_raises_error_when_extended_dependency_is_wrong_type 1'] = GenericRepr('<ExceptionInfo ValueError("ExampleInterface requires \'Example\' to be GraphQL interface but other type was provided in \'__requires__\'") tblen=3>')
+snapshots['test_interface_type_raises_error_when_extended_dependency_is_wrong_type 1'] = GenericRepr('<ExceptionInfo ValueError("ExampleInterface requires \'Example\' to be GraphQL interface but other type was provided in \'__requires__\'") tblen=5>')
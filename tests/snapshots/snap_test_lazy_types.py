@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+# snapshottest: v1 - https://goo.gl/zC4yUc
+from __future__ import unicode_literals
+
+from snapshottest import Snapshot
+
+
+snapshots = Snapshot()
+
+snapshots['test_lazy_type_raises_validation_error_naming_type_on_prepare 1'] = "UserType class was defined without required GraphQL definition for 'Group' in __requires__"
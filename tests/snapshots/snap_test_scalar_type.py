@@ -7,12 +7,12 @@ from snapshottest import GenericRepr, Snapshot
 
 snapshots = Snapshot()
 
-snapshots['test_scalar_type_raises_attribute_error_when_defined_without_schema 1'] = GenericRepr('<ExceptionInfo AttributeError("type object \'DateScalar\' has no attribute \'__schema__\'") tblen=2>')
+snapshots['test_scalar_type_raises_attribute_error_when_defined_without_schema 1'] = GenericRepr('<ExceptionInfo AttributeError("type object \'DateScalar\' has no attribute \'__schema__\'") tblen=3>')
 
-snapshots['test_scalar_type_raises_error_when_defined_with_invalid_graphql_type_schema 1'] = GenericRepr("<ExceptionInfo ValueError('DateScalar class was defined with __schema__ without GraphQL scalar') tblen=3>")
+snapshots['test_scalar_type_raises_error_when_defined_with_invalid_graphql_type_schema 1'] = GenericRepr("<ExceptionInfo ValueError('DateScalar class was defined with __schema__ without GraphQL scalar') tblen=5>")
 
-snapshots['test_scalar_type_raises_error_when_defined_with_invalid_schema_str 1'] = GenericRepr('<ExceptionInfo GraphQLSyntaxError("Syntax Error: Unexpected Name \'scalor\'.", locations=[SourceLocation(line=1, column=1)]) tblen=7>')
+snapshots['test_scalar_type_raises_error_when_defined_with_invalid_schema_str 1'] = GenericRepr('<ExceptionInfo GraphQLSyntaxError("Syntax Error: Unexpected Name \'scalor\'.", locations=[SourceLocation(line=1, column=1)]) tblen=8>')
 
-snapshots['test_scalar_type_raises_error_when_defined_with_invalid_schema_type 1'] = GenericRepr("<ExceptionInfo TypeError('DateScalar class was defined with __schema__ of invalid type: bool') tblen=3>")
+snapshots['test_scalar_type_raises_error_when_defined_with_invalid_schema_type 1'] = GenericRepr("<ExceptionInfo TypeError('DateScalar class was defined with __schema__ of invalid type: bool') tblen=4>")
 
-snapshots['test_scalar_type_raises_error_when_defined_with_multiple_types_schema 1'] = GenericRepr("<ExceptionInfo ValueError('DateScalar class was defined with __schema__ containing more than one GraphQL definition (found: ScalarTypeDefinitionNode, ScalarTypeDefinitionNode)') tblen=3>")
+snapshots['test_scalar_type_raises_error_when_defined_with_multiple_types_schema 1'] = GenericRepr("<ExceptionInfo ValueError('DateScalar class was defined with __schema__ containing more than one GraphQL definition (found: ScalarTypeDefinitionNode, ScalarTypeDefinitionNode)') tblen=4>")
@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+# snapshottest: v1 - https://goo.gl/zC4yUc
+from __future__ import unicode_literals
+
+from snapshottest import GenericRepr, Snapshot
+
+
+snapshots = Snapshot()
+
+snapshots['test_schema_cache_raises_error_for_lazy_type_with_invalid_schema 1'] = GenericRepr("<ExceptionInfo TypeError('InvalidQueryType class was defined with __schema__ of invalid type: int') tblen=3>")
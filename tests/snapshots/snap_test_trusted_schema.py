@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+# snapshottest: v1 - https://goo.gl/zC4yUc
+from __future__ import unicode_literals
+
+from snapshottest import GenericRepr, Snapshot
+
+
+snapshots = Snapshot()
+
+snapshots['test_python_attributes_of_schema_with_trusted_fingerprint_are_validated 1'] = GenericRepr("<ExceptionInfo ValueError('QueryType class was defined with fields args mappings for fields not in GraphQL type: invalid') tblen=6>")
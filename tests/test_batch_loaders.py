@@ -0,0 +1,428 @@
+import pytest
+from graphql import graphql, graphql_sync
+
+from ariadne_graphql_modules import ObjectType, make_executable_schema
+
+
+@pytest.mark.asyncio
+async def test_batch_resolver_is_called_once_for_all_sources():
+    batch_calls = []
+
+    class UserType(ObjectType):
+        __schema__ = """
+        type User {
+            id: ID!
+            group: String
+        }
+        """
+
+        @staticmethod
+        def batch_resolve_group(users, *_):
+            batch_calls.append([user["id"] for user in users])
+            return [f"Group {user['id']}" for user in users]
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            users: [User!]!
+        }
+        """
+        __requires__ = [UserType]
+
+        @staticmethod
+        async def resolve_users(*_):
+            return [{"id": 1}, {"id": 2}, {"id": 3}]
+
+    schema = make_executable_schema(QueryType)
+
+    result = await graphql(schema, "{ users { id group } }", context_value={})
+    assert result.errors is None
+    assert result.data == {
+        "users": [
+            {"id": "1", "group": "Group 1"},
+            {"id": "2", "group": "Group 2"},
+            {"id": "3", "group": "Group 3"},
+        ]
+    }
+    assert batch_calls == [[1, 2, 3]]
+
+
+@pytest.mark.asyncio
+async def test_async_batch_resolver_is_called_once_for_all_sources():
+    batch_calls = []
+
+    class UserType(ObjectType):
+        __schema__ = """
+        type User {
+            group: String
+        }
+        """
+
+        @staticmethod
+        async def batch_resolve_group(users, *_):
+            batch_calls.append([user["id"] for user in users])
+            return [f"Group {user['id']}" for user in users]
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            users: [User!]!
+        }
+        """
+        __requires__ = [UserType]
+
+        @staticmethod
+        async def resolve_users(*_):
+            return [{"id": 1}, {"id": 2}, {"id": 3}]
+
+    schema = make_executable_schema(QueryType)
+
+    result = await graphql(schema, "{ users { group } }", context_value={})
+    assert result.errors is None
+    assert result.data == {
+        "users": [{"group": "Group 1"}, {"group": "Group 2"}, {"group": "Group 3"}]
+    }
+    assert batch_calls == [[1, 2, 3]]
+
+
+@pytest.mark.asyncio
+async def test_batch_resolver_is_called_once_for_every_args_combination():
+    batch_calls = []
+
+    class UserType(ObjectType):
+        __schema__ = """
+        type User {
+            scores(multiplier: Int!): [Int!]!
+        }
+        """
+
+        @staticmethod
+        def batch_resolve_scores(users, *_, multiplier):
+            batch_calls.append([user["id"] for user in users])
+            return [[user["id"] * multiplier] for user in users]
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            users: [User!]!
+        }
+        """
+        __requires__ = [UserType]
+
+        @staticmethod
+        async def resolve_users(*_):
+            return [{"id": 1}, {"id": 2}, {"id": 3}]
+
+    schema = make_executable_schema(QueryType)
+
+    result = await graphql(
+        schema,
+        "{ users { double: scores(multiplier: 2) triple: scores(multiplier: 3) } }",
+        context_value={},
+    )
+    assert result.errors is None
+    assert result.data["users"][2] == {"double": [6], "triple": [9]}
+    assert batch_calls == [[1, 2, 3], [1, 2, 3]]
+
+
+@pytest.mark.asyncio
+async def test_batch_resolver_results_are_cached_in_request():
+    batch_calls = []
+
+    class UserType(ObjectType):
+        __schema__ = """
+        type User {
+            group: String
+        }
+        """
+
+        @staticmethod
+        def batch_resolve_group(users, *_):
+            batch_calls.append([user["id"] for user in users])
+            return [f"Group {user['id']}" for user in users]
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            users: [User!]!
+        }
+        """
+        __requires__ = [UserType]
+
+        @staticmethod
+        async def resolve_users(*_):
+            return [{"id": 1}, {"id": 2}, {"id": 3}]
+
+    schema = make_executable_schema(QueryType)
+
+    result = await graphql(
+        schema,
+        "{ users { group otherGroup: group } }",
+        context_value={},
+    )
+    assert result.errors is None
+    assert result.data["users"][0] == {"group": "Group 1", "otherGroup": "Group 1"}
+    assert batch_calls == [[1, 2, 3]]
+
+
+@pytest.mark.asyncio
+async def test_batch_resolver_results_are_not_shared_between_requests():
+    batch_calls = []
+
+    class UserType(ObjectType):
+        __schema__ = """
+        type User {
+            group: String
+        }
+        """
+
+        @staticmethod
+        def batch_resolve_group(users, *_):
+            batch_calls.append([user["id"] for user in users])
+            return [f"Group {user['id']}" for user in users]
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            users: [User!]!
+        }
+        """
+        __requires__ = [UserType]
+
+        @staticmethod
+        async def resolve_users(*_):
+            return [{"id": 1}, {"id": 2}, {"id": 3}]
+
+    schema = make_executable_schema(QueryType)
+
+    await graphql(schema, "{ users { group } }", context_value={})
+    await graphql(schema, "{ users { group } }", context_value={})
+    assert batch_calls == [[1, 2, 3], [1, 2, 3]]
+
+
+@pytest.mark.asyncio
+async def test_batch_loaders_are_stored_on_context_object():
+    batch_calls = []
+
+    class UserType(ObjectType):
+        __schema__ = """
+        type User {
+            group: String
+        }
+        """
+
+        @staticmethod
+        def batch_resolve_group(users, *_):
+            batch_calls.append([user["id"] for user in users])
+            return [f"Group {user['id']}" for user in users]
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            users: [User!]!
+        }
+        """
+        __requires__ = [UserType]
+
+        @staticmethod
+        async def resolve_users(*_):
+            return [{"id": 1}, {"id": 2}, {"id": 3}]
+
+    schema = make_executable_schema(QueryType)
+
+    class Context:
+        pass
+
+    result = await graphql(schema, "{ users { group } }", context_value=Context())
+    assert result.errors is None
+    assert batch_calls == [[1, 2, 3]]
+
+
+@pytest.mark.asyncio
+async def test_batch_resolver_raises_error_for_context_that_cant_store_loaders():
+    batch_calls = []
+
+    class UserType(ObjectType):
+        __schema__ = """
+        type User {
+            group: String
+        }
+        """
+
+        @staticmethod
+        def batch_resolve_group(users, *_):
+            batch_calls.append([user["id"] for user in users])
+            return [f"Group {user['id']}" for user in users]
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            users: [User!]!
+        }
+        """
+        __requires__ = [UserType]
+
+        @staticmethod
+        async def resolve_users(*_):
+            return [{"id": 1}, {"id": 2}, {"id": 3}]
+
+    schema = make_executable_schema(QueryType)
+
+    result = await graphql(schema, "{ users { group } }")
+    assert result.errors[0].message == (
+        "UserType batch resolver requires context that is a dict "
+        "or object supporting attributes, not NoneType"
+    )
+    assert not batch_calls
+
+
+@pytest.mark.asyncio
+async def test_batch_resolver_error_is_set_for_all_sources():
+    class UserType(ObjectType):
+        __schema__ = """
+        type User {
+            group: String
+        }
+        """
+
+        @staticmethod
+        def batch_resolve_group(*_):
+            raise ValueError("Test error")
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            users: [User!]!
+        }
+        """
+        __requires__ = [UserType]
+
+        @staticmethod
+        def resolve_users(*_):
+            return [{}, {}]
+
+    schema = make_executable_schema(QueryType)
+    result = await graphql(schema, "{ users { group } }", context_value={})
+    assert result.data == {"users": [{"group": None}, {"group": None}]}
+    assert [error.message for error in result.errors] == ["Test error", "Test error"]
+
+
+@pytest.mark.asyncio
+async def test_batch_resolver_returning_invalid_number_of_values_raises_error():
+    class UserType(ObjectType):
+        __schema__ = """
+        type User {
+            group: String
+        }
+        """
+
+        @staticmethod
+        def batch_resolve_group(*_):
+            return ["Group"]
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            users: [User!]!
+        }
+        """
+        __requires__ = [UserType]
+
+        @staticmethod
+        def resolve_users(*_):
+            return [{}, {}]
+
+    schema = make_executable_schema(QueryType)
+    result = await graphql(schema, "{ users { group } }", context_value={})
+    assert result.errors[0].message == (
+        "UserType batch resolver returned 1 values for 2 sources"
+    )
+
+
+def test_batch_resolver_resolves_every_source_in_sync_execution():
+    batch_calls = []
+
+    class UserType(ObjectType):
+        __schema__ = """
+        type User {
+            id: ID!
+            group: String
+        }
+        """
+
+        @staticmethod
+        def batch_resolve_group(users, *_):
+            batch_calls.append([user["id"] for user in users])
+            return [f"Group {user['id']}" for user in users]
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            users: [User!]!
+        }
+        """
+        __requires__ = [UserType]
+
+        @staticmethod
+        def resolve_users(*_):
+            return [{"id": 1}, {"id": 2}]
+
+    schema = make_executable_schema(QueryType)
+    result = graphql_sync(schema, "{ users { group again: group } }", context_value={})
+    assert result.errors is None
+    assert result.data == {
+        "users": [
+            {"group": "Group 1", "again": "Group 1"},
+            {"group": "Group 2", "again": "Group 2"},
+        ]
+    }
+    assert batch_calls == [[1], [2]]
+
+
+def test_batch_resolver_can_be_used_for_aliased_field():
+    class UserType(ObjectType):
+        __schema__ = """
+        type User {
+            groupName: String
+        }
+        """
+        __aliases__ = {"groupName": "group_name"}
+
+        @staticmethod
+        def batch_resolve_group_name(users, *_):
+            return ["Admins" for _ in users]
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            user: User!
+        }
+        """
+        __requires__ = [UserType]
+
+        @staticmethod
+        def resolve_user(*_):
+            return {}
+
+    schema = make_executable_schema(QueryType)
+    result = graphql_sync(schema, "{ user { groupName } }")
+    assert result.data == {"user": {"groupName": "Admins"}}
+
+
+def test_object_type_raises_error_when_defined_with_batch_resolver_for_nonexisting_field(
+    snapshot,
+):
+    with pytest.raises(ValueError) as err:
+        # pylint: disable=unused-variable
+        class UserType(ObjectType):
+            __schema__ = """
+            type User {
+                id: ID!
+            }
+            """
+
+            @staticmethod
+            def batch_resolve_group(*_):
+                return []
+
+    snapshot.assert_match(err)
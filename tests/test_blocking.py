@@ -0,0 +1,312 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from graphql import graphql, graphql_sync
+
+from ariadne_graphql_modules import (
+    BlockingExecutor,
+    MutationType,
+    ObjectType,
+    blocking,
+    make_executable_schema,
+)
+
+
+@pytest.mark.asyncio
+async def test_blocking_resolver_is_ran_in_threads_pool():
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            thread: String!
+            other: String!
+        }
+        """
+
+        @staticmethod
+        @blocking
+        def resolve_thread(*_):
+            return threading.current_thread().name
+
+        @staticmethod
+        def resolve_other(*_):
+            return threading.current_thread().name
+
+    schema = make_executable_schema(QueryType)
+
+    result = await graphql(schema, "{ thread other }")
+    assert result.errors is None
+    assert result.data["thread"].startswith("graphql-blocking")
+    assert result.data["other"] == threading.current_thread().name
+
+
+def test_blocking_resolver_is_called_directly_in_sync_execution():
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            thread: String!
+        }
+        """
+
+        @staticmethod
+        @blocking
+        def resolve_thread(*_):
+            return threading.current_thread().name
+
+    schema = make_executable_schema(QueryType)
+
+    result = graphql_sync(schema, "{ thread }")
+    assert result.errors is None
+    assert result.data == {"thread": threading.current_thread().name}
+
+
+@pytest.mark.asyncio
+async def test_all_type_resolvers_are_ran_in_threads_pool_if_type_is_blocking():
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            thread: String!
+            other: String!
+        }
+        """
+        __blocking__ = True
+
+        @staticmethod
+        def resolve_thread(*_):
+            return threading.current_thread().name
+
+        @staticmethod
+        def resolve_other(*_):
+            return threading.current_thread().name
+
+    schema = make_executable_schema(QueryType)
+    result = await graphql(schema, "{ thread other }")
+    assert result.errors is None
+    assert result.data["thread"].startswith("graphql-blocking")
+    assert result.data["other"].startswith("graphql-blocking")
+
+
+@pytest.mark.asyncio
+async def test_async_resolvers_of_blocking_type_are_not_ran_in_threads_pool():
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            thread: String!
+            other: String!
+        }
+        """
+        __blocking__ = True
+
+        @staticmethod
+        def resolve_thread(*_):
+            return threading.current_thread().name
+
+        @staticmethod
+        async def resolve_other(*_):
+            return threading.current_thread().name
+
+    schema = make_executable_schema(QueryType)
+    result = await graphql(schema, "{ thread other }")
+    assert result.errors is None
+    assert result.data["thread"].startswith("graphql-blocking")
+    assert result.data["other"] == threading.current_thread().name
+
+
+def test_blocking_decorator_raises_error_when_applied_to_async_resolver(snapshot):
+    with pytest.raises(TypeError) as err:
+        # pylint: disable=unused-variable
+        class QueryType(ObjectType):
+            __schema__ = """
+            type Query {
+                other: String!
+            }
+            """
+
+            @staticmethod
+            @blocking
+            async def resolve_other(*_):
+                return "other"
+
+    snapshot.assert_match(err)
+
+
+@pytest.mark.asyncio
+async def test_blocking_decorator_can_be_applied_to_staticmethod():
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            thread: String!
+        }
+        """
+
+        @blocking
+        @staticmethod
+        def resolve_thread(*_):
+            return threading.current_thread().name
+
+    schema = make_executable_schema(QueryType)
+    result = await graphql(schema, "{ thread }")
+    assert result.data["thread"].startswith("graphql-blocking")
+
+
+@pytest.mark.asyncio
+async def test_blocking_limit_bounds_number_of_concurrently_ran_resolvers():
+    running = []
+    max_running = []
+    lock = threading.Lock()
+
+    class ItemType(ObjectType):
+        __schema__ = """
+        type Item {
+            value: Int!
+        }
+        """
+        __blocking_limit__ = 2
+        __blocking_executor__ = BlockingExecutor(max_workers=8)
+
+        @staticmethod
+        @blocking
+        def resolve_value(item, *_):
+            with lock:
+                running.append(item)
+                max_running.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.remove(item)
+            return item
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            items: [Item!]!
+        }
+        """
+        __requires__ = [ItemType]
+
+        @staticmethod
+        def resolve_items(*_):
+            return list(range(6))
+
+    schema = make_executable_schema(QueryType)
+    result = await graphql(schema, "{ items { value } }")
+    assert result.errors is None
+    assert result.data == {"items": [{"value": i} for i in range(6)]}
+    assert max(max_running) == 2
+
+    stats = ItemType.__blocking_executor__.get_stats(ItemType)
+    assert stats.count == 6
+    assert stats.max_queue_time > 0
+    assert stats.average_queue_time > 0
+    ItemType.__blocking_executor__.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_blocking_resolver_doesnt_block_event_loop():
+    ticks = []
+
+    async def ticker():
+        for _ in range(3):
+            ticks.append(1)
+            await asyncio.sleep(0.005)
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            slow: Int!
+        }
+        """
+
+        @staticmethod
+        @blocking
+        def resolve_slow(*_):
+            time.sleep(0.05)
+            return len(ticks)
+
+    schema = make_executable_schema(QueryType)
+    task = asyncio.ensure_future(ticker())
+    result = await graphql(schema, "{ slow }")
+    await task
+    assert result.data["slow"] >= 2
+
+
+@pytest.mark.asyncio
+async def test_blocking_mutation_is_ran_in_threads_pool():
+    class ThreadMutation(MutationType):
+        __schema__ = """
+        type Mutation {
+            thread: String!
+        }
+        """
+
+        @staticmethod
+        @blocking
+        def resolve_mutation(*_):
+            return threading.current_thread().name
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            other: String
+        }
+        """
+
+    schema = make_executable_schema(QueryType, ThreadMutation)
+    result = await graphql(schema, "mutation { thread }")
+    assert result.errors is None
+    assert result.data["thread"].startswith("graphql-blocking")
+
+
+def test_blocking_limit_is_kept_separately_for_every_type_and_event_loop():
+    executor = BlockingExecutor(max_workers=4)
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            items: [Int!]!
+        }
+        """
+        __blocking_limit__ = 1
+        __blocking_executor__ = executor
+
+        @staticmethod
+        @blocking
+        def resolve_items(*_):
+            time.sleep(0.001)
+            return [1]
+
+    first_type = QueryType
+
+    # Types with same name are defined in different modules in real projects
+    class QueryType(ObjectType):  # pylint: disable=function-redefined
+        __schema__ = """
+        type Query {
+            items: [Int!]!
+        }
+        """
+        __blocking_limit__ = 1
+        __blocking_executor__ = executor
+
+        @staticmethod
+        @blocking
+        def resolve_items(*_):
+            time.sleep(0.001)
+            return [1]
+
+    second_type = QueryType
+
+    async def execute(query_type):
+        schema = make_executable_schema(query_type)
+        results = await asyncio.gather(
+            *(graphql(schema, "{ items }") for _ in range(3))
+        )
+        assert all(result.errors is None for result in results)
+
+    # Contended semaphore used in other event loop fails on Python < 3.10
+    asyncio.run(execute(first_type))
+    asyncio.run(execute(first_type))
+    asyncio.run(execute(second_type))
+
+    assert executor.get_stats(first_type).count == 6
+    assert executor.get_stats(second_type).count == 3
+    executor.shutdown()
@@ -0,0 +1,501 @@
+import asyncio
+
+import pytest
+from graphql import parse, subscribe
+
+from ariadne_graphql_modules import (
+    Broadcaster,
+    ObjectType,
+    SubscriptionType,
+    make_executable_schema,
+)
+
+
+@pytest.mark.asyncio
+async def test_subscribers_with_same_arguments_share_source(channel, next_value):
+    broadcaster = Broadcaster()
+
+    class ChatSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            message(chat: ID!): String!
+        }
+        """
+        __broadcast__ = True
+        __broadcaster__ = broadcaster
+
+        @staticmethod
+        async def subscribe_message(*_, chat):
+            async for event in channel.listen():
+                yield f"{chat}: {event}"
+
+        @staticmethod
+        def resolve_message(event, *_, **__):
+            return event
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    schema = make_executable_schema(QueryType, ChatSubscription)
+
+    query = parse('subscription { message(chat: "1") }')
+    first = await subscribe(schema, query)
+    second = await subscribe(schema, query)
+
+    first_value = asyncio.ensure_future(next_value(first, "message"))
+    second_value = asyncio.ensure_future(next_value(second, "message"))
+    await channel.wait_for_listeners()
+    while broadcaster.subscribers < 2:
+        await asyncio.sleep(0)
+
+    channel.put("hello")
+    assert await first_value == "1: hello"
+    assert await second_value == "1: hello"
+    assert channel.opened == 1
+
+    stats = broadcaster.get_stats("ChatSubscription", "message")
+    assert stats.topics == 1
+    assert stats.subscribers == 2
+    assert stats.events == 1
+
+    await first.aclose()
+    await second.aclose()
+
+
+@pytest.mark.asyncio
+async def test_subscribers_with_different_arguments_use_separate_sources(
+    channel, next_value
+):
+    broadcaster = Broadcaster()
+
+    class ChatSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            message(chat: ID!): String!
+        }
+        """
+        __broadcast__ = True
+        __broadcaster__ = broadcaster
+
+        @staticmethod
+        async def subscribe_message(*_, chat):
+            async for event in channel.listen():
+                yield f"{chat}: {event}"
+
+        @staticmethod
+        def resolve_message(event, *_, **__):
+            return event
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    schema = make_executable_schema(QueryType, ChatSubscription)
+
+    first = await subscribe(schema, parse('subscription { message(chat: "1") }'))
+    second = await subscribe(schema, parse('subscription { message(chat: "2") }'))
+
+    first_value = asyncio.ensure_future(next_value(first, "message"))
+    second_value = asyncio.ensure_future(next_value(second, "message"))
+    await channel.wait_for_listeners(2)
+
+    channel.put("hello")
+    assert await first_value == "1: hello"
+    assert await second_value == "2: hello"
+    assert broadcaster.active_topics == 2
+
+    await first.aclose()
+    await second.aclose()
+
+
+@pytest.mark.asyncio
+async def test_shared_source_is_closed_when_last_subscriber_leaves(channel, next_value):
+    broadcaster = Broadcaster()
+
+    class ChatSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            other: String!
+        }
+        """
+        __broadcast__ = True
+        __broadcaster__ = broadcaster
+
+        @staticmethod
+        async def subscribe_other(*_):
+            async for event in channel.listen():
+                yield event
+
+        @staticmethod
+        def resolve_other(event, *_):
+            return event
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    schema = make_executable_schema(QueryType, ChatSubscription)
+
+    query = parse("subscription { other }")
+    first = await subscribe(schema, query)
+    second = await subscribe(schema, query)
+
+    first_value = asyncio.ensure_future(next_value(first, "other"))
+    second_value = asyncio.ensure_future(next_value(second, "other"))
+    await channel.wait_for_listeners()
+    while broadcaster.subscribers < 2:
+        await asyncio.sleep(0)
+
+    channel.put("hello")
+    await first_value
+    await second_value
+
+    await first.aclose()
+    assert broadcaster.subscribers == 1
+    assert channel.closed == 0
+
+    await second.aclose()
+    while channel.closed < 1:
+        await asyncio.sleep(0)
+
+    stats = broadcaster.get_stats("ChatSubscription", "other")
+    assert stats.topics == 0
+    assert stats.subscribers == 0
+    assert broadcaster.active_topics == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_loses_oldest_events(channel, next_value):
+    broadcaster = Broadcaster()
+
+    class ChatSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            other: String!
+        }
+        """
+        __broadcast__ = True
+        __broadcaster__ = broadcaster
+        __broadcast_queue_size__ = 2
+
+        @staticmethod
+        async def subscribe_other(*_):
+            async for event in channel.listen():
+                yield event
+
+        @staticmethod
+        def resolve_other(event, *_):
+            return event
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    schema = make_executable_schema(QueryType, ChatSubscription)
+
+    subscription = await subscribe(schema, parse("subscription { other }"))
+    first_value = asyncio.ensure_future(next_value(subscription, "other"))
+    await channel.wait_for_listeners()
+
+    channel.put("a")
+    assert await first_value == "a"
+
+    channel.put("b", "c", "d")
+    while broadcaster.get_stats("ChatSubscription", "other").events < 4:
+        await asyncio.sleep(0)
+
+    assert await next_value(subscription, "other") == "c"
+    assert await next_value(subscription, "other") == "d"
+    assert broadcaster.get_stats("ChatSubscription", "other").dropped == 1
+
+    await subscription.aclose()
+
+
+@pytest.mark.asyncio
+async def test_shared_source_error_is_raised_for_all_subscribers(channel, next_result):
+    broadcaster = Broadcaster()
+
+    class ChatSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            other: String!
+        }
+        """
+        __broadcast__ = True
+        __broadcaster__ = broadcaster
+
+        @staticmethod
+        async def subscribe_other(*_):
+            async for event in channel.listen():
+                yield event
+
+        @staticmethod
+        def resolve_other(event, *_):
+            return event
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    schema = make_executable_schema(QueryType, ChatSubscription)
+
+    query = parse("subscription { other }")
+    first = await subscribe(schema, query)
+    second = await subscribe(schema, query)
+
+    first_value = asyncio.ensure_future(next_result(first))
+    second_value = asyncio.ensure_future(next_result(second))
+    await channel.wait_for_listeners()
+    while broadcaster.subscribers < 2:
+        await asyncio.sleep(0)
+
+    channel.put(ValueError("Source failed"))
+    for value in (first_value, second_value):
+        with pytest.raises(ValueError):
+            await value
+
+    assert broadcaster.active_topics == 0
+
+
+@pytest.mark.asyncio
+async def test_only_listed_fields_are_broadcast(channel, next_value):
+    broadcaster = Broadcaster()
+
+    class ChatSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            message(chat: ID!): String!
+            other: String!
+        }
+        """
+        __broadcast__ = ["message"]
+        __broadcaster__ = broadcaster
+
+        @staticmethod
+        async def subscribe_message(*_, chat):
+            async for event in channel.listen():
+                yield f"{chat}: {event}"
+
+        @staticmethod
+        def resolve_message(event, *_, **__):
+            return event
+
+        @staticmethod
+        async def subscribe_other(*_):
+            async for event in channel.listen():
+                yield event
+
+        @staticmethod
+        def resolve_other(event, *_):
+            return event
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    schema = make_executable_schema(QueryType, ChatSubscription)
+
+    query = parse("subscription { other }")
+    first = await subscribe(schema, query)
+    second = await subscribe(schema, query)
+
+    first_value = asyncio.ensure_future(next_value(first, "other"))
+    second_value = asyncio.ensure_future(next_value(second, "other"))
+    await channel.wait_for_listeners(2)
+
+    channel.put("hello")
+    assert await first_value == "hello"
+    assert await second_value == "hello"
+    assert channel.opened == 2
+    assert broadcaster.active_topics == 0
+
+    await first.aclose()
+    await second.aclose()
+
+
+@pytest.mark.asyncio
+async def test_subscribers_are_grouped_in_topics_by_broadcast_key(channel, next_value):
+    broadcaster = Broadcaster()
+
+    class ChatSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            other: String!
+        }
+        """
+        __broadcast__ = True
+        __broadcaster__ = broadcaster
+
+        @staticmethod
+        def __broadcast_key__(_, info, **__):
+            return info.context["tenant"]
+
+        @staticmethod
+        async def subscribe_other(*_):
+            async for event in channel.listen():
+                yield event
+
+        @staticmethod
+        def resolve_other(event, *_):
+            return event
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    schema = make_executable_schema(QueryType, ChatSubscription)
+
+    query = parse("subscription { other }")
+    first = await subscribe(schema, query, context_value={"tenant": 1})
+    second = await subscribe(schema, query, context_value={"tenant": 1})
+    third = await subscribe(schema, query, context_value={"tenant": 2})
+
+    values = [
+        asyncio.ensure_future(next_value(subscription, "other"))
+        for subscription in (first, second, third)
+    ]
+    await channel.wait_for_listeners(2)
+    while broadcaster.subscribers < 3:
+        await asyncio.sleep(0)
+
+    channel.put("hello")
+    assert await asyncio.gather(*values) == ["hello", "hello", "hello"]
+    assert channel.opened == 2
+
+    for subscription in (first, second, third):
+        await subscription.aclose()
+
+
+@pytest.mark.asyncio
+async def test_types_with_same_name_dont_share_topics(channel, next_value):
+    broadcaster = Broadcaster()
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    class ChatSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            other: String!
+        }
+        """
+        __broadcast__ = True
+        __broadcaster__ = broadcaster
+
+        @staticmethod
+        async def subscribe_other(*_):
+            async for event in channel.listen():
+                yield f"first: {event}"
+
+        @staticmethod
+        def resolve_other(event, *_):
+            return event
+
+    first_schema = make_executable_schema(QueryType, ChatSubscription)
+
+    # pylint: disable=function-redefined
+    class ChatSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            other: String!
+        }
+        """
+        __broadcast__ = True
+        __broadcaster__ = broadcaster
+
+        @staticmethod
+        async def subscribe_other(*_):
+            async for event in channel.listen():
+                yield f"second: {event}"
+
+        @staticmethod
+        def resolve_other(event, *_):
+            return event
+
+    second_schema = make_executable_schema(QueryType, ChatSubscription)
+
+    query = parse("subscription { other }")
+    first = await subscribe(first_schema, query)
+    second = await subscribe(second_schema, query)
+
+    first_value = asyncio.ensure_future(next_value(first, "other"))
+    second_value = asyncio.ensure_future(next_value(second, "other"))
+    while broadcaster.subscribers < 2:
+        await asyncio.sleep(0)
+    await channel.wait_for_listeners(broadcaster.active_topics)
+
+    channel.put("hello")
+    assert await first_value == "first: hello"
+    assert await second_value == "second: hello"
+    assert broadcaster.active_topics == 2
+    assert broadcaster.get_stats("ChatSubscription", "other").topics == 2
+
+    await first.aclose()
+    await second.aclose()
+
+
+def test_subscription_type_raises_error_when_defined_with_broadcast_for_invalid_field(
+    snapshot,
+):
+    with pytest.raises(ValueError) as err:
+        # pylint: disable=unused-variable
+        class ChatSubscription(SubscriptionType):
+            __schema__ = """
+            type Subscription {
+                message: String!
+            }
+            """
+            __broadcast__ = ["chat"]
+
+            @staticmethod
+            async def subscribe_message(*_):
+                yield "hello"
+
+    snapshot.assert_match(err)
+
+
+def test_subscription_type_raises_error_when_defined_with_invalid_broadcast_key(
+    snapshot,
+):
+    with pytest.raises(TypeError) as err:
+        # pylint: disable=unused-variable
+        class ChatSubscription(SubscriptionType):
+            __schema__ = """
+            type Subscription {
+                message: String!
+            }
+            """
+            __broadcast__ = True
+            __broadcast_key__ = "tenant"
+
+            @staticmethod
+            async def subscribe_message(*_):
+                yield "hello"
+
+    snapshot.assert_match(err)
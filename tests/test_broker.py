@@ -0,0 +1,402 @@
+import asyncio
+
+import pytest
+from graphql import parse, subscribe
+
+from ariadne_graphql_modules import (
+    Broker,
+    BrokerTransport,
+    LatestValue,
+    ObjectType,
+    SubscriptionType,
+    escape_channel_arg,
+    make_executable_schema,
+)
+
+
+class LocalTransport(BrokerTransport):
+    """Stand-in for external transport, connecting brokers in single process"""
+
+    def __init__(self, transports):
+        self.transports = transports
+        self.transports.append(self)
+        self.receive = None
+        self.channels = set()
+        self.subscribed = []
+        self.unsubscribed = []
+
+    def connect(self, receive):
+        self.receive = receive
+
+    async def publish(self, channel, message):
+        for transport in self.transports:
+            if channel in transport.channels:
+                transport.receive(channel, message)
+
+    async def subscribe(self, channel):
+        self.channels.add(channel)
+        self.subscribed.append(channel)
+
+    async def unsubscribe(self, channel):
+        self.channels.discard(channel)
+        self.unsubscribed.append(channel)
+
+
+@pytest.mark.asyncio
+async def test_broker_publishes_messages_to_channel_subscribers(next_result):
+    broker = Broker()
+    first = broker.subscribe("chat:1")
+    second = broker.subscribe("chat:2")
+
+    first_message = asyncio.ensure_future(next_result(first))
+    second_message = asyncio.ensure_future(next_result(second))
+    while broker.subscribers < 2:
+        await asyncio.sleep(0)
+
+    await broker.publish("chat:1", "hello")
+    await broker.publish("chat:3", "other")
+    await broker.publish("chat:2", "world")
+
+    assert await first_message == "hello"
+    assert await second_message == "world"
+
+    await first.aclose()
+    await second.aclose()
+    assert broker.subscribers == 0
+    assert not broker.channels
+
+
+@pytest.mark.asyncio
+async def test_broker_close_ends_subscriptions(next_result):
+    broker = Broker()
+    subscription = broker.subscribe("chat:1")
+
+    message = asyncio.ensure_future(next_result(subscription))
+    while not broker.subscribers:
+        await asyncio.sleep(0)
+
+    broker.close()
+    with pytest.raises(StopAsyncIteration):
+        await message
+    assert not broker.channels
+
+
+@pytest.mark.asyncio
+async def test_subscription_receives_messages_from_channel_named_with_arguments(
+    next_result,
+):
+    broker = Broker()
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    class ChatSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            message(chat: ID!): String!
+        }
+        """
+        __channels__ = {"message": "chat:{chat}"}
+        __broker__ = broker
+
+        @staticmethod
+        def resolve_message(message, *_, **__):
+            return message
+
+    schema = make_executable_schema(QueryType, ChatSubscription)
+
+    query = 'subscription { message(chat: "1") }'
+    subscription = await subscribe(schema, parse(query))
+    subscription_result = asyncio.ensure_future(next_result(subscription))
+    while not broker.get_subscribers_count("chat:1"):
+        await asyncio.sleep(0)
+
+    await broker.publish("chat:2", "other")
+    await broker.publish("chat:1", "hello")
+    assert (await subscription_result).data == {"message": "hello"}
+
+    await subscription.aclose()
+    assert not broker.channels
+
+
+@pytest.mark.asyncio
+async def test_subscription_channel_name_escapes_separators_in_arguments(next_result):
+    broker = Broker()
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    class ChatSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            message(chat: ID!): String!
+        }
+        """
+        __channels__ = {"message": "chat:{chat}"}
+        __broker__ = broker
+
+        @staticmethod
+        def resolve_message(message, *_, **__):
+            return message
+
+    schema = make_executable_schema(QueryType, ChatSubscription)
+
+    query = 'subscription { message(chat: "1:private") }'
+    subscription = await subscribe(schema, parse(query))
+    subscription_result = asyncio.ensure_future(next_result(subscription))
+    while not broker.subscribers:
+        await asyncio.sleep(0)
+
+    assert list(broker.channels) == ["chat:1%3Aprivate"]
+    await broker.publish("chat:1:private", "private")
+    await broker.publish(f"chat:{escape_channel_arg('1:private')}", "hello")
+    assert (await subscription_result).data == {"message": "hello"}
+
+    await subscription.aclose()
+
+
+@pytest.mark.asyncio
+async def test_subscription_channel_name_can_be_returned_by_callable(next_result):
+    broker = Broker()
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    class ChatSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            message(chat: ID!): String!
+        }
+        """
+        __channels__ = {"message": lambda _, info, chat: f"{info.field_name}/{chat}"}
+        __broker__ = broker
+
+        @staticmethod
+        def resolve_message(message, *_, **__):
+            return message
+
+    schema = make_executable_schema(QueryType, ChatSubscription)
+
+    query = 'subscription { message(chat: "1") }'
+    subscription = await subscribe(schema, parse(query))
+    subscription_result = asyncio.ensure_future(next_result(subscription))
+    while not broker.get_subscribers_count("message/1"):
+        await asyncio.sleep(0)
+
+    await broker.publish("message/1", "hello")
+    assert (await subscription_result).data == {"message": "hello"}
+
+    await subscription.aclose()
+
+
+@pytest.mark.asyncio
+async def test_subscription_channel_uses_field_delivery_policy(next_result):
+    broker = Broker()
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    class ChatSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            message(chat: ID!): String!
+        }
+        """
+        __channels__ = {"message": "chat:{chat}"}
+        __broker__ = broker
+        __delivery__ = {"message": LatestValue()}
+
+        @staticmethod
+        def resolve_message(message, *_, **__):
+            return message
+
+    schema = make_executable_schema(QueryType, ChatSubscription)
+
+    query = 'subscription { message(chat: "1") }'
+    subscription = await subscribe(schema, parse(query))
+    subscription_result = asyncio.ensure_future(next_result(subscription))
+    while not broker.get_subscribers_count("chat:1"):
+        await asyncio.sleep(0)
+
+    await broker.publish("chat:1", "a")
+    assert (await subscription_result).data == {"message": "a"}
+
+    await broker.publish("chat:1", "b")
+    await broker.publish("chat:1", "c")
+    result = await next_result(subscription)
+    assert result.data == {"message": "c"}
+
+    await subscription.aclose()
+
+
+@pytest.mark.asyncio
+async def test_broker_publishes_messages_through_transport(next_result):
+    transports = []
+    publisher = Broker(LocalTransport(transports))
+    receiver_transport = LocalTransport(transports)
+    broker = Broker(receiver_transport)
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    class ChatSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            message(chat: ID!): String!
+        }
+        """
+        __channels__ = {"message": "chat:{chat}"}
+        __broker__ = broker
+
+        @staticmethod
+        def resolve_message(message, *_, **__):
+            return message
+
+    schema = make_executable_schema(QueryType, ChatSubscription)
+
+    query = 'subscription { message(chat: "1") }'
+    first = await subscribe(schema, parse(query))
+    second = await subscribe(schema, parse(query))
+    first_result = asyncio.ensure_future(next_result(first))
+    second_result = asyncio.ensure_future(next_result(second))
+    while broker.get_subscribers_count("chat:1") < 2:
+        await asyncio.sleep(0)
+
+    await publisher.publish("chat:1", "hello")
+    assert (await first_result).data == {"message": "hello"}
+    assert (await second_result).data == {"message": "hello"}
+
+    await first.aclose()
+    await second.aclose()
+    assert receiver_transport.subscribed == ["chat:1"]
+    assert receiver_transport.unsubscribed == ["chat:1"]
+
+
+def test_subscription_type_raises_error_when_defined_with_channel_for_invalid_field(
+    snapshot,
+):
+    with pytest.raises(ValueError) as err:
+        # pylint: disable=unused-variable
+        class ChatSubscription(SubscriptionType):
+            __schema__ = """
+            type Subscription {
+                message: String!
+            }
+            """
+            __channels__ = {"chat": "chat"}
+
+    snapshot.assert_match(err)
+
+
+def test_subscription_type_raises_error_when_defined_with_channel_for_subscribed_field(
+    snapshot,
+):
+    with pytest.raises(ValueError) as err:
+        # pylint: disable=unused-variable
+        class ChatSubscription(SubscriptionType):
+            __schema__ = """
+            type Subscription {
+                message: String!
+            }
+            """
+            __channels__ = {"message": "chat"}
+
+            @staticmethod
+            async def subscribe_message(*_):
+                yield "hello"
+
+    snapshot.assert_match(err)
+
+
+def test_subscription_type_raises_error_when_defined_with_invalid_channel(snapshot):
+    with pytest.raises(TypeError) as err:
+        # pylint: disable=unused-variable
+        class ChatSubscription(SubscriptionType):
+            __schema__ = """
+            type Subscription {
+                message: String!
+            }
+            """
+            __channels__ = {"message": 1}
+
+    snapshot.assert_match(err)
+
+
+def test_subscription_type_raises_error_when_defined_with_channel_using_invalid_arg(
+    snapshot,
+):
+    with pytest.raises(ValueError) as err:
+        # pylint: disable=unused-variable
+        class ChatSubscription(SubscriptionType):
+            __schema__ = """
+            type Subscription {
+                message(chat: ID!): String!
+            }
+            """
+            __channels__ = {"message": "chat:{chatId}"}
+
+    snapshot.assert_match(err)
+
+
+@pytest.mark.asyncio
+async def test_broker_keeps_transport_subscribed_when_subscriber_joins_during_unsubscribe(
+    next_result,
+):
+    class SlowTransport(LocalTransport):
+        def __init__(self, transports):
+            super().__init__(transports)
+            self.unsubscribing = asyncio.Event()
+            self.resume = asyncio.Event()
+
+        async def unsubscribe(self, channel):
+            self.unsubscribing.set()
+            await self.resume.wait()
+            await super().unsubscribe(channel)
+
+    transports = []
+    transport = SlowTransport(transports)
+    broker = Broker(transport)
+
+    first = broker.subscribe("chat:1")
+    first_message = asyncio.ensure_future(next_result(first))
+    while not transport.channels:
+        await asyncio.sleep(0)
+    # Cancelled subscriber leaves channel, unsubscribing transport from it
+    first_message.cancel()
+    await transport.unsubscribing.wait()
+
+    second = broker.subscribe("chat:1")
+    second_message = asyncio.ensure_future(next_result(second))
+    await asyncio.sleep(0)
+    transport.resume.set()
+    await asyncio.gather(first_message, return_exceptions=True)
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    assert transport.channels == {"chat:1"}
+    await broker.publish("chat:1", "hello")
+    assert await asyncio.wait_for(second_message, 1) == "hello"
+    assert transport.subscribed == ["chat:1", "chat:1"]
+    assert transport.unsubscribed == ["chat:1"]
+
+    await second.aclose()
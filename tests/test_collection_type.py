@@ -70,3 +70,36 @@ def test_collection_types_can_be_queries():
             },
         },
     }
+
+
+def test_collection_types_are_listed_in_order_without_repeats():
+    class GroupsCollection(CollectionType):
+        __types__ = [UserGroupType]
+
+    class AllTypes(CollectionType):
+        __types__ = [UserTypes, GroupsCollection, UserType]
+
+    assert AllTypes.__get_types__() == [QueryType, UserType, UserGroupType]
+
+
+def test_collection_types_list_is_updated_when_types_are_changed():
+    class GroupsCollection(CollectionType):
+        __types__ = [UserGroupType]
+
+    assert GroupsCollection.__get_types__() == [UserGroupType]
+
+    GroupsCollection.__types__ = [UserType]
+    assert GroupsCollection.__get_types__() == [UserType, UserGroupType]
+
+
+def test_collection_types_list_is_updated_when_dependency_is_changed():
+    class GroupsCollection(CollectionType):
+        __types__ = [UserGroupType]
+
+    class AllTypes(CollectionType):
+        __types__ = [GroupsCollection]
+
+    assert AllTypes.__get_types__() == [UserGroupType]
+
+    GroupsCollection.__types__.append(QueryType)
+    assert AllTypes.__get_types__() == [UserGroupType, QueryType]
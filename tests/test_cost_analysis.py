@@ -0,0 +1,264 @@
+import pytest
+from graphql import parse, validate
+
+from ariadne_graphql_modules import (
+    FieldCost,
+    InterfaceType,
+    MutationType,
+    ObjectType,
+    create_cost_validator,
+    make_executable_schema,
+)
+
+
+class UserType(ObjectType):
+    __schema__ = """
+    type User {
+        id: ID!
+        name: String!
+        friends(first: Int, last: Int): [User!]!
+    }
+    """
+    __costs__ = {
+        "friends": FieldCost(2, multipliers=["first", "last"]),
+    }
+
+
+class QueryType(ObjectType):
+    __schema__ = """
+    type Query {
+        users(limit: Int = 10): [User!]!
+        user(id: ID!): User
+        version: String!
+    }
+    """
+    __requires__ = [UserType]
+    __costs__ = {
+        "users": FieldCost(multipliers=["limit"]),
+        "user": 3,
+    }
+
+
+schema = make_executable_schema(QueryType)
+
+
+def get_errors(query, maximum_cost, **kwargs):
+    rule = create_cost_validator(maximum_cost, **kwargs)
+    return validate(schema, parse(query), [rule])
+
+
+def get_cost(query, **kwargs):
+    errors = get_errors(query, -1, **kwargs)
+    assert len(errors) == 1
+    return errors[0].extensions["cost"]["requestedQueryCost"]
+
+
+def test_cost_table_is_stored_in_schema_extensions():
+    costs = schema.extensions["costs"]
+    assert set(costs) == {"Query", "User"}
+    assert costs["Query"]["user"].complexity == 3
+
+
+def test_query_within_maximum_cost_is_valid():
+    assert not get_errors('{ user(id: "1") { name } }', 3)
+
+
+def test_query_exceeding_maximum_cost_is_invalid():
+    errors = get_errors('{ user(id: "1") { name } }', 2)
+    assert len(errors) == 1
+    assert errors[0].message == (
+        "The query exceeds the maximum cost of 2. Actual cost is 3"
+    )
+    assert errors[0].extensions == {
+        "cost": {"requestedQueryCost": 3, "maximumAvailable": 2}
+    }
+
+
+def test_fields_without_cost_use_default_cost():
+    assert get_cost("{ version }") == 0
+    assert get_cost("{ version }", default_cost=1) == 1
+
+
+def test_multiplier_argument_multiplies_field_and_its_children_cost():
+    assert get_cost("{ users(limit: 5) { friends(first: 3) { name } } }") == 5 * (
+        1 + 3 * 2
+    )
+
+
+def test_multiplier_argument_default_value_is_used():
+    assert get_cost("{ users { id } }") == 10
+
+
+def test_multiplier_arguments_values_are_summed():
+    assert get_cost('{ user(id: "1") { friends(first: 2, last: 3) { id } } }') == (
+        3 + 5 * 2
+    )
+
+
+def test_multiplier_argument_value_is_read_from_variables():
+    query = "query Users($limit: Int) { users(limit: $limit) { id } }"
+    assert get_cost(query, variables={"limit": 4}) == 4
+
+
+def test_fragments_costs_are_added_to_operation():
+    query = """
+    {
+        users(limit: 2) { ...UserFriends }
+        user(id: "1") { ...UserFriends }
+    }
+
+    fragment UserFriends on User {
+        friends(first: 3) { ...UserName }
+    }
+
+    fragment UserName on User {
+        name
+    }
+    """
+    assert get_cost(query, default_cost=1) == 2 * (1 + 3 * (2 + 1)) + 3 + 3 * (2 + 1)
+
+
+def test_inline_fragments_costs_are_added_to_parent_field():
+    query = '{ user(id: "1") { ... on User { friends(first: 2) { id } } } }'
+    assert get_cost(query) == 3 + 2 * 2
+
+
+def test_cost_of_every_operation_is_validated():
+    query = """
+    query Cheap { version }
+    query Expensive { users(limit: 100) { id } }
+    """
+    errors = get_errors(query, 10)
+    assert len(errors) == 1
+    assert errors[0].extensions["cost"]["requestedQueryCost"] == 100
+
+
+def test_interface_costs_are_used_by_implementing_types():
+    class NodeInterface(InterfaceType):
+        __schema__ = """
+        interface Node {
+            id: ID!
+            related(first: Int): [Node!]!
+        }
+        """
+        __costs__ = {"related": FieldCost(5, multipliers=["first"])}
+
+        @staticmethod
+        def resolve_type(*_):
+            return "Article"
+
+    class ArticleType(ObjectType):
+        __schema__ = """
+        type Article implements Node {
+            id: ID!
+            related(first: Int): [Node!]!
+        }
+        """
+        __requires__ = [NodeInterface]
+
+    class NodeQueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            node: Node
+            article: Article
+        }
+        """
+        __requires__ = [ArticleType, NodeInterface]
+
+    node_schema = make_executable_schema(NodeQueryType)
+    rule = create_cost_validator(0)
+    errors = validate(
+        node_schema,
+        parse("{ node { related(first: 2) { id } } article { related { id } } }"),
+        [rule],
+    )
+    assert errors[0].extensions["cost"]["requestedQueryCost"] == 10 + 5
+
+
+def test_mutation_cost_is_used():
+    class CreateUserMutation(MutationType):
+        __schema__ = """
+        type Mutation {
+            createUsers(names: [String!]!): Boolean!
+        }
+        """
+        __cost__ = FieldCost(10, multipliers=["names"])
+
+        @staticmethod
+        def resolve_mutation(*_, **__):
+            return True
+
+    mutation_schema = make_executable_schema(QueryType, CreateUserMutation)
+    rule = create_cost_validator(0)
+    errors = validate(
+        mutation_schema,
+        parse('mutation { createUsers(names: ["a", "b", "c"]) }'),
+        [rule],
+    )
+    assert errors[0].extensions["cost"]["requestedQueryCost"] == 30
+
+
+def test_object_type_raises_error_when_defined_with_cost_for_nonexisting_field(
+    snapshot,
+):
+    with pytest.raises(ValueError) as err:
+        # pylint: disable=unused-variable
+        class InvalidType(ObjectType):
+            __schema__ = """
+            type User {
+                id: ID!
+            }
+            """
+            __costs__ = {"name": 1}
+
+    snapshot.assert_match(err)
+
+
+def test_object_type_raises_error_when_defined_with_invalid_cost(snapshot):
+    with pytest.raises(TypeError) as err:
+        # pylint: disable=unused-variable
+        class InvalidType(ObjectType):
+            __schema__ = """
+            type User {
+                id: ID!
+            }
+            """
+            __costs__ = {"id": "high"}
+
+    snapshot.assert_match(err)
+
+
+def test_object_type_raises_error_when_defined_with_invalid_cost_multiplier(
+    snapshot,
+):
+    with pytest.raises(ValueError) as err:
+        # pylint: disable=unused-variable
+        class InvalidType(ObjectType):
+            __schema__ = """
+            type User {
+                friends(first: Int): [User!]!
+            }
+            """
+            __costs__ = {"friends": FieldCost(multipliers=["limit"])}
+
+    snapshot.assert_match(err)
+
+
+def test_mutation_type_raises_error_when_defined_with_invalid_cost_multiplier(
+    snapshot,
+):
+    with pytest.raises(ValueError) as err:
+        # pylint: disable=unused-variable
+        class InvalidMutation(MutationType):
+            __schema__ = """
+            type Mutation {
+                createUser(name: String!): Boolean!
+            }
+            """
+            __cost__ = FieldCost(multipliers=["names"])
+
+            @staticmethod
+            def resolve_mutation(*_, **__):
+                return True
+
+    snapshot.assert_match(err)
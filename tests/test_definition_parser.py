@@ -1,8 +1,8 @@
 import pytest
-from graphql import GraphQLError
+from graphql import GraphQLError, parse
 from graphql.language.ast import ObjectTypeDefinitionNode
 
-from ariadne_graphql_modules import parse_definition
+from ariadne_graphql_modules import parse_definition, parse_definitions
 
 
 def test_definition_parser_returns_definition_type_from_valid_schema_string():
@@ -60,3 +60,100 @@ def test_definition_parser_raises_error_schema_str_contains_multiple_types(snaps
         )
 
     snapshot.assert_match(err)
+
+
+def test_definitions_parser_returns_definition_for_each_schema():
+    type_defs = parse_definitions(
+        [
+            ("UserType", "type User { id: ID! }"),
+            ("GroupType", '"Users group"\ntype Group { id: ID! }'),
+            ("RoleEnum", "enum Role { USER ADMIN }"),
+        ]
+    )
+
+    assert [type_def.name.value for type_def in type_defs] == ["User", "Group", "Role"]
+    assert type_defs[1].description.value == "Users group"
+
+
+def test_definitions_parser_parses_schemas_in_single_document(monkeypatch):
+    documents = []
+
+    def parse_document(source):
+        documents.append(source)
+        return parse(source)
+
+    monkeypatch.setattr("ariadne_graphql_modules.utils.parse", parse_document)
+    parse_definitions([("UserType", "type User"), ("GroupType", "type Group")])
+    assert len(documents) == 1
+
+
+def test_definitions_parser_raises_same_error_as_definition_parser_for_type():
+    schemas = [("UserType", "type User"), ("GroupType", "typo Group")]
+
+    with pytest.raises(GraphQLError) as err:
+        parse_definitions(schemas)
+
+    with pytest.raises(GraphQLError) as definition_err:
+        parse_definition("GroupType", "typo Group")
+
+    assert str(err.value) == str(definition_err.value)
+
+
+def test_definitions_parser_raises_error_naming_type_with_invalid_schema_type():
+    with pytest.raises(TypeError) as err:
+        parse_definitions([("UserType", "type User"), ("GroupType", True)])
+
+    assert str(err.value).startswith("GroupType class")
+
+
+def test_definitions_parser_raises_error_naming_type_with_multiple_types():
+    with pytest.raises(ValueError) as err:
+        parse_definitions(
+            [("UserType", "type User"), ("GroupType", "type Group type Role")]
+        )
+
+    assert str(err.value).startswith("GroupType class")
+
+
+def test_definitions_parser_raises_error_naming_type_with_empty_schema():
+    with pytest.raises(GraphQLError) as err:
+        parse_definitions([("UserType", "type User"), ("GroupType", "")])
+
+    with pytest.raises(GraphQLError) as definition_err:
+        parse_definition("GroupType", "")
+
+    assert str(err.value) == str(definition_err.value)
+
+
+def test_definitions_parser_raises_error_for_type_with_unterminated_schema():
+    with pytest.raises(GraphQLError) as err:
+        parse_definitions([("UserType", "type User {"), ("GroupType", "id: ID! }")])
+
+    with pytest.raises(GraphQLError) as definition_err:
+        parse_definition("UserType", "type User {")
+
+    assert str(err.value) == str(definition_err.value)
+
+
+def test_definition_parser_parses_definition_without_locations():
+    type_def = parse_definition("MyType", "type User { id: ID! }", no_location=True)
+    assert type_def.loc is None
+    assert type_def.fields[0].loc is None
+
+
+def test_definition_parser_without_locations_raises_syntax_error_with_location():
+    with pytest.raises(GraphQLError) as err:
+        parse_definition("MyType", "typo User", no_location=True)
+
+    assert err.value.locations
+
+
+def test_definitions_parser_parses_definitions_without_locations():
+    type_defs = parse_definitions(
+        [("UserType", "type User { id: ID! }"), ("GroupType", "type Group")],
+        no_location=True,
+    )
+
+    assert type_defs[0].loc is None
+    assert type_defs[0].fields[0].type.loc is None
+    assert type_defs[1].loc is None
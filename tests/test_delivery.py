@@ -0,0 +1,623 @@
+import asyncio
+
+import pytest
+
+from ariadne_graphql_modules import (
+    BatchWindow,
+    Broadcaster,
+    DropNewest,
+    DropOldest,
+    LatestValue,
+    ObjectType,
+    SubscriptionType,
+    TimeWindow,
+    make_executable_schema,
+)
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_policy_drops_oldest_events(
+    channel, start_subscription, next_value
+):
+    class EventsSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            event: String!
+        }
+        """
+        __delivery__ = {"event": DropOldest(2)}
+
+        @staticmethod
+        async def subscribe_event(*_):
+            async for event in channel.listen():
+                yield event
+
+        @staticmethod
+        def resolve_event(event, *_):
+            return event
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    schema = make_executable_schema(QueryType, EventsSubscription)
+    subscription, first_value = await start_subscription(schema, "event")
+    await channel.publish("first")
+    assert await first_value == "first"
+
+    await channel.publish("a", "b", "c")
+    assert await next_value(subscription, "event") == "b"
+    assert await next_value(subscription, "event") == "c"
+
+    stats = EventsSubscription.delivery_stats["event"]
+    assert stats.delivered == 3
+    assert stats.dropped == 1
+    assert stats.coalesced == 0
+
+    await subscription.aclose()
+
+
+@pytest.mark.asyncio
+async def test_drop_newest_policy_drops_new_events(
+    channel, start_subscription, next_value
+):
+    class EventsSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            event: String!
+        }
+        """
+        __delivery__ = {"event": DropNewest(2)}
+
+        @staticmethod
+        async def subscribe_event(*_):
+            async for event in channel.listen():
+                yield event
+
+        @staticmethod
+        def resolve_event(event, *_):
+            return event
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    schema = make_executable_schema(QueryType, EventsSubscription)
+    subscription, first_value = await start_subscription(schema, "event")
+    await channel.publish("first")
+    assert await first_value == "first"
+
+    await channel.publish("a", "b", "c")
+    assert await next_value(subscription, "event") == "a"
+    assert await next_value(subscription, "event") == "b"
+    assert EventsSubscription.delivery_stats["event"].dropped == 1
+
+    await subscription.aclose()
+
+
+@pytest.mark.asyncio
+async def test_latest_value_policy_coalesces_events(
+    channel, start_subscription, next_value
+):
+    class EventsSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            event: String!
+        }
+        """
+        __delivery__ = {"event": LatestValue()}
+
+        @staticmethod
+        async def subscribe_event(*_):
+            async for event in channel.listen():
+                yield event
+
+        @staticmethod
+        def resolve_event(event, *_):
+            return event
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    schema = make_executable_schema(QueryType, EventsSubscription)
+    subscription, first_value = await start_subscription(schema, "event")
+    await channel.publish("first")
+    assert await first_value == "first"
+
+    await channel.publish("a", "b", "c")
+    assert await next_value(subscription, "event") == "c"
+
+    await channel.publish("d")
+    assert await next_value(subscription, "event") == "d"
+
+    stats = EventsSubscription.delivery_stats["event"]
+    assert stats.delivered == 3
+    assert stats.coalesced == 2
+
+    await subscription.aclose()
+
+
+@pytest.mark.asyncio
+async def test_time_window_policy_delivers_lists_of_events(
+    channel, start_subscription, next_value
+):
+    class EventsSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            events: [String!]!
+        }
+        """
+        __delivery__ = {"events": TimeWindow(0.01)}
+
+        @staticmethod
+        async def subscribe_events(*_):
+            async for event in channel.listen():
+                yield event
+
+        @staticmethod
+        def resolve_events(event, *_):
+            return event
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    schema = make_executable_schema(QueryType, EventsSubscription)
+    subscription, first_value = await start_subscription(schema, "events")
+    await channel.publish("first")
+    assert await first_value == ["first"]
+
+    await channel.publish("a", "b", "c")
+    assert await next_value(subscription, "events") == ["a", "b", "c"]
+
+    stats = EventsSubscription.delivery_stats["events"]
+    assert stats.delivered == 4
+    assert stats.coalesced == 0
+
+    await subscription.aclose()
+
+
+@pytest.mark.asyncio
+async def test_time_window_policy_delivers_full_window_without_waiting(
+    channel, start_subscription
+):
+    class EventsSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            events: [String!]!
+        }
+        """
+        __delivery__ = {"events": TimeWindow(60, max_size=2)}
+
+        @staticmethod
+        async def subscribe_events(*_):
+            async for event in channel.listen():
+                yield event
+
+        @staticmethod
+        def resolve_events(event, *_):
+            return event
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    schema = make_executable_schema(QueryType, EventsSubscription)
+    subscription, first_value = await start_subscription(schema, "events")
+
+    await channel.publish("a", "b")
+    assert await first_value == ["a", "b"]
+
+    await subscription.aclose()
+
+
+@pytest.mark.asyncio
+async def test_buffered_events_are_delivered_before_source_error(
+    channel, start_subscription, next_value, next_result
+):
+    class EventsSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            event: String!
+        }
+        """
+        __delivery__ = {"event": DropOldest(10)}
+
+        @staticmethod
+        async def subscribe_event(*_):
+            async for event in channel.listen():
+                yield event
+
+        @staticmethod
+        def resolve_event(event, *_):
+            return event
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    schema = make_executable_schema(QueryType, EventsSubscription)
+    subscription, first_value = await start_subscription(schema, "event")
+    await channel.publish("first")
+    assert await first_value == "first"
+
+    await channel.publish("a", ValueError("Source failed"))
+    assert await next_value(subscription, "event") == "a"
+    with pytest.raises(ValueError):
+        await next_result(subscription)
+
+
+@pytest.mark.asyncio
+async def test_source_is_closed_when_subscription_is_closed(
+    channel, start_subscription
+):
+    class EventsSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            event: String!
+        }
+        """
+        __delivery__ = {"event": LatestValue()}
+
+        @staticmethod
+        async def subscribe_event(*_):
+            async for event in channel.listen():
+                yield event
+
+        @staticmethod
+        def resolve_event(event, *_):
+            return event
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    schema = make_executable_schema(QueryType, EventsSubscription)
+    subscription, first_value = await start_subscription(schema, "event")
+    await channel.publish("first")
+    assert await first_value == "first"
+
+    await subscription.aclose()
+    while not channel.closed:
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_delivery_policy_is_used_for_broadcast_subscribers(
+    channel, start_subscription, next_value
+):
+    broadcaster = Broadcaster()
+
+    class EventsSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            event: String!
+        }
+        """
+        __broadcast__ = True
+        __broadcaster__ = broadcaster
+        __delivery__ = {"event": LatestValue()}
+
+        @staticmethod
+        async def subscribe_event(*_):
+            async for event in channel.listen():
+                yield event
+
+        @staticmethod
+        def resolve_event(event, *_):
+            return event
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    schema = make_executable_schema(QueryType, EventsSubscription)
+    subscription, first_value = await start_subscription(schema, "event")
+    await channel.publish("first")
+    assert await first_value == "first"
+
+    await channel.publish("a", "b")
+    assert await next_value(subscription, "event") == "b"
+    assert EventsSubscription.delivery_stats["event"].coalesced == 1
+
+    broadcast_stats = broadcaster.get_stats("EventsSubscription", "event")
+    assert broadcast_stats.coalesced == 1
+    assert broadcast_stats.dropped == 0
+
+    await subscription.aclose()
+
+
+@pytest.mark.asyncio
+async def test_batch_window_resolves_events_received_within_window_at_once(
+    channel, start_subscription
+):
+    resolved_batches = []
+
+    class EventsSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            events: [String!]!
+        }
+        """
+        __batches__ = {"events": BatchWindow(0.01)}
+
+        @staticmethod
+        async def subscribe_events(*_):
+            async for event in channel.listen():
+                yield event
+
+        @staticmethod
+        def resolve_events(events, *_):
+            resolved_batches.append(events)
+            return [event.upper() for event in events]
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    schema = make_executable_schema(QueryType, EventsSubscription)
+    subscription, first_value = await start_subscription(schema, "events")
+
+    channel.put("a", "b", "c")
+    assert await first_value == ["A", "B", "C"]
+    assert resolved_batches == [["a", "b", "c"]]
+
+    await subscription.aclose()
+    assert channel.closed == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_window_splits_events_in_order_without_dropping(
+    channel, start_subscription, next_value
+):
+    class EventsSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            events: [String!]!
+        }
+        """
+        __batches__ = {"events": BatchWindow(60, max_size=2)}
+
+        @staticmethod
+        async def subscribe_events(*_):
+            async for event in channel.listen():
+                yield event
+
+        @staticmethod
+        def resolve_events(event, *_):
+            return event
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    schema = make_executable_schema(QueryType, EventsSubscription)
+    subscription, first_value = await start_subscription(schema, "events")
+
+    channel.put("a", "b", "c", "d", "e")
+    assert await first_value == ["a", "b"]
+    assert await next_value(subscription, "events") == ["c", "d"]
+
+    channel.put("f")
+    assert await next_value(subscription, "events") == ["e", "f"]
+
+    await subscription.aclose()
+
+
+@pytest.mark.asyncio
+async def test_batch_window_delivers_events_received_before_source_error(
+    channel, start_subscription, next_result
+):
+    class EventsSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            events: [String!]!
+        }
+        """
+        __batches__ = {"events": BatchWindow(60)}
+
+        @staticmethod
+        async def subscribe_events(*_):
+            async for event in channel.listen():
+                yield event
+
+        @staticmethod
+        def resolve_events(event, *_):
+            return event
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    schema = make_executable_schema(QueryType, EventsSubscription)
+    subscription, first_value = await start_subscription(schema, "events")
+
+    channel.put("a", ValueError("Source failed"))
+    assert await first_value == ["a"]
+    with pytest.raises(ValueError):
+        await next_result(subscription)
+    assert channel.closed == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_window_is_applied_after_delivery_policy(
+    channel, start_subscription, next_value
+):
+    class EventsSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            events: [String!]!
+        }
+        """
+        __delivery__ = {"events": DropOldest(2)}
+        __batches__ = {"events": BatchWindow(0.01)}
+
+        @staticmethod
+        async def subscribe_events(*_):
+            async for event in channel.listen():
+                yield event
+
+        @staticmethod
+        def resolve_events(event, *_):
+            return event
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    schema = make_executable_schema(QueryType, EventsSubscription)
+    subscription, first_value = await start_subscription(schema, "events")
+
+    await channel.publish("a")
+    assert await first_value == ["a"]
+
+    # Delivery policy keeps reading source when batch isn't requested
+    await channel.publish("b", "c", "d")
+    assert await next_value(subscription, "events") == ["c", "d"]
+    assert EventsSubscription.delivery_stats["events"].dropped == 1
+
+    await subscription.aclose()
+
+
+def test_subscription_type_raises_error_when_defined_with_delivery_for_invalid_field(
+    snapshot,
+):
+    with pytest.raises(ValueError) as err:
+        # pylint: disable=unused-variable
+        class EventsSubscription(SubscriptionType):
+            __schema__ = """
+            type Subscription {
+                event: String!
+            }
+            """
+            __delivery__ = {"other": LatestValue()}
+
+            @staticmethod
+            async def subscribe_event(*_):
+                yield "event"
+
+    snapshot.assert_match(err)
+
+
+def test_subscription_type_raises_error_when_defined_with_invalid_delivery_policy(
+    snapshot,
+):
+    with pytest.raises(TypeError) as err:
+        # pylint: disable=unused-variable
+        class EventsSubscription(SubscriptionType):
+            __schema__ = """
+            type Subscription {
+                event: String!
+            }
+            """
+            __delivery__ = {"event": "latest"}
+
+            @staticmethod
+            async def subscribe_event(*_):
+                yield "event"
+
+    snapshot.assert_match(err)
+
+
+def test_subscription_type_raises_error_when_defined_with_time_window_for_non_list(
+    snapshot,
+):
+    with pytest.raises(ValueError) as err:
+        # pylint: disable=unused-variable
+        class EventsSubscription(SubscriptionType):
+            __schema__ = """
+            type Subscription {
+                event: String!
+            }
+            """
+            __delivery__ = {"event": TimeWindow(1)}
+
+            @staticmethod
+            async def subscribe_event(*_):
+                yield "event"
+
+    snapshot.assert_match(err)
+
+
+def test_delivery_policy_raises_error_for_invalid_size():
+    with pytest.raises(ValueError):
+        DropOldest(0)
+    with pytest.raises(ValueError):
+        TimeWindow(0)
+
+
+def test_subscription_type_raises_error_when_defined_with_invalid_batch_window(
+    snapshot,
+):
+    with pytest.raises(TypeError) as err:
+        # pylint: disable=unused-variable
+        class EventsSubscription(SubscriptionType):
+            __schema__ = """
+            type Subscription {
+                events: [String!]!
+            }
+            """
+            __batches__ = {"events": 10}
+
+            @staticmethod
+            async def subscribe_events(*_):
+                yield "event"
+
+    snapshot.assert_match(err)
+
+
+def test_subscription_type_raises_error_when_defined_with_batch_window_for_non_list(
+    snapshot,
+):
+    with pytest.raises(ValueError) as err:
+        # pylint: disable=unused-variable
+        class EventsSubscription(SubscriptionType):
+            __schema__ = """
+            type Subscription {
+                event: String!
+            }
+            """
+            __batches__ = {"event": BatchWindow()}
+
+            @staticmethod
+            async def subscribe_event(*_):
+                yield "event"
+
+    snapshot.assert_match(err)
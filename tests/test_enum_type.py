@@ -300,3 +300,155 @@ def test_enum_type_raises_error_when_enum_mapping_has_extra_items_not_in_definit
             __enum__ = RoleEnum
 
     snapshot.assert_match(err)
+
+
+def test_enum_type_precomputes_values_maps():
+    class RoleEnum(Enum):
+        USER = 0
+        MEMBER = 0
+        ADMIN = 1
+
+    class UserRoleEnum(EnumType):
+        __schema__ = """
+            enum UserRole {
+                USER
+                ADMIN
+            }
+        """
+        __enum__ = {"USER": RoleEnum.USER, "ADMIN": RoleEnum.ADMIN}
+
+    assert UserRoleEnum.graphql_values == {
+        "USER": RoleEnum.USER,
+        "ADMIN": RoleEnum.ADMIN,
+    }
+    assert UserRoleEnum.graphql_names == {
+        RoleEnum.USER: "USER",
+        RoleEnum.ADMIN: "ADMIN",
+    }
+
+
+def test_enum_type_serializes_and_parses_values_with_precomputed_maps():
+    class UserRoleEnum(EnumType):
+        __schema__ = """
+            enum UserRole {
+                USER
+                MOD
+                ADMIN
+            }
+        """
+        __enum__ = {"USER": 0, "MOD": 1, "ADMIN": 2}
+
+    schema = make_test_schema(UserRoleEnum)
+    graphql_type = schema.type_map["UserRole"]
+
+    assert graphql_type.serialize(1) == "MOD"
+    assert graphql_type.parse_value("ADMIN") == 2
+    assert graphql_type.values["ADMIN"].value == 2
+
+    result = graphql_sync(
+        schema,
+        "query Repr($enum: UserRole) { enumToRepr(enum: $enum) }",
+        variable_values={"enum": "ADMIN"},
+    )
+    assert result.data == {"enumToRepr": "2"}
+
+
+def test_enum_type_serializer_raises_graphql_error_for_invalid_value():
+    class UserRoleEnum(EnumType):
+        __schema__ = """
+            enum UserRole {
+                USER
+                MOD
+                ADMIN
+            }
+        """
+        __enum__ = {"USER": 0, "MOD": 1, "ADMIN": 2}
+
+    schema = make_test_schema(UserRoleEnum)
+
+    result = graphql_sync(schema, "{ reprToEnum }", root_value={"reprToEnum": 5})
+    assert result.errors[0].message == "Enum 'UserRole' cannot represent value: 5"
+
+    result = graphql_sync(schema, "{ reprToEnum }", root_value={"reprToEnum": [1]})
+    assert result.errors[0].message == "Enum 'UserRole' cannot represent value: [1]"
+
+    with pytest.raises(GraphQLError):
+        schema.type_map["UserRole"].parse_value("OWNER")
+
+
+def test_enum_type_serializes_unhashable_values():
+    class UserRoleEnum(EnumType):
+        __schema__ = """
+            enum UserRole {
+                USER
+                MOD
+                ADMIN
+            }
+        """
+        __enum__ = {"USER": [0], "MOD": [1], "ADMIN": [2]}
+
+    schema = make_test_schema(UserRoleEnum)
+
+    assert UserRoleEnum.graphql_names is not None
+    assert not UserRoleEnum.graphql_names
+    result = graphql_sync(schema, "{ reprToEnum }", root_value={"reprToEnum": [1]})
+    assert result.data == {"reprToEnum": "MOD"}
+
+
+def test_enum_type_serializes_values_bound_by_extension():
+    class UserRoleEnum(EnumType):
+        __schema__ = """
+            enum UserRole {
+                USER
+                MOD
+            }
+        """
+        __enum__ = {"USER": 0, "MOD": 1}
+
+    class ExtendUserRoleEnum(EnumType):
+        __schema__ = """
+            extend enum UserRole {
+                ADMIN
+            }
+        """
+        __requires__ = [UserRoleEnum]
+        __enum__ = {"ADMIN": 2}
+
+    class QueryType(BaseQueryType):
+        __requires__ = [UserRoleEnum]
+
+    schema = make_executable_schema(QueryType, ExtendUserRoleEnum)
+    graphql_type = schema.type_map["UserRole"]
+    assert graphql_type.serialize(1) == "MOD"
+    assert graphql_type.serialize(2) == "ADMIN"
+    assert graphql_type.parse_value("USER") == 0
+    assert graphql_type.parse_value("ADMIN") == 2
+
+
+def test_enum_type_repairs_default_values():
+    class UserRoleEnum(EnumType):
+        __schema__ = """
+            enum UserRole {
+                USER
+                MOD
+                ADMIN
+            }
+        """
+        __enum__ = {"USER": 0, "MOD": 1, "ADMIN": 2}
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            users(role: UserRole = MOD, roles: [UserRole!] = [USER, ADMIN]): Int
+        }
+        """
+        __requires__ = [UserRoleEnum]
+
+    schema = make_executable_schema(QueryType)
+    field_args = schema.type_map["Query"].fields["users"].args
+    field_args["role"].default_value = "MOD"
+    field_args["roles"].default_value = ["USER", "ADMIN"]
+
+    UserRoleEnum.__bind_to_default_values__(schema)
+    assert field_args["role"].default_value == 1
+    assert field_args["roles"].default_value == [0, 2]
@@ -1,7 +1,7 @@
 import pytest
 from graphql import graphql_sync
 
-from ariadne_graphql_modules import ObjectType, make_executable_schema
+from ariadne_graphql_modules import DeferredType, ObjectType, make_executable_schema
 
 
 def test_executable_schema_is_created_from_object_types():
@@ -88,3 +88,61 @@ def test_executable_schema_raises_value_error_if_merged_types_define_same_field(
         make_executable_schema(CityQueryType, YearQueryType)
 
     snapshot.assert_match(err)
+
+
+def test_executable_schema_reuses_definitions_parsed_by_types(monkeypatch):
+    class UserType(ObjectType):
+        __schema__ = """
+        type User {
+            id: ID!
+        }
+        """
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            user: User
+        }
+        """
+        __requires__ = [UserType]
+
+    assert UserType.graphql_def.name.value == "User"
+    assert QueryType.graphql_def.name.value == "Query"
+
+    def parse_again(*_):
+        raise AssertionError("__schema__ was parsed again")
+
+    monkeypatch.setattr("ariadne_graphql_modules.executable_schema.parse", parse_again)
+    schema = make_executable_schema(QueryType)
+    assert schema.type_map["User"].ast_node is UserType.graphql_def
+
+
+def test_executable_schema_is_created_without_merging_roots():
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            year: Int!
+        }
+        """
+
+        @staticmethod
+        def resolve_year(*_):
+            return 2022
+
+    schema = make_executable_schema(QueryType, merge_roots=False)
+    result = graphql_sync(schema, "{ year }")
+    assert result.errors is None
+    assert result.data == {"year": 2022}
+
+
+def test_executable_schema_parses_extra_sdl_without_locations():
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            date: Date
+        }
+        """
+        __requires__ = [DeferredType("Date")]
+
+    schema = make_executable_schema(QueryType, "scalar Date", no_location=True)
+    assert schema.type_map["Date"].ast_node.loc is None
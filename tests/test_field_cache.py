@@ -0,0 +1,575 @@
+from time import sleep
+
+import pytest
+from graphql import graphql, graphql_sync
+
+from ariadne_graphql_modules import (
+    FieldCache,
+    InMemoryCacheBackend,
+    InterfaceType,
+    ObjectType,
+    make_executable_schema,
+)
+
+
+def test_field_resolver_result_is_cached():
+    calls = []
+    field_cache = FieldCache()
+
+    class UserType(ObjectType):
+        __schema__ = """
+        type User {
+            id: ID!
+            postsCount(published: Boolean): Int!
+        }
+        """
+        __aliases__ = {"postsCount": "posts_count"}
+        __cache__ = {"postsCount": field_cache}
+
+        @staticmethod
+        def resolve_posts_count(user, *_, published=None):
+            calls.append((user["id"], published))
+            return user["id"] * 10
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            users: [User!]!
+        }
+        """
+        __requires__ = [UserType]
+
+        @staticmethod
+        def resolve_users(*_):
+            return [{"id": 1}, {"id": 2}]
+
+    schema = make_executable_schema(QueryType)
+
+    for _ in range(2):
+        result = graphql_sync(schema, "{ users { postsCount } }")
+        assert result.errors is None
+        assert result.data == {"users": [{"postsCount": 10}, {"postsCount": 20}]}
+
+    assert calls == [(1, None), (2, None)]
+    assert field_cache.misses == 2
+    assert field_cache.hits == 2
+
+
+def test_field_cache_key_includes_field_arguments():
+    calls = []
+
+    class UserType(ObjectType):
+        __schema__ = """
+        type User {
+            id: ID!
+            postsCount(published: Boolean): Int!
+        }
+        """
+        __aliases__ = {"postsCount": "posts_count"}
+        __cache__ = {"postsCount": FieldCache()}
+
+        @staticmethod
+        def resolve_posts_count(user, *_, published=None):
+            calls.append((user["id"], published))
+            return user["id"] * 10
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            users: [User!]!
+        }
+        """
+        __requires__ = [UserType]
+
+        @staticmethod
+        def resolve_users(*_):
+            return [{"id": 1}, {"id": 2}]
+
+    schema = make_executable_schema(QueryType)
+
+    result = graphql_sync(
+        schema,
+        """
+        {
+            users {
+                all: postsCount
+                published: postsCount(published: true)
+                publishedAgain: postsCount(published: true)
+            }
+        }
+        """,
+    )
+    assert result.errors is None
+    assert calls == [(1, None), (1, True), (2, None), (2, True)]
+
+
+def test_field_cache_entries_expire_after_ttl():
+    calls = []
+
+    class UserType(ObjectType):
+        __schema__ = """
+        type User {
+            id: ID!
+            postsCount(published: Boolean): Int!
+        }
+        """
+        __aliases__ = {"postsCount": "posts_count"}
+        __cache__ = {"postsCount": FieldCache(ttl=0.01)}
+
+        @staticmethod
+        def resolve_posts_count(user, *_, published=None):
+            calls.append((user["id"], published))
+            return user["id"] * 10
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            users: [User!]!
+        }
+        """
+        __requires__ = [UserType]
+
+        @staticmethod
+        def resolve_users(*_):
+            return [{"id": 1}, {"id": 2}]
+
+    schema = make_executable_schema(QueryType)
+
+    graphql_sync(schema, "{ users { postsCount } }")
+    sleep(0.02)
+    graphql_sync(schema, "{ users { postsCount } }")
+    assert len(calls) == 4
+
+
+def test_field_cache_evicts_least_recently_used_entries():
+    calls = []
+    field_cache = FieldCache(max_entries=1)
+
+    class UserType(ObjectType):
+        __schema__ = """
+        type User {
+            id: ID!
+            postsCount(published: Boolean): Int!
+        }
+        """
+        __aliases__ = {"postsCount": "posts_count"}
+        __cache__ = {"postsCount": field_cache}
+
+        @staticmethod
+        def resolve_posts_count(user, *_, published=None):
+            calls.append((user["id"], published))
+            return user["id"] * 10
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            users: [User!]!
+        }
+        """
+        __requires__ = [UserType]
+
+        @staticmethod
+        def resolve_users(*_):
+            return [{"id": 1}, {"id": 2}]
+
+    schema = make_executable_schema(QueryType)
+
+    graphql_sync(schema, "{ users { postsCount } }")
+    graphql_sync(schema, "{ users { postsCount } }")
+    assert len(calls) == 4
+    assert len(field_cache.backend) == 1
+
+
+def test_request_scoped_field_cache_is_not_shared_between_requests():
+    calls = []
+
+    class UserType(ObjectType):
+        __schema__ = """
+        type User {
+            id: ID!
+            postsCount(published: Boolean): Int!
+        }
+        """
+        __aliases__ = {"postsCount": "posts_count"}
+        __cache__ = {"postsCount": FieldCache(scope="request")}
+
+        @staticmethod
+        def resolve_posts_count(user, *_, published=None):
+            calls.append((user["id"], published))
+            return user["id"] * 10
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            users: [User!]!
+        }
+        """
+        __requires__ = [UserType]
+
+        @staticmethod
+        def resolve_users(*_):
+            return [{"id": 1}, {"id": 2}]
+
+    schema = make_executable_schema(QueryType)
+
+    result = graphql_sync(
+        schema, "{ users { postsCount again: postsCount } }", context_value={}
+    )
+    assert result.errors is None
+    assert calls == [(1, None), (2, None)]
+
+    graphql_sync(schema, "{ users { postsCount } }", context_value={})
+    assert len(calls) == 4
+
+
+def test_field_cache_uses_custom_key():
+    calls = []
+
+    class UserType(ObjectType):
+        __schema__ = """
+        type User {
+            id: ID!
+            postsCount(published: Boolean): Int!
+        }
+        """
+        __aliases__ = {"postsCount": "posts_count"}
+        __cache__ = {"postsCount": FieldCache(key=lambda *_, **__: "shared")}
+
+        @staticmethod
+        def resolve_posts_count(user, *_, published=None):
+            calls.append((user["id"], published))
+            return user["id"] * 10
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            users: [User!]!
+        }
+        """
+        __requires__ = [UserType]
+
+        @staticmethod
+        def resolve_users(*_):
+            return [{"id": 1}, {"id": 2}]
+
+    schema = make_executable_schema(QueryType)
+
+    result = graphql_sync(schema, "{ users { postsCount } }")
+    assert result.data == {"users": [{"postsCount": 10}, {"postsCount": 10}]}
+    assert calls == [(1, None)]
+
+
+def test_field_cache_uses_custom_backend():
+    class DictBackend(InMemoryCacheBackend):
+        keys = []
+
+        def set(self, key, value, ttl):
+            self.keys.append(key)
+            super().set(key, value, ttl)
+
+    calls = []
+
+    class UserType(ObjectType):
+        __schema__ = """
+        type User {
+            id: ID!
+            postsCount(published: Boolean): Int!
+        }
+        """
+        __aliases__ = {"postsCount": "posts_count"}
+        __cache__ = {"postsCount": FieldCache(backend=DictBackend())}
+
+        @staticmethod
+        def resolve_posts_count(user, *_, published=None):
+            calls.append((user["id"], published))
+            return user["id"] * 10
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            users: [User!]!
+        }
+        """
+        __requires__ = [UserType]
+
+        @staticmethod
+        def resolve_users(*_):
+            return [{"id": 1}, {"id": 2}]
+
+    schema = make_executable_schema(QueryType)
+
+    graphql_sync(schema, "{ users { postsCount } }")
+    assert DictBackend.keys == [
+        ("User", "postsCount", 1, ()),
+        ("User", "postsCount", 2, ()),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_field_cache_stores_async_resolver_result():
+    calls = []
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            flags: [String!]!
+        }
+        """
+        __cache__ = {"flags": FieldCache(ttl=60)}
+
+        @staticmethod
+        async def resolve_flags(*_):
+            calls.append(1)
+            return ["beta"]
+
+    schema = make_executable_schema(QueryType)
+    for _ in range(2):
+        result = await graphql(schema, "{ flags }")
+        assert result.data == {"flags": ["beta"]}
+
+    assert calls == [1]
+
+
+def test_field_cache_wraps_default_resolver():
+    field_cache = FieldCache()
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            version: String!
+        }
+        """
+        __cache__ = {"version": field_cache}
+
+    schema = make_executable_schema(QueryType)
+    result = graphql_sync(schema, "{ version }", root_value={"version": "1.0"})
+    assert result.data == {"version": "1.0"}
+    result = graphql_sync(schema, "{ version }", root_value={"version": "2.0"})
+    assert result.data == {"version": "1.0"}
+    assert field_cache.hits == 1
+
+
+def test_interface_type_field_cache_is_used_by_implementing_types():
+    field_cache = FieldCache()
+
+    class NodeInterface(InterfaceType):
+        __schema__ = """
+        interface Node {
+            id: ID!
+            label: String!
+        }
+        """
+        __cache__ = {"label": field_cache}
+
+        @staticmethod
+        def resolve_type(*_):
+            return "Item"
+
+        @staticmethod
+        def resolve_label(obj, *_):
+            return f"Item {obj['id']}"
+
+    class ItemType(ObjectType):
+        __schema__ = """
+        type Item implements Node {
+            id: ID!
+            label: String!
+        }
+        """
+        __requires__ = [NodeInterface]
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            node: Node!
+        }
+        """
+        __requires__ = [NodeInterface]
+
+        @staticmethod
+        def resolve_node(*_):
+            return {"id": 1}
+
+    schema = make_executable_schema(QueryType, ItemType)
+    for _ in range(2):
+        result = graphql_sync(schema, "{ node { label } }")
+        assert result.data == {"node": {"label": "Item 1"}}
+
+    assert field_cache.hits == 1
+
+
+def test_object_type_raises_error_when_defined_with_cache_for_nonexisting_field(
+    snapshot,
+):
+    with pytest.raises(ValueError) as err:
+        # pylint: disable=unused-variable
+        class UserType(ObjectType):
+            __schema__ = """
+            type User {
+                id: ID!
+            }
+            """
+            __cache__ = {"name": FieldCache()}
+
+    snapshot.assert_match(err)
+
+
+def test_object_type_raises_error_when_defined_with_invalid_cache(snapshot):
+    with pytest.raises(TypeError) as err:
+        # pylint: disable=unused-variable
+        class UserType(ObjectType):
+            __schema__ = """
+            type User {
+                id: ID!
+            }
+            """
+            __cache__ = {"id": 60}
+
+    snapshot.assert_match(err)
+
+
+def test_field_cache_raises_error_for_invalid_scope():
+    with pytest.raises(ValueError):
+        FieldCache(scope="global")
+
+
+def test_field_cache_is_not_used_for_objects_without_id():
+    field_cache = FieldCache()
+
+    class RowType(ObjectType):
+        __schema__ = """
+        type Row {
+            name: String!
+        }
+        """
+        __cache__ = {"name": field_cache}
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            rows: [Row!]!
+        }
+        """
+        __requires__ = [RowType]
+
+        @staticmethod
+        def resolve_rows(*_):
+            return [{"name": "a"}, {"name": "b"}]
+
+    schema = make_executable_schema(QueryType)
+    for _ in range(2):
+        result = graphql_sync(schema, "{ rows { name } }")
+        assert result.data == {"rows": [{"name": "a"}, {"name": "b"}]}
+
+    assert field_cache.hits == 0
+    assert not field_cache.backend
+
+
+def test_interface_type_field_cache_is_keyed_by_implementing_type():
+    class NodeInterface(InterfaceType):
+        __schema__ = """
+        interface Node {
+            id: ID!
+            label: String!
+        }
+        """
+        __cache__ = {"label": FieldCache()}
+
+        @staticmethod
+        def resolve_type(obj, *_):
+            return obj["type"]
+
+        @staticmethod
+        def resolve_label(obj, *_):
+            return obj["label"]
+
+    class UserType(ObjectType):
+        __schema__ = """
+        type User implements Node {
+            id: ID!
+            label: String!
+        }
+        """
+        __requires__ = [NodeInterface]
+
+    class GroupType(ObjectType):
+        __schema__ = """
+        type Group implements Node {
+            id: ID!
+            label: String!
+        }
+        """
+        __requires__ = [NodeInterface]
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            nodes: [Node!]!
+        }
+        """
+        __requires__ = [NodeInterface]
+
+        @staticmethod
+        def resolve_nodes(*_):
+            return [
+                {"type": "User", "id": 1, "label": "user"},
+                {"type": "Group", "id": 1, "label": "group"},
+            ]
+
+    schema = make_executable_schema(QueryType, UserType, GroupType)
+    result = graphql_sync(schema, "{ nodes { id label } }")
+    assert result.data == {
+        "nodes": [{"id": "1", "label": "user"}, {"id": "1", "label": "group"}]
+    }
+
+
+@pytest.mark.parametrize("types_order", [0, 1])
+def test_field_cache_of_field_without_resolver_uses_interface_resolver(types_order):
+    field_cache = FieldCache()
+
+    class NodeInterface(InterfaceType):
+        __schema__ = """
+        interface Node {
+            id: ID!
+            name: String!
+        }
+        """
+
+        @staticmethod
+        def resolve_type(*_):
+            return "User"
+
+        @staticmethod
+        def resolve_name(*_):
+            return "from interface"
+
+    class UserType(ObjectType):
+        __schema__ = """
+        type User implements Node {
+            id: ID!
+            name: String!
+        }
+        """
+        __requires__ = [NodeInterface]
+        __cache__ = {"name": field_cache}
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            node: Node!
+        }
+        """
+        __requires__ = [NodeInterface]
+
+        @staticmethod
+        def resolve_node(*_):
+            return {"id": 1}
+
+    # Interface resolvers are bound before or after resolvers of implementing type
+    types = [QueryType, UserType]
+    schema = make_executable_schema(*(types if types_order else types[::-1]))
+    for _ in range(2):
+        result = graphql_sync(schema, "{ node { name } }")
+        assert result.data == {"node": {"name": "from interface"}}
+
+    assert field_cache.hits == 1
@@ -1,3 +1,6 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
 import pytest
 from ariadne import SchemaDirectiveVisitor
 from graphql import GraphQLError, graphql_sync
@@ -283,3 +286,167 @@ def test_input_type_maps_args_to_python_dict_keys():
     assert result.data == {
         "reprInput": {"id": "1", "full_name": "Alice"},
     }
+
+
+@dataclass
+class Tag:
+    name: str
+    weight: int = 1
+
+
+@dataclass
+class Article:
+    title: str
+    tags: List[Tag]
+    main_tag: Optional[Tag]
+
+
+class TagInput(InputType):
+    __schema__ = """
+    input TagInput {
+        name: String!
+        weight: Int
+    }
+    """
+    __model__ = Tag
+
+
+class ArticleInput(InputType):
+    __schema__ = """
+    input ArticleInput {
+        title: String!
+        tags: [TagInput!]!
+        mainTag: TagInput
+    }
+    """
+    __args__ = {"mainTag": "main_tag"}
+    __model__ = Article
+    __requires__ = [TagInput]
+
+
+def create_model_schema(input_type):
+    class ModelQueryType(ObjectType):
+        __schema__ = f"""
+        type Query {{
+            reprInput(input: {input_type.graphql_name}!): Generic!
+        }}
+        """
+        __aliases__ = {"reprInput": "repr_input"}
+        __requires__ = [GenericScalar, input_type]
+
+        @staticmethod
+        def resolve_repr_input(*_, input):  # pylint: disable=redefined-builtin
+            return input
+
+    return make_executable_schema(ModelQueryType)
+
+
+def test_input_type_converts_value_to_model_including_nested_inputs():
+    model_schema = create_model_schema(ArticleInput)
+    result = graphql_sync(
+        model_schema,
+        """
+        {
+            reprInput(
+                input: {
+                    title: "Hello"
+                    tags: [{name: "news", weight: 2}, {name: "tech"}]
+                    mainTag: {name: "news"}
+                }
+            )
+        }
+        """,
+    )
+    assert result.errors is None
+    assert result.data["reprInput"] == Article(
+        title="Hello",
+        tags=[Tag("news", 2), Tag("tech")],
+        main_tag=Tag("news"),
+    )
+
+
+def test_input_type_converts_variables_to_model():
+    model_schema = create_model_schema(ArticleInput)
+    result = graphql_sync(
+        model_schema,
+        "query Repr($input: ArticleInput!) { reprInput(input: $input) }",
+        variable_values={"input": {"title": "Hello", "tags": [{"name": "news"}]}},
+    )
+    assert result.errors is None
+    assert result.data["reprInput"] == Article(
+        title="Hello", tags=[Tag("news")], main_tag=None
+    )
+
+
+def test_input_type_converts_value_to_slots_class_model():
+    class Point:
+        __slots__ = ("x", "y")
+
+        def __init__(self, x, y=0):
+            self.x = x
+            self.y = y
+
+    class PointInput(InputType):
+        __schema__ = """
+        input PointInput {
+            x: Int!
+            y: Int
+        }
+        """
+        __model__ = Point
+
+    model_schema = create_model_schema(PointInput)
+    result = graphql_sync(model_schema, "{ reprInput(input: {x: 1}) }")
+    point = result.data["reprInput"]
+    assert isinstance(point, Point)
+    assert (point.x, point.y) == (1, 0)
+
+
+def test_input_type_converts_value_with_callable_model():
+    class PairInput(InputType):
+        __schema__ = """
+        input PairInput {
+            first: String!
+            second: String!
+        }
+        """
+        __model__ = staticmethod(lambda **values: tuple(sorted(values.items())))
+
+    model_schema = create_model_schema(PairInput)
+    result = graphql_sync(
+        model_schema, '{ reprInput(input: {first: "a", second: "b"}) }'
+    )
+    assert result.data["reprInput"] == (("first", "a"), ("second", "b"))
+
+
+def test_input_type_raises_error_when_defined_with_model_that_is_not_callable(
+    snapshot,
+):
+    with pytest.raises(TypeError) as err:
+        # pylint: disable=unused-variable
+        class InvalidInput(InputType):
+            __schema__ = """
+            input Invalid {
+                name: String!
+            }
+            """
+            __model__ = "Tag"
+
+    snapshot.assert_match(err)
+
+
+def test_input_type_raises_error_when_defined_with_model_not_accepting_fields(
+    snapshot,
+):
+    with pytest.raises(ValueError) as err:
+        # pylint: disable=unused-variable
+        class InvalidInput(InputType):
+            __schema__ = """
+            input Invalid {
+                name: String!
+                priority: Int
+            }
+            """
+            __model__ = Tag
+
+    snapshot.assert_match(err)
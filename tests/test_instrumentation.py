@@ -0,0 +1,228 @@
+import pytest
+from graphql import graphql, graphql_sync, parse, subscribe
+
+from ariadne_graphql_modules import (
+    InterfaceType,
+    MutationType,
+    ObjectType,
+    ResolverInstrumentation,
+    SubscriptionType,
+    make_executable_schema,
+)
+
+
+class NodeInterface(InterfaceType):
+    __schema__ = """
+    interface Node {
+        id: ID!
+    }
+    """
+
+    @staticmethod
+    def resolve_type(*_):
+        return "User"
+
+    @staticmethod
+    def resolve_id(*_):
+        return "node"
+
+
+class UserType(ObjectType):
+    __schema__ = """
+    type User implements Node {
+        id: ID!
+        name: String!
+    }
+    """
+    __requires__ = [NodeInterface]
+
+    @staticmethod
+    def resolve_name(*_):
+        return "Alice"
+
+
+class QueryType(ObjectType):
+    __schema__ = """
+    type Query {
+        user: User!
+        async_user: User!
+        error: String
+        plain: String
+    }
+    """
+    __requires__ = [UserType]
+
+    @staticmethod
+    def resolve_user(*_):
+        return {}
+
+    @staticmethod
+    async def resolve_async_user(*_):
+        return {}
+
+    @staticmethod
+    def resolve_error(*_):
+        raise ValueError("Test error")
+
+
+class PromoteMutation(MutationType):
+    __schema__ = """
+    type Mutation {
+        promote(id: ID!): Boolean!
+    }
+    """
+
+    @staticmethod
+    def resolve_mutation(*_, **__):
+        return True
+
+
+class CounterSubscription(SubscriptionType):
+    __schema__ = """
+    type Subscription {
+        counter: Int!
+    }
+    """
+
+    @staticmethod
+    async def subscribe_counter(*_):
+        yield 1
+
+    @staticmethod
+    def resolve_counter(count, *_):
+        return count
+
+
+def test_resolvers_are_not_wrapped_without_instrumentation():
+    schema = make_executable_schema(QueryType)
+    query_type = schema.type_map["Query"]
+    assert query_type.fields["user"].resolve is QueryType.resolve_user
+    assert query_type.fields["plain"].resolve is None
+
+
+def test_instrumentation_records_resolvers_calls():
+    instrumentation = ResolverInstrumentation()
+    schema = make_executable_schema(QueryType, instrumentation=instrumentation)
+
+    for _ in range(3):
+        result = graphql_sync(schema, "{ user { id name } plain }")
+        assert result.errors is None
+        assert result.data == {
+            "user": {"id": "node", "name": "Alice"},
+            "plain": None,
+        }
+
+    stats = instrumentation.get_stats("Query", "user")
+    assert stats.class_name == "QueryType"
+    assert stats.count == 3
+    assert stats.errors == 0
+    assert sum(stats.histogram) == 3
+    assert stats.total_time > 0
+
+    stats = instrumentation.get_stats("User", "name")
+    assert stats.class_name == "UserType"
+    assert stats.count == 3
+
+    assert not instrumentation.get_stats("Query", "plain")
+
+
+def test_instrumentation_records_interface_resolvers_for_implementing_types():
+    instrumentation = ResolverInstrumentation()
+    schema = make_executable_schema(QueryType, instrumentation=instrumentation)
+    graphql_sync(schema, "{ user { id } }")
+
+    stats = instrumentation.get_stats("User", "id")
+    assert stats.class_name == "NodeInterface"
+    assert stats.count == 1
+
+
+def test_instrumentation_records_resolvers_errors():
+    instrumentation = ResolverInstrumentation()
+    schema = make_executable_schema(QueryType, instrumentation=instrumentation)
+
+    result = graphql_sync(schema, "{ error }")
+    assert result.errors[0].message == "Test error"
+
+    stats = instrumentation.get_stats("Query", "error")
+    assert stats.count == 1
+    assert stats.errors == 1
+
+
+@pytest.mark.asyncio
+async def test_instrumentation_records_async_resolvers_time():
+    instrumentation = ResolverInstrumentation(buckets=[0.5])
+    schema = make_executable_schema(QueryType, instrumentation=instrumentation)
+
+    result = await graphql(schema, "{ async_user { name } }")
+    assert result.errors is None
+    assert result.data == {"async_user": {"name": "Alice"}}
+
+    stats = instrumentation.get_stats("Query", "async_user")
+    assert stats.count == 1
+    assert stats.histogram == [1, 0]
+
+
+def test_instrumentation_records_mutations_calls():
+    instrumentation = ResolverInstrumentation()
+    schema = make_executable_schema(
+        QueryType, PromoteMutation, instrumentation=instrumentation
+    )
+
+    result = graphql_sync(schema, 'mutation { promote(id: "1") }')
+    assert result.data == {"promote": True}
+
+    stats = instrumentation.get_stats("Mutation", "promote")
+    assert stats.class_name == "PromoteMutation"
+    assert stats.count == 1
+
+
+@pytest.mark.asyncio
+async def test_instrumentation_records_subscribers_calls():
+    instrumentation = ResolverInstrumentation()
+    schema = make_executable_schema(
+        QueryType, CounterSubscription, instrumentation=instrumentation
+    )
+
+    results = await subscribe(schema, parse("subscription { counter }"))
+    result = await results.__anext__()  # pylint: disable=unnecessary-dunder-call
+    assert result.data == {"counter": 1}
+
+    stats = instrumentation.get_stats("Subscription", "counter", "subscribe")
+    assert stats.class_name == "CounterSubscription"
+    assert stats.count == 1
+
+    stats = instrumentation.get_stats("Subscription", "counter")
+    assert stats.count == 1
+
+
+def test_instrumentation_lists_hot_resolvers_and_can_be_reset():
+    instrumentation = ResolverInstrumentation()
+    schema = make_executable_schema(QueryType, instrumentation=instrumentation)
+    graphql_sync(schema, "{ user { id name } }")
+
+    hot_resolvers = instrumentation.get_hot_resolvers(limit=2)
+    assert len(hot_resolvers) == 2
+    assert hot_resolvers[0].total_time >= hot_resolvers[1].total_time
+
+    instrumentation.reset()
+    stats = instrumentation.get_stats("Query", "user")
+    assert stats.count == 0
+    assert sum(stats.histogram) == 0
+
+    graphql_sync(schema, "{ user { id } }")
+    assert stats.count == 1
+
+
+def test_instrumentation_can_be_converted_to_dict():
+    instrumentation = ResolverInstrumentation(buckets=[1.0, 0.1])
+    schema = make_executable_schema(QueryType, instrumentation=instrumentation)
+    graphql_sync(schema, "{ user { name } }")
+
+    resolvers = {
+        (stats["type"], stats["field"]): stats
+        for stats in instrumentation.as_dict()["resolvers"]
+    }
+    assert resolvers[("Query", "user")]["class"] == "QueryType"
+    assert resolvers[("Query", "user")]["count"] == 1
+    assert resolvers[("Query", "user")]["buckets"] == [0.1, 1.0]
+    assert resolvers[("Query", "user")]["histogram"] == [1, 0, 0]
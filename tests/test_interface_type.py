@@ -448,3 +448,106 @@ def test_interface_type_binds_field_resolvers_to_implementing_types_fields():
             },
         ],
     }
+
+
+def test_interface_type_binds_field_resolvers_to_implementing_interfaces_fields():
+    class NodeInterface(InterfaceType):
+        __schema__ = """
+        interface Node {
+            id: ID!
+        }
+        """
+
+        @staticmethod
+        def resolve_type(*_):
+            return "Photo"
+
+        @staticmethod
+        def resolve_id(*_):
+            return "node"
+
+    class ResourceInterface(InterfaceType):
+        __schema__ = """
+        interface Resource implements Node {
+            id: ID!
+            url: String!
+        }
+        """
+        __requires__ = [NodeInterface]
+
+        @staticmethod
+        def resolve_type(*_):
+            return "Photo"
+
+    class PhotoType(ObjectType):
+        __schema__ = """
+        type Photo implements Resource & Node {
+            id: ID!
+            url: String!
+        }
+        """
+        __requires__ = [NodeInterface, ResourceInterface]
+
+    class GroupType(ObjectType):
+        __schema__ = """
+        type Group {
+            id: ID!
+        }
+        """
+
+    interfaces_schema = make_executable_schema(
+        NodeInterface,
+        ResourceInterface,
+        PhotoType,
+        GroupType,
+        "type Query { node: Node }",
+    )
+    resolve_id = NodeInterface.resolvers["id"]
+    assert interfaces_schema.type_map["Resource"].fields["id"].resolve is resolve_id
+    assert interfaces_schema.type_map["Photo"].fields["id"].resolve is resolve_id
+    assert interfaces_schema.type_map["Group"].fields["id"].resolve is None
+
+
+def test_interface_type_field_resolvers_override_object_type_source_resolvers():
+    class ScoreInterface(InterfaceType):
+        __schema__ = """
+        interface Scored {
+            score: Int!
+        }
+        """
+
+        @staticmethod
+        def resolve_type(*_):
+            return "Game"
+
+        @staticmethod
+        def resolve_score(*_):
+            return 42
+
+    class GameType(ObjectType):
+        __schema__ = """
+        type Game implements Scored {
+            name: String!
+            score: Int!
+        }
+        """
+        __requires__ = [ScoreInterface]
+        __source__ = dict
+
+    class GameQueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            game: Scored!
+        }
+        """
+        __requires__ = [ScoreInterface]
+
+    game = {"name": "Chess", "score": 1}
+    query = "{ game { score ... on Game { name } } }"
+
+    for types in ([GameQueryType, GameType], [GameType, GameQueryType]):
+        result = graphql_sync(
+            make_executable_schema(*types), query, root_value={"game": game}
+        )
+        assert result.errors is None
+        assert result.data == {"game": {"score": 42, "name": "Chess"}}
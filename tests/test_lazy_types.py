@@ -0,0 +1,247 @@
+import pytest
+from graphql import GraphQLError, graphql_sync
+
+from ariadne_graphql_modules import (
+    EnumType,
+    MutationType,
+    ObjectType,
+    SubscriptionType,
+    make_executable_schema,
+    prepare_types,
+)
+
+
+class LazyObjectType(ObjectType):
+    __abstract__ = True
+    __lazy__ = True
+
+
+def test_lazy_type_is_not_parsed_on_creation():
+    class UserType(LazyObjectType):
+        __schema__ = """
+        type User {
+            id: ID!
+        }
+        """
+
+    assert not UserType.__prepared__
+    assert not hasattr(UserType, "graphql_name")
+
+
+def test_lazy_type_with_invalid_schema_can_be_created():
+    # pylint: disable=unused-variable
+    class UserType(LazyObjectType):
+        __schema__ = "typo User"
+
+
+def test_lazy_type_is_prepared_by_make_executable_schema():
+    class QueryType(LazyObjectType):
+        __schema__ = """
+        type Query {
+            year: Int!
+        }
+        """
+
+        @staticmethod
+        def resolve_year(*_):
+            return 2022
+
+    schema = make_executable_schema(QueryType)
+    assert QueryType.__prepared__
+    assert QueryType.graphql_name == "Query"
+
+    result = graphql_sync(schema, "{ year }")
+    assert result.errors is None
+    assert result.data == {"year": 2022}
+
+
+def test_lazy_type_is_prepared_by_prepare_types():
+    class GroupType(LazyObjectType):
+        __schema__ = """
+        type Group {
+            id: ID!
+        }
+        """
+
+    class UserType(LazyObjectType):
+        __schema__ = """
+        type User {
+            group: Group!
+        }
+        """
+        __requires__ = [GroupType]
+
+    prepare_types(UserType)
+    assert UserType.graphql_name == "User"
+    assert GroupType.graphql_name == "Group"
+
+
+def test_lazy_type_prepares_its_lazy_requirements():
+    class GroupType(LazyObjectType):
+        __schema__ = """
+        type Group {
+            id: ID!
+        }
+        """
+
+    class UserType(LazyObjectType):
+        __schema__ = """
+        type User {
+            group: Group!
+        }
+        """
+        __requires__ = [GroupType]
+
+    UserType.__prepare_type__()
+    assert GroupType.__prepared__
+
+
+def test_lazy_type_can_be_required_by_eager_type():
+    class GroupType(LazyObjectType):
+        __schema__ = """
+        type Group {
+            id: ID!
+        }
+        """
+
+    class UserType(ObjectType):
+        __schema__ = """
+        type User {
+            group: Group!
+        }
+        """
+        __requires__ = [GroupType]
+
+    assert GroupType.__prepared__
+    assert UserType.__prepared__
+
+
+def test_lazy_type_raises_schema_syntax_error_on_prepare():
+    class UserType(LazyObjectType):
+        __schema__ = "typo User"
+
+    with pytest.raises(GraphQLError):
+        make_executable_schema(UserType)
+
+
+def test_lazy_type_raises_validation_error_naming_type_on_prepare(snapshot):
+    class UserType(LazyObjectType):
+        __schema__ = """
+        type User {
+            group: Group
+        }
+        """
+
+    with pytest.raises(ValueError) as err:
+        make_executable_schema(UserType)
+
+    snapshot.assert_match(str(err.value))
+    assert not UserType.__prepared__
+
+
+def test_lazy_mode_is_supported_by_all_types():
+    class RoleEnum(EnumType):
+        __lazy__ = True
+        __schema__ = """
+        enum Role {
+            USER
+            ADMIN
+        }
+        """
+        __enum__ = {"USER": 0, "ADMIN": 1}
+
+    class QueryType(LazyObjectType):
+        __schema__ = """
+        type Query {
+            role: Role!
+        }
+        """
+        __requires__ = [RoleEnum]
+
+        @staticmethod
+        def resolve_role(*_):
+            return 1
+
+    class PromoteMutation(MutationType):
+        __lazy__ = True
+        __schema__ = """
+        type Mutation {
+            promote(id: ID!): Role!
+        }
+        """
+        __requires__ = [RoleEnum]
+
+        @staticmethod
+        def resolve_mutation(*_, **__):
+            return 1
+
+    class RoleSubscription(SubscriptionType):
+        __lazy__ = True
+        __schema__ = """
+        type Subscription {
+            role: Role!
+        }
+        """
+        __requires__ = [RoleEnum]
+
+        @staticmethod
+        async def subscribe_role(*_):
+            yield 1
+
+    schema = make_executable_schema(QueryType, PromoteMutation, RoleSubscription)
+    assert RoleSubscription.subscribers["role"]
+
+    result = graphql_sync(schema, "{ role }")
+    assert result.errors is None
+    assert result.data == {"role": "ADMIN"}
+
+    result = graphql_sync(schema, 'mutation { promote(id: "1") }')
+    assert result.errors is None
+    assert result.data == {"promote": "ADMIN"}
+
+
+def test_lazy_types_schemas_are_parsed_in_single_document(monkeypatch):
+    class GroupType(LazyObjectType):
+        __schema__ = """
+        type Group {
+            id: ID!
+        }
+        """
+
+    class QueryType(LazyObjectType):
+        __schema__ = """
+        type Query {
+            group: Group!
+        }
+        """
+        __requires__ = [GroupType]
+
+    def parse_again(*_):
+        raise AssertionError("__schema__ was parsed separately")
+
+    monkeypatch.setattr("ariadne_graphql_modules.bases.parse_definition", parse_again)
+    prepare_types(QueryType)
+    assert QueryType.graphql_def.name.value == "Query"
+    assert GroupType.graphql_def.name.value == "Group"
+
+
+def test_lazy_types_schemas_are_parsed_without_locations():
+    class GroupType(LazyObjectType):
+        __no_location__ = True
+        __schema__ = """
+        type Group {
+            id: ID!
+        }
+        """
+
+    class QueryType(LazyObjectType):
+        __schema__ = """
+        type Query {
+            group: Group!
+        }
+        """
+        __requires__ = [GroupType]
+
+    prepare_types(QueryType)
+    assert QueryType.graphql_def.loc
+    assert GroupType.graphql_def.loc is None
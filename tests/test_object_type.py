@@ -1,7 +1,11 @@
+from dataclasses import dataclass
+from typing import NamedTuple
+
 import pytest
 from ariadne import SchemaDirectiveVisitor
 from graphql import GraphQLError, graphql_sync
 
+from ariadne_graphql_modules import bases
 from ariadne_graphql_modules import (
     DeferredType,
     DirectiveType,
@@ -9,6 +13,7 @@ from ariadne_graphql_modules import (
     ObjectType,
     make_executable_schema,
 )
+from ariadne_graphql_modules.utils import is_default_resolver
 
 
 def test_object_type_raises_attribute_error_when_defined_without_schema(snapshot):
@@ -82,6 +87,102 @@ def test_object_type_extracts_graphql_name():
     assert GroupType.graphql_name == "Group"
 
 
+def test_object_type_lists_required_types_in_order_without_repeats():
+    class GroupType(ObjectType):
+        __schema__ = """
+        type Group {
+            id: ID!
+        }
+        """
+
+    class UserType(ObjectType):
+        __schema__ = """
+        type User {
+            group: Group
+        }
+        """
+        __requires__ = [GroupType]
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            group: Group
+            user: User
+        }
+        """
+        __requires__ = [GroupType, UserType]
+
+    assert QueryType.__get_types__() == [QueryType, GroupType, UserType]
+    assert QueryType.__get_types__() == [QueryType, GroupType, UserType]
+
+
+def test_object_type_collects_types_of_shared_dependencies_once(monkeypatch):
+    calls = []
+    get_memoized_types = bases.get_memoized_types
+
+    def count_calls(cls, *args):
+        calls.append(cls)
+        return get_memoized_types(cls, *args)
+
+    monkeypatch.setattr("ariadne_graphql_modules.bases.get_memoized_types", count_calls)
+
+    # Every level has two types that both require both types of level below
+    level = []
+    for i in range(16):
+        fields = "".join(
+            f"{type_.graphql_name.lower()}: {type_.graphql_name} " for type_ in level
+        )
+
+        class FirstType(ObjectType):
+            __schema__ = f"type First{i} {{ id: ID! {fields}}}"
+            __requires__ = list(level)
+
+        class SecondType(ObjectType):
+            __schema__ = f"type Second{i} {{ id: ID! {fields}}}"
+            __requires__ = list(level)
+
+        level = [FirstType, SecondType]
+
+    # Top type and both types of each of 15 levels below it
+    assert len(FirstType.__get_types__()) == 31
+    # Types are called once by every type requiring them: once by top type,
+    # and twice by types of other levels, which returns memoized list
+    assert len(calls) == 1 + 2 + 14 * 2 * 2
+
+    calls.clear()
+    assert len(FirstType.__get_types__()) == 31
+    assert calls == [FirstType]
+
+
+def test_object_type_types_list_is_updated_when_indirect_dependency_is_changed():
+    class GroupType(ObjectType):
+        __schema__ = """
+        type Group {
+            id: ID!
+        }
+        """
+
+    class UserType(ObjectType):
+        __schema__ = """
+        type User {
+            id: ID!
+        }
+        """
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            user: User
+        }
+        """
+        __requires__ = [UserType]
+
+    assert QueryType.__get_types__() == [QueryType, UserType]
+
+    UserType.__requires__ = [GroupType]
+    assert QueryType.__get_types__() == [QueryType, UserType, GroupType]
+
+
 def test_object_type_accepts_all_builtin_scalar_types():
     # pylint: disable=unused-variable
     class FancyObjectType(ObjectType):
@@ -396,3 +497,197 @@ def test_object_resolves_field_with_aliased_custom_resolver():
 def test_object_resolves_field_with_arg_out_name_customized():
     result = graphql_sync(schema, '{ fieldWithArg(someArg: "test") }')
     assert result.data["fieldWithArg"] == "test"
+
+
+def test_object_type_can_be_defined_without_locations():
+    class UserType(ObjectType):
+        __no_location__ = True
+        __schema__ = """
+        type User {
+            id: ID!
+        }
+        """
+
+    assert UserType.graphql_def.loc is None
+    assert UserType.graphql_fields["id"].loc is None
+
+
+def test_object_type_raises_error_when_defined_with_invalid_source(snapshot):
+    with pytest.raises(TypeError) as err:
+        # pylint: disable=unused-variable
+        class UserType(ObjectType):
+            __schema__ = """
+            type User {
+                id: ID!
+            }
+            """
+            __source__ = "dict"
+
+    snapshot.assert_match(err)
+
+
+def create_source_schema(source_type, source_callables=False):
+    class UserType(ObjectType):
+        __schema__ = """
+        type User {
+            id: ID!
+            fullName: String!
+            email: String
+        }
+        """
+        __aliases__ = {"fullName": "full_name"}
+        __source__ = source_type
+        __source_callables__ = source_callables
+
+        @staticmethod
+        def resolve_email(*_):
+            return "user@example.com"
+
+    class UserQueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            user: User!
+        }
+        """
+        __requires__ = [UserType]
+
+    return make_executable_schema(UserQueryType)
+
+
+def assert_source_is_resolved(schema, user):
+    result = graphql_sync(
+        schema, "{ user { id fullName email } }", root_value={"user": user}
+    )
+    assert result.errors is None
+    assert result.data == {
+        "user": {"id": "1", "fullName": "Alice", "email": "user@example.com"}
+    }
+
+
+def test_object_type_resolves_fields_from_dict_source():
+    schema = create_source_schema(dict)
+    assert_source_is_resolved(schema, {"id": 1, "full_name": "Alice"})
+
+
+def test_object_type_resolves_fields_from_object_source():
+    class User:
+        def __init__(self, id, full_name):  # pylint: disable=redefined-builtin
+            self.id = id
+            self.full_name = full_name
+
+    schema = create_source_schema(object)
+    assert_source_is_resolved(schema, User(1, "Alice"))
+
+
+def test_object_type_resolves_fields_from_dataclass_source():
+    @dataclass
+    class User:
+        id: int
+        full_name: str
+
+    schema = create_source_schema(User)
+    assert_source_is_resolved(schema, User(1, "Alice"))
+
+
+def test_object_type_resolves_fields_from_slots_class_source():
+    class User:
+        __slots__ = ("id", "full_name")
+
+        def __init__(self, id, full_name):  # pylint: disable=redefined-builtin
+            self.id = id
+            self.full_name = full_name
+
+    schema = create_source_schema(User)
+    assert_source_is_resolved(schema, User(1, "Alice"))
+
+
+def test_object_type_resolves_fields_from_namedtuple_source():
+    class User(NamedTuple):
+        id: int
+        full_name: str
+
+    schema = create_source_schema(User)
+    assert_source_is_resolved(schema, User(1, "Alice"))
+
+
+def test_object_type_resolves_fields_missing_from_source_to_none():
+    class User(NamedTuple):
+        id: int
+
+    schema = create_source_schema(User)
+    result = graphql_sync(
+        schema, "{ user { id fullName } }", root_value={"user": User(1)}
+    )
+    assert result.data is None
+    assert result.errors[0].message == (
+        "Cannot return null for non-nullable field User.fullName."
+    )
+
+
+def test_object_type_source_resolvers_dont_call_callables_by_default():
+    class User:
+        id = 1
+
+        def full_name(self, *_):
+            return "Alice"
+
+    schema = create_source_schema(object)
+    result = graphql_sync(schema, "{ user { fullName } }", root_value={"user": User()})
+    assert result.errors
+
+
+def test_object_type_source_resolvers_call_callables_when_enabled():
+    class User:
+        id = 1
+
+        def full_name(self, info, **_):
+            assert info.field_name == "fullName"
+            return "Alice"
+
+    schema = create_source_schema(object, source_callables=True)
+    assert_source_is_resolved(schema, User())
+
+
+def test_object_type_source_resolvers_are_used_for_fields_from_extensions():
+    class UserType(ObjectType):
+        __schema__ = """
+        type User {
+            id: ID!
+        }
+        """
+        __source__ = dict
+
+    class ExtendUserType(ObjectType):
+        __schema__ = """
+        extend type User {
+            name: String
+            email: String
+        }
+        """
+        __requires__ = [UserType]
+
+        @staticmethod
+        def resolve_email(*_):
+            return "user@example.com"
+
+    class UserQueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            user: User!
+        }
+        """
+        __requires__ = [UserType]
+
+    for types in ((UserType, ExtendUserType), (ExtendUserType, UserType)):
+        schema = make_executable_schema(UserQueryType, *types)
+        assert is_default_resolver(schema.type_map["User"].fields["name"].resolve)
+
+        result = graphql_sync(
+            schema,
+            "{ user { id name email } }",
+            root_value={"user": {"id": 1, "name": "Alice"}},
+        )
+        assert result.errors is None
+        assert result.data == {
+            "user": {"id": "1", "name": "Alice", "email": "user@example.com"}
+        }
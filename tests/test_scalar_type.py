@@ -2,12 +2,13 @@ from datetime import date, datetime
 
 import pytest
 from ariadne import SchemaDirectiveVisitor
-from graphql import GraphQLError, StringValueNode, graphql_sync
+from graphql import GraphQLError, StringValueNode, graphql, graphql_sync
 
 from ariadne_graphql_modules import (
     DirectiveType,
     ObjectType,
     ScalarType,
+    SerializeManyExecutionContext,
     make_executable_schema,
 )
 
@@ -279,3 +280,126 @@ def test_literal_list_is_deserialized_by_default_parser():
     result = graphql_sync(schema, "{ testInputValueType(value: []) }")
     assert result.errors is None
     assert result.data == {"testInputValueType": "list"}
+
+
+def create_serialize_many_schema(calls, serialize=None):
+    class BulkDateScalar(ScalarType):
+        __schema__ = "scalar Date"
+
+        @staticmethod
+        def serialize_many(values):
+            calls.append(len(values))
+            return [value.isoformat() for value in values]
+
+    if serialize:
+        BulkDateScalar.serialize = staticmethod(serialize)
+
+    class DatesQueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            date: Date
+            dates: [Date!]!
+            optionalDates: [Date]
+        }
+        """
+        __requires__ = [BulkDateScalar]
+
+    return make_executable_schema(DatesQueryType)
+
+
+TEST_DATES = [date(2022, 1, i) for i in range(1, 4)]
+
+
+def test_scalar_type_serializes_list_with_single_call_to_serialize_many():
+    calls = []
+    bulk_schema = create_serialize_many_schema(calls)
+
+    result = graphql_sync(
+        bulk_schema,
+        "{ dates }",
+        root_value={"dates": TEST_DATES},
+        execution_context_class=SerializeManyExecutionContext,
+    )
+    assert result.errors is None
+    assert result.data == {"dates": ["2022-01-01", "2022-01-02", "2022-01-03"]}
+    assert calls == [3]
+
+
+def test_scalar_type_serializes_list_items_without_serialize_many_context():
+    calls = []
+    bulk_schema = create_serialize_many_schema(calls)
+
+    result = graphql_sync(bulk_schema, "{ dates }", root_value={"dates": TEST_DATES})
+    assert result.data == {"dates": ["2022-01-01", "2022-01-02", "2022-01-03"]}
+    assert calls == [1, 1, 1]
+
+
+def test_scalar_type_serializes_single_value_with_serialize_many():
+    calls = []
+    bulk_schema = create_serialize_many_schema(calls)
+
+    result = graphql_sync(
+        bulk_schema,
+        "{ date }",
+        root_value={"date": TEST_DATES[0]},
+        execution_context_class=SerializeManyExecutionContext,
+    )
+    assert result.data == {"date": "2022-01-01"}
+
+
+def test_scalar_type_serialize_is_used_for_single_value_if_its_defined():
+    calls = []
+    bulk_schema = create_serialize_many_schema(calls, lambda value: "single")
+
+    result = graphql_sync(bulk_schema, "{ date }", root_value={"date": TEST_DATES[0]})
+    assert result.data == {"date": "single"}
+    assert not calls
+
+
+def test_scalar_type_serializes_list_with_nulls_item_by_item():
+    calls = []
+    bulk_schema = create_serialize_many_schema(calls)
+
+    result = graphql_sync(
+        bulk_schema,
+        "{ optionalDates }",
+        root_value={"optionalDates": (d for d in [TEST_DATES[0], None])},
+        execution_context_class=SerializeManyExecutionContext,
+    )
+    assert result.errors is None
+    assert result.data == {"optionalDates": ["2022-01-01", None]}
+    assert calls == [1]
+
+
+def test_scalar_type_list_serialization_error_is_reported_for_invalid_item():
+    calls = []
+    bulk_schema = create_serialize_many_schema(calls)
+
+    result = graphql_sync(
+        bulk_schema,
+        "{ optionalDates }",
+        root_value={"optionalDates": [TEST_DATES[0], "invalid"]},
+        execution_context_class=SerializeManyExecutionContext,
+    )
+    assert result.data == {"optionalDates": ["2022-01-01", None]}
+    assert result.errors[0].path == ["optionalDates", 1]
+    assert calls == [2, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_scalar_type_serializes_list_of_awaitables_item_by_item():
+    calls = []
+    bulk_schema = create_serialize_many_schema(calls)
+
+    async def get_date(value):
+        return value
+
+    result = await graphql(
+        bulk_schema,
+        "{ dates }",
+        root_value={"dates": [get_date(value) for value in TEST_DATES]},
+        execution_context_class=SerializeManyExecutionContext,
+    )
+    assert result.errors is None
+    assert result.data == {"dates": ["2022-01-01", "2022-01-02", "2022-01-03"]}
+    assert calls == [1, 1, 1]
@@ -0,0 +1,203 @@
+import os
+
+import pytest
+from graphql import graphql_sync
+
+from ariadne_graphql_modules import (
+    DeferredType,
+    EnumType,
+    FileSystemSchemaCache,
+    ObjectType,
+    get_schema_fingerprint,
+    make_executable_schema,
+)
+
+
+class UserLevelEnum(EnumType):
+    __schema__ = """
+    enum UserLevel {
+        GUEST
+        ADMIN
+    }
+    """
+    __enum__ = {
+        "GUEST": 0,
+        "ADMIN": 1,
+    }
+
+
+class UserType(ObjectType):
+    __schema__ = """
+    type User {
+        id: ID!
+        level: UserLevel!
+    }
+    """
+    __requires__ = [UserLevelEnum]
+
+
+class QueryType(ObjectType):
+    __schema__ = """
+    type Query {
+        user: User!
+    }
+    """
+    __requires__ = [UserType]
+
+    @staticmethod
+    def resolve_user(*_):
+        return {"id": 1, "level": 1}
+
+
+class YearQueryType(ObjectType):
+    __schema__ = """
+    type Query {
+        year: Int!
+    }
+    """
+
+    @staticmethod
+    def resolve_year(*_):
+        return 2022
+
+
+def test_schema_cache_stores_schema_document_on_miss(tmp_path):
+    cache = FileSystemSchemaCache(tmp_path)
+    schema = make_executable_schema(QueryType, cache=cache)
+
+    assert cache.hits == 0
+    assert cache.misses == 1
+    assert len(os.listdir(tmp_path)) == 1
+
+    result = graphql_sync(schema, "{ user { id level } }")
+    assert result.errors is None
+    assert result.data == {"user": {"id": "1", "level": "ADMIN"}}
+
+
+def test_schema_cache_builds_schema_from_stored_document_on_hit(tmp_path):
+    make_executable_schema(
+        QueryType, YearQueryType, cache=FileSystemSchemaCache(tmp_path)
+    )
+
+    cache = FileSystemSchemaCache(tmp_path)
+    schema = make_executable_schema(QueryType, YearQueryType, cache=cache)
+
+    assert cache.hits == 1
+    assert cache.misses == 0
+
+    result = graphql_sync(schema, "{ user { id level } year }")
+    assert result.errors is None
+    assert result.data == {"user": {"id": "1", "level": "ADMIN"}, "year": 2022}
+
+
+def test_schema_cache_stored_document_has_no_locations(tmp_path):
+    cache = FileSystemSchemaCache(tmp_path)
+    make_executable_schema(QueryType, cache=cache)
+
+    (cache_file,) = os.listdir(tmp_path)
+    document = cache.load(cache_file[: -len(".pickle")])
+    assert document is not None
+    assert all(definition.loc is None for definition in document.definitions)
+
+
+def test_schema_cache_is_invalidated_when_type_schema_changes(tmp_path):
+    cache = FileSystemSchemaCache(tmp_path)
+    make_executable_schema(QueryType, cache=cache)
+
+    class ChangedQueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            user: User
+        }
+        """
+        __requires__ = [UserType]
+
+    make_executable_schema(ChangedQueryType, cache=cache)
+    assert cache.hits == 0
+    assert cache.misses == 2
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_schema_cache_is_invalidated_when_extra_sdl_changes(tmp_path):
+    cache = FileSystemSchemaCache(tmp_path)
+    make_executable_schema(QueryType, "scalar Date", cache=cache)
+    make_executable_schema(QueryType, "scalar DateTime", cache=cache)
+    make_executable_schema(QueryType, "scalar DateTime", cache=cache)
+
+    assert cache.hits == 1
+    assert cache.misses == 2
+
+
+def test_schema_cache_is_invalidated_when_roots_merging_changes(tmp_path):
+    cache = FileSystemSchemaCache(tmp_path)
+    make_executable_schema(QueryType, cache=cache)
+    make_executable_schema(QueryType, merge_roots=False, cache=cache)
+
+    assert cache.hits == 0
+    assert cache.misses == 2
+
+
+def test_schema_cache_treats_corrupted_file_as_miss(tmp_path):
+    cache = FileSystemSchemaCache(tmp_path)
+    make_executable_schema(QueryType, cache=cache)
+
+    (cache_file,) = os.listdir(tmp_path)
+    with open(tmp_path / cache_file, "wb") as fp:
+        fp.write(b"not a pickle")
+
+    schema = make_executable_schema(QueryType, cache=cache)
+    assert cache.hits == 0
+    assert cache.misses == 2
+
+    result = graphql_sync(schema, "{ user { id } }")
+    assert result.errors is None
+
+
+def test_schema_cache_does_not_store_invalid_schema(tmp_path):
+    class InvalidQueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            user: User
+        }
+        """
+        __requires__ = [DeferredType("User")]
+
+    cache = FileSystemSchemaCache(tmp_path)
+    with pytest.raises(TypeError):
+        make_executable_schema(
+            InvalidQueryType,
+            "type User implements Node { id: ID }",
+            "interface Node { id: ID! }",
+            cache=cache,
+        )
+
+    assert not os.listdir(tmp_path)
+
+
+def test_schema_cache_raises_error_for_lazy_type_with_invalid_schema(
+    tmp_path, snapshot
+):
+    class InvalidQueryType(ObjectType):
+        __lazy__ = True
+        __schema__ = 123
+
+    with pytest.raises(TypeError) as err:
+        make_executable_schema(InvalidQueryType, cache=FileSystemSchemaCache(tmp_path))
+
+    snapshot.assert_match(err)
+
+
+def test_schema_cache_hit_validates_python_attributes_of_types(tmp_path):
+    class LazyQueryType(ObjectType):
+        __lazy__ = True
+        __schema__ = YearQueryType.__schema__
+        __aliases__ = {"invalid": "year"}
+
+    # Both types have same schema, so they share cached document
+    assert get_schema_fingerprint(LazyQueryType) == get_schema_fingerprint(
+        YearQueryType
+    )
+
+    make_executable_schema(YearQueryType, cache=FileSystemSchemaCache(tmp_path))
+    with pytest.raises(ValueError):
+        make_executable_schema(LazyQueryType, cache=FileSystemSchemaCache(tmp_path))
@@ -0,0 +1,113 @@
+from ariadne_graphql_modules import (
+    FileSystemSchemaCache,
+    ObjectType,
+    SchemaBuildStats,
+    make_executable_schema,
+)
+
+
+class UserType(ObjectType):
+    __schema__ = """
+    type User {
+        id: ID!
+    }
+    """
+
+
+class QueryType(ObjectType):
+    __schema__ = """
+    type Query {
+        user: User
+    }
+    """
+    __requires__ = [UserType]
+
+
+class YearQueryType(ObjectType):
+    __schema__ = """
+    type Query {
+        year: Int!
+    }
+    """
+
+
+def test_stats_record_schema_build_phases():
+    stats = SchemaBuildStats()
+    make_executable_schema(QueryType, YearQueryType, "scalar Date", stats=stats)
+
+    assert [phase.name for phase in stats.phases] == [
+        "get_all_types",
+        "prepare_types",
+        "parse_extra_sdl",
+        "validate_no_missing_definitions",
+        "build_root_schema",
+        "build_ast_schema",
+        "bind_to_schema",
+        "assert_valid_schema",
+        "validate_default_enum_values",
+        "repair_default_enum_values",
+        "add_directives_to_schema",
+    ]
+    assert all(phase.time >= 0 for phase in stats.phases)
+    assert stats.total_time == sum(phase.time for phase in stats.phases)
+
+
+def test_stats_record_phases_counts():
+    stats = SchemaBuildStats()
+    make_executable_schema(QueryType, YearQueryType, "scalar Date", stats=stats)
+
+    assert stats.get_phase("get_all_types").count == 3
+    assert stats.get_phase("parse_extra_sdl").count == 1
+    assert stats.get_phase("build_root_schema").count == 1
+    assert stats.get_phase("build_ast_schema").count == 3
+    assert stats.get_phase("bind_to_schema").count == 3
+    assert stats.get_phase("assert_valid_schema").count is None
+    assert stats.get_phase("unknown") is None
+
+
+def test_stats_record_bind_time_for_each_type():
+    stats = SchemaBuildStats()
+    make_executable_schema(QueryType, stats=stats)
+    assert set(stats.bind_times) == {"QueryType", "UserType"}
+
+
+def test_stats_call_phase_callback():
+    phases = []
+    stats = SchemaBuildStats(on_phase=phases.append)
+    make_executable_schema(QueryType, stats=stats)
+    assert phases == stats.phases
+
+
+def test_stats_record_cache_phases(tmp_path):
+    cache = FileSystemSchemaCache(tmp_path)
+    make_executable_schema(QueryType, cache=cache)
+
+    stats = SchemaBuildStats()
+    make_executable_schema(QueryType, cache=cache, stats=stats)
+
+    assert [phase.name for phase in stats.phases] == [
+        "get_all_types",
+        "fingerprint_schema",
+        "prepare_types",
+        "cache_load",
+        "build_ast_schema",
+        "bind_to_schema",
+        "validate_default_enum_values",
+        "repair_default_enum_values",
+        "add_directives_to_schema",
+    ]
+    assert stats.get_phase("cache_load").count == 1
+
+
+def test_stats_can_be_converted_to_dict():
+    stats = SchemaBuildStats()
+    make_executable_schema(QueryType, stats=stats)
+
+    stats_dict = stats.as_dict()
+    assert stats_dict["total_time"] == stats.total_time
+    assert stats_dict["phases"][0] == {
+        "name": "get_all_types",
+        "time": stats.phases[0].time,
+        "count": 2,
+    }
+    assert set(stats_dict["bind_times"]) == {"QueryType", "UserType"}
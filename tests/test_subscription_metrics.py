@@ -0,0 +1,257 @@
+import asyncio
+
+import pytest
+from graphql import parse, subscribe
+
+from ariadne_graphql_modules import (
+    DropOldest,
+    ObjectType,
+    SubscriptionMetrics,
+    SubscriptionMetricsSink,
+    SubscriptionType,
+    make_executable_schema,
+)
+
+
+async def consume(schema):
+    results = await subscribe(schema, parse("subscription { event }"))
+    return [result async for result in results]
+
+
+@pytest.mark.asyncio
+async def test_subscription_metrics_record_subscription_lifecycle():
+    metrics = SubscriptionMetrics()
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    class EventsSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            event: String
+        }
+        """
+
+        @staticmethod
+        async def subscribe_event(*_):
+            for event in ("a", "b", "error"):
+                await asyncio.sleep(0)
+                yield event
+
+        @staticmethod
+        def resolve_event(event, *_):
+            if event == "error":
+                raise ValueError("Invalid event")
+            return event
+
+    schema = make_executable_schema(
+        QueryType, EventsSubscription, subscription_metrics=metrics
+    )
+
+    results = await consume(schema)
+    assert [result.data for result in results] == [
+        {"event": "a"},
+        {"event": "b"},
+        {"event": None},
+    ]
+
+    stats = metrics.get_stats("Subscription", "event")
+    assert stats.active == 0
+    assert stats.subscriptions == 1
+    assert stats.first_events == 1
+    assert stats.events == 3
+    assert stats.resolved == 3
+    assert stats.resolve_errors == 1
+    assert stats.average_resolve_time > 0
+    assert stats.average_time_to_first_event >= stats.average_subscribe_time
+    assert stats.events_per_second > 0
+
+
+@pytest.mark.asyncio
+async def test_subscription_metrics_count_active_subscriptions(next_result):
+    metrics = SubscriptionMetrics()
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    class EventsSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            event: String
+        }
+        """
+
+        @staticmethod
+        async def subscribe_event(*_):
+            for event in ("a", "b"):
+                await asyncio.sleep(0)
+                yield event
+
+        @staticmethod
+        def resolve_event(event, *_):
+            return event
+
+    schema = make_executable_schema(
+        QueryType, EventsSubscription, subscription_metrics=metrics
+    )
+
+    results = await subscribe(schema, parse("subscription { event }"))
+    await next_result(results)
+    assert metrics.get_stats("Subscription", "event").active == 1
+
+    await results.aclose()
+    assert metrics.get_stats("Subscription", "event").active == 0
+
+
+@pytest.mark.asyncio
+async def test_subscription_metrics_record_queue_depth_of_delivery_buffer(
+    channel, next_result
+):
+    metrics = SubscriptionMetrics()
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    class EventsSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            event: String
+        }
+        """
+        __delivery__ = {"event": DropOldest(10)}
+
+        @staticmethod
+        async def subscribe_event(*_):
+            async for event in channel.listen():
+                yield event
+
+        @staticmethod
+        def resolve_event(event, *_):
+            return event
+
+    schema = make_executable_schema(
+        QueryType, EventsSubscription, subscription_metrics=metrics
+    )
+
+    results = await subscribe(schema, parse("subscription { event }"))
+    first_result = asyncio.ensure_future(next_result(results))
+    await channel.wait_for_listeners()
+    channel.put("a", "b", "c")
+
+    assert (await first_result).data == {"event": "a"}
+    stats = metrics.get_stats("Subscription", "event")
+    assert stats.max_queue_depth == 3
+
+    await results.aclose()
+
+
+@pytest.mark.asyncio
+async def test_subscription_metrics_are_passed_to_custom_sink():
+    class RecordingSink(SubscriptionMetricsSink):
+        def __init__(self):
+            self.calls = []
+
+        def subscription_started(self, type_name, field_name, subscribe_time):
+            self.calls.append(("started", type_name, field_name))
+
+        def subscription_ended(self, type_name, field_name, duration, events):
+            self.calls.append(("ended", type_name, field_name, events))
+
+        def first_event(self, type_name, field_name, time_to_event):
+            self.calls.append(("first_event", type_name, field_name))
+
+        def event_emitted(self, type_name, field_name):
+            self.calls.append(("emitted", type_name, field_name))
+
+    sink = RecordingSink()
+
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    class EventsSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            event: String
+        }
+        """
+
+        @staticmethod
+        async def subscribe_event(*_):
+            for event in ("a",):
+                await asyncio.sleep(0)
+                yield event
+
+        @staticmethod
+        def resolve_event(event, *_):
+            return event
+
+    schema = make_executable_schema(
+        QueryType, EventsSubscription, subscription_metrics=sink
+    )
+
+    await consume(schema)
+    assert sink.calls == [
+        ("started", "Subscription", "event"),
+        ("first_event", "Subscription", "event"),
+        ("emitted", "Subscription", "event"),
+        ("ended", "Subscription", "event", 1),
+    ]
+
+
+def test_subscribers_are_not_wrapped_without_subscription_metrics():
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    class EventsSubscription(SubscriptionType):
+        __schema__ = """
+        type Subscription {
+            event: String
+        }
+        """
+
+        @staticmethod
+        async def subscribe_event(*_):
+            yield "event"
+
+        @staticmethod
+        def resolve_event(event, *_):
+            return event
+
+    schema = make_executable_schema(QueryType, EventsSubscription)
+
+    field = schema.type_map["Subscription"].fields["event"]
+    assert field.subscribe is EventsSubscription.subscribers["event"]
+    assert field.resolve is EventsSubscription.resolvers["event"]
+
+
+def test_subscription_metrics_can_be_reset():
+    metrics = SubscriptionMetrics()
+    metrics.subscription_started("Subscription", "event", 0.1)
+    metrics.event_emitted("Subscription", "event")
+
+    metrics.reset()
+    stats = metrics.get_stats("Subscription", "event")
+    assert stats.active == 1
+    assert stats.subscriptions == 0
+    assert stats.events == 0
+    assert metrics.as_dict()["subscriptions"][0]["active"] == 1
@@ -0,0 +1,128 @@
+import pytest
+from graphql import graphql_sync
+
+from ariadne_graphql_modules import (
+    ObjectType,
+    get_schema_fingerprint,
+    make_executable_schema,
+)
+
+
+class LazyObjectType(ObjectType):
+    __abstract__ = True
+    __lazy__ = True
+
+
+def test_schema_fingerprint_is_same_for_same_types():
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    assert get_schema_fingerprint(QueryType) == get_schema_fingerprint(QueryType)
+
+
+def test_schema_fingerprint_changes_when_schema_changes():
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    class OtherQueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String!
+        }
+        """
+
+    assert get_schema_fingerprint(QueryType) != get_schema_fingerprint(OtherQueryType)
+
+
+def test_schema_fingerprint_changes_when_extra_sdl_changes():
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    assert get_schema_fingerprint(QueryType) != get_schema_fingerprint(
+        QueryType, "scalar Date"
+    )
+
+
+def test_schema_with_trusted_fingerprint_is_not_validated(monkeypatch):
+    class QueryType(LazyObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    def fail_validation(*_):
+        raise AssertionError("schema validation was ran")
+
+    monkeypatch.setattr(
+        "ariadne_graphql_modules.executable_schema.assert_valid_schema",
+        fail_validation,
+    )
+
+    fingerprint = get_schema_fingerprint(QueryType)
+    schema = make_executable_schema(QueryType, trusted_fingerprint=fingerprint)
+
+    result = graphql_sync(schema, "{ hello }", root_value={"hello": "World"})
+    assert result.data == {"hello": "World"}
+
+
+def test_schema_with_untrusted_fingerprint_is_validated():
+    class QueryType(LazyObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+        __aliases__ = {"invalid": "target"}
+
+    with pytest.raises(ValueError):
+        make_executable_schema(QueryType, trusted_fingerprint="invalid")
+
+
+def test_python_attributes_of_schema_with_trusted_fingerprint_are_validated(
+    snapshot,
+):
+    class QueryType(LazyObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+        __fields_args__ = {"invalid": {"arg": "arg"}}
+
+    fingerprint = get_schema_fingerprint(QueryType)
+    with pytest.raises(ValueError) as err:
+        make_executable_schema(QueryType, trusted_fingerprint=fingerprint)
+
+    snapshot.assert_match(err)
+
+
+def test_schema_without_trusted_fingerprint_is_validated(monkeypatch):
+    class QueryType(ObjectType):
+        __schema__ = """
+        type Query {
+            hello: String
+        }
+        """
+
+    calls = []
+    monkeypatch.setattr(
+        "ariadne_graphql_modules.executable_schema.assert_valid_schema",
+        calls.append,
+    )
+
+    fingerprint = get_schema_fingerprint(QueryType)
+    make_executable_schema(QueryType, trusted_fingerprint=fingerprint[::-1])
+    assert len(calls) == 1